@@ -1,15 +1,34 @@
 """Shopify API."""
 
-from . import exceptions, fulfillment, images, locations, orders, products
+from . import (
+    bulk,
+    cache,
+    exceptions,
+    fulfillment,
+    images,
+    indexes,
+    inventory,
+    locations,
+    orders,
+    product_import,
+    products,
+    sync,
+)
 from .session import ShopifyAPISession, shopify_api_session
 
 __all__ = [
+    "bulk",
+    "cache",
     "exceptions",
     "fulfillment",
     "images",
+    "indexes",
+    "inventory",
     "ShopifyAPISession",
     "shopify_api_session",
     "locations",
     "orders",
+    "product_import",
     "products",
+    "sync",
 ]
@@ -0,0 +1,16 @@
+"""Asynchronous Shopify API client.
+
+Requires the optional httpx dependency, installed with ``shopify_api_py[aio]``.
+"""
+
+from . import fulfillment, locations, orders, products, request
+from .session import AsyncShopifyAPISession
+
+__all__ = [
+    "AsyncShopifyAPISession",
+    "fulfillment",
+    "locations",
+    "orders",
+    "products",
+    "request",
+]
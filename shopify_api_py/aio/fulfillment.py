@@ -0,0 +1,18 @@
+"""Asynchronous methods for interacting with Shopify fulfillments."""
+
+from typing import Any
+
+from shopify_api_py.aio import request
+
+
+async def create_fulfill_order(
+    order_id: str | int, location_id: str | int
+) -> dict[str, Any]:
+    """Create a fulfillment order (Mark an order as fullfilled)."""
+    response = await request.make_request(
+        "POST",
+        f"orders/{order_id}/fulfillments.json",
+        json={"fulfillment": {"location_id": str(location_id)}},
+    )
+    fulfillment: dict[str, Any] = response.json()["fulfillment"]
+    return fulfillment
@@ -0,0 +1,27 @@
+"""Asynchronous methods for interacting with Shopify locations."""
+
+from typing import Any, AsyncIterator
+
+from shopify_api_py.aio import request
+
+
+async def get_inventory_locations(limit: int | None = None) -> list[dict[str, Any]]:
+    """Return a list of all shopify locations.
+
+    Args:
+        limit (int | None, optional): The number of locations to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+    """
+    return await request.make_paginated_request(
+        "locations.json", "locations", limit=limit
+    )
+
+
+def iter_inventory_locations(limit: int | None = None) -> AsyncIterator[dict[str, Any]]:
+    """Yield every shopify location, fetching one page at a time.
+
+    Args:
+        limit (int | None, optional): The number of locations to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+    """
+    return request.iter_paginated_request("locations.json", "locations", limit=limit)
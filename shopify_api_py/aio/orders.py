@@ -0,0 +1,37 @@
+"""Asynchronous methods for interacting with Shopify orders."""
+
+from typing import Any, AsyncIterator
+
+from shopify_api_py.aio import request
+
+
+async def get_all_orders(
+    limit: int | None = None, fields: list[str] | None = None
+) -> list[dict[str, Any]]:
+    """Return a list of all shopify orders.
+
+    Args:
+        limit (int | None, optional): The number of orders to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the order fields to
+            return. All fields are returned if None. Defaults to None.
+    """
+    return await request.make_paginated_request(
+        "orders.json", "orders", limit=limit, fields=fields
+    )
+
+
+def iter_all_orders(
+    limit: int | None = None, fields: list[str] | None = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield every shopify order, fetching one page at a time.
+
+    Args:
+        limit (int | None, optional): The number of orders to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the order fields to
+            return. All fields are returned if None. Defaults to None.
+    """
+    return request.iter_paginated_request(
+        "orders.json", "orders", limit=limit, fields=fields
+    )
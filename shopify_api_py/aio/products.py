@@ -0,0 +1,396 @@
+"""Asynchronous methods for interacting with Shopify products."""
+
+import asyncio
+from typing import Any, AsyncIterator
+
+import shopify
+
+from shopify_api_py import exceptions
+from shopify_api_py import request as sync_request
+from shopify_api_py.aio import request
+
+
+async def get_all_products(
+    limit: int | None = None, fields: list[str] | None = None
+) -> list[dict[str, Any]]:
+    """Return a list of all shopify products.
+
+    Args:
+        limit (int | None, optional): The number of products to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the product fields to
+            return. All fields are returned if None. Defaults to None.
+    """
+    return await request.make_paginated_request(
+        "products.json", "products", limit=limit, fields=fields
+    )
+
+
+def iter_all_products(
+    limit: int | None = None, fields: list[str] | None = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield every shopify product, fetching one page at a time.
+
+    Args:
+        limit (int | None, optional): The number of products to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the product fields to
+            return. All fields are returned if None. Defaults to None.
+    """
+    return request.iter_paginated_request(
+        "products.json", "products", limit=limit, fields=fields
+    )
+
+
+async def get_product_by_id(
+    product_id: int, fields: list[str] | None = None
+) -> dict[str, Any]:
+    """Return the product with ID product_id.
+
+    Args:
+        product_id (int): ID of the product to return.
+        fields (list[str] | None, optional): The names of the product fields to
+            return. All fields are returned if None. Defaults to None.
+
+    Raises:
+        exceptions.ProductNotFoundError: If no product is found.
+    """
+    product = await request.get_resource(
+        f"products/{product_id}.json", "product", fields=fields
+    )
+    if product is None:
+        raise exceptions.ProductNotFoundError(product_id)
+    return product
+
+
+async def get_all_variants(
+    limit: int | None = None, fields: list[str] | None = None
+) -> list[dict[str, Any]]:
+    """Return a list of all shopify variants.
+
+    Args:
+        limit (int | None, optional): The number of variants to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the variant fields to
+            return. All fields are returned if None. Defaults to None.
+    """
+    return await request.make_paginated_request(
+        "variants.json", "variants", limit=limit, fields=fields
+    )
+
+
+def iter_all_variants(
+    limit: int | None = None, fields: list[str] | None = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield every shopify variant, fetching one page at a time.
+
+    Args:
+        limit (int | None, optional): The number of variants to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the variant fields to
+            return. All fields are returned if None. Defaults to None.
+    """
+    return request.iter_paginated_request(
+        "variants.json", "variants", limit=limit, fields=fields
+    )
+
+
+async def get_variant_by_id(variant_id: int) -> dict[str, Any]:
+    """Return the variant with ID variant_id.
+
+    Raises:
+        exceptions.VariantNotFoundError: If no variant is found.
+    """
+    variant = await request.get_resource(f"variants/{variant_id}.json", "variant")
+    if variant is None:
+        raise exceptions.VariantNotFoundError(variant_id)
+    return variant
+
+
+async def get_inventory_item_by_id(inventory_item_id: int) -> dict[str, Any]:
+    """Return the inventory item with ID inventory_item_id.
+
+    Raises:
+        exceptions.InventoryItemNotFoundError: If no inventory item is found.
+    """
+    inventory_item = await request.get_resource(
+        f"inventory_items/{inventory_item_id}.json", "inventory_item"
+    )
+    if inventory_item is None:
+        raise exceptions.InventoryItemNotFoundError(inventory_item_id)
+    return inventory_item
+
+
+async def set_stock_level(
+    location_id: int, inventory_item_id: int, new_stock_level: int
+) -> dict[str, Any]:
+    """Set the stock level for a variant and location.
+
+    Setting an absolute stock level is idempotent so transient errors are retried.
+    """
+    response = await request.make_request(
+        "POST",
+        "inventory_levels/set.json",
+        json={
+            "location_id": location_id,
+            "inventory_item_id": inventory_item_id,
+            "available": new_stock_level,
+        },
+        retry_policy=sync_request.default_retry_policy,
+    )
+    inventory_level: dict[str, Any] = response.json()["inventory_level"]
+    return inventory_level
+
+
+async def update_variant_stock(
+    variant: dict[str, Any], location_id: int, new_stock_level: int
+) -> dict[str, Any]:
+    """Update the stock level of a variant."""
+    response = await set_stock_level(
+        location_id=location_id,
+        inventory_item_id=variant["inventory_item_id"],
+        new_stock_level=new_stock_level,
+    )
+    variant["inventory_quantity"] = new_stock_level
+    return response
+
+
+async def set_customs_information(
+    inventory_item_id: int, country_of_origin_code: str, hs_code: str
+) -> None:
+    """Set the customs information for an inventory item.
+
+    Only the customs fields are sent, the inventory item is not read first.
+
+    Args:
+        inventory_item_id (int): The ID of the inventory item to update.
+        country_of_origin_code (str): The two letter country code of the country of
+            origin.
+        hs_code (str): The Harmonised system code.
+
+    Raises:
+        exceptions.InventoryItemNotFoundError: If the inventory item does not exist.
+        exceptions.ResponseError: If an error is returned to the request.
+    """
+    try:
+        await request.make_request(
+            "PUT",
+            f"inventory_items/{inventory_item_id}.json",
+            json={
+                "inventory_item": {
+                    "id": inventory_item_id,
+                    "country_code_of_origin": country_of_origin_code,
+                    "harmonized_system_code": hs_code,
+                }
+            },
+            retry_policy=sync_request.default_retry_policy,
+        )
+    except exceptions.ResponseStatusError as e:
+        if e.status_code == 404:
+            raise exceptions.InventoryItemNotFoundError(inventory_item_id) from None
+        raise exceptions.ResponseError("Error setting customs information") from e
+
+
+async def add_product_image(
+    product_id: int, image_url: str, variant_ids: list[int] | None = None
+) -> dict[str, Any]:
+    """Add a new image to a product.
+
+    The request is paced by request.call_limiter and retried if it is throttled.
+    Args:
+        product_id (int): The ID of the product the image will be added to.
+        image_url (str): The source URL of the image.
+        variant_ids (list[int] | None, optional): A list of Variant IDs the image will
+            be added to or None if the image applies to the product only. Defaults
+            to None.
+
+    Raises:
+        exceptions.ResponseError: If the request does not return sucessful.
+
+    Returns:
+        dict[str, Any]: The new product image.
+    """
+    image: dict[str, Any] = {"src": image_url}
+    if variant_ids is not None:
+        image["variant_ids"] = variant_ids
+    try:
+        response = await request.make_request(
+            "POST",
+            f"products/{product_id}/images.json",
+            json={"image": image},
+            retry_policy=sync_request.throttle_retry_policy,
+        )
+    except exceptions.ResponseStatusError as e:
+        raise exceptions.ResponseError("Error adding image.") from e
+    new_image: dict[str, Any] = response.json()["image"]
+    return new_image
+
+
+async def create_product(
+    title: str,
+    body_html: str,
+    vendor: str,
+    options: list[shopify.Option] | None = None,
+    variants: list[shopify.Variant] | None = None,
+    tags: list[str] | None = None,
+) -> dict[str, Any]:
+    """Create a new product on Shopify.
+
+    Options and variants are created with shopify_api_py.products.create_options
+    and shopify_api_py.products.create_variation.
+
+    The request is paced by request.call_limiter and retried if it is throttled.
+    Args:
+        title (str): The product's name.
+        body_html (str): The product's description as HTML.
+        vendor (str): The vendor (brand) of the product.
+        options (list[shopify.Option] | None, optional): The variation options of a
+            variation product. Defaults to None.
+        variants (list[shopify.Variant] | None, optional): The product's variations.
+            Use None for single products. Defaults to None.
+        tags (list[str] | None, optional): A list of product tags to use on the product.
+            Defaults to None.
+
+    Raises:
+        exceptions.ResponseError: If the product creation request does not return
+            successful.
+
+    Returns:
+        dict[str, Any]: The newly created product.
+    """
+    product: dict[str, Any] = {"title": title, "body_html": body_html, "vendor": vendor}
+    if variants is not None and options is not None:
+        product["variants"] = [variant.to_dict() for variant in variants]
+        product["options"] = [option.to_dict() for option in options]
+    if tags is not None:
+        product["tags"] = ",".join(tags)
+    try:
+        response = await request.make_request(
+            "POST",
+            "products.json",
+            json={"product": product},
+            retry_policy=sync_request.throttle_retry_policy,
+        )
+    except exceptions.ResponseStatusError as e:
+        raise exceptions.ResponseError("Error creating product.") from e
+    new_product: dict[str, Any] = response.json()["product"]
+    return new_product
+
+
+async def get_all_custom_collections(limit: int | None = None) -> list[dict[str, Any]]:
+    """Return a list of all shopify custom collections."""
+    return await request.make_paginated_request(
+        "custom_collections.json", "custom_collections", limit=limit
+    )
+
+
+async def get_custom_collection_by_id(collection_id: int) -> dict[str, Any]:
+    """Return the custom collection with ID collection_id.
+
+    Raises:
+        exceptions.CustomCollectionNotFoundError: If no custom collection is found.
+    """
+    collection = await request.get_resource(
+        f"custom_collections/{collection_id}.json", "custom_collection"
+    )
+    if collection is None:
+        raise exceptions.CustomCollectionNotFoundError(collection_id)
+    return collection
+
+
+async def get_all_smart_collections(limit: int | None = None) -> list[dict[str, Any]]:
+    """Return a list of all shopify smart collections."""
+    return await request.make_paginated_request(
+        "smart_collections.json", "smart_collections", limit=limit
+    )
+
+
+async def get_smart_collection_by_id(collection_id: int) -> dict[str, Any]:
+    """Return the smart collection with ID collection_id.
+
+    Raises:
+        exceptions.SmartCollectionNotFoundError: If no smart collection is found.
+    """
+    collection = await request.get_resource(
+        f"smart_collections/{collection_id}.json", "smart_collection"
+    )
+    if collection is None:
+        raise exceptions.SmartCollectionNotFoundError(collection_id)
+    return collection
+
+
+async def get_all_collects(limit: int | None = None) -> list[dict[str, Any]]:
+    """Return a list of all shopify collects."""
+    return await request.make_paginated_request(
+        "collects.json", "collects", limit=limit
+    )
+
+
+async def get_collect_by_id(collect_id: int) -> dict[str, Any]:
+    """Return the collect with ID collect_id.
+
+    Raises:
+        exceptions.CollectNotFoundError: If no collect is found.
+    """
+    collect = await request.get_resource(f"collects/{collect_id}.json", "collect")
+    if collect is None:
+        raise exceptions.CollectNotFoundError(collect_id)
+    return collect
+
+
+async def add_product_to_collection(product_id: int, collection_id: int) -> None:
+    """Add a product to a custom collection.
+
+    The request is paced by request.call_limiter and retried if it is throttled.
+    Raises:
+        exceptions.ResponseError: If the new Collect is not created.
+    """
+    try:
+        await request.make_request(
+            "POST",
+            "collects.json",
+            json={
+                "collect": {"product_id": product_id, "collection_id": collection_id}
+            },
+            retry_policy=sync_request.throttle_retry_policy,
+        )
+    except exceptions.ResponseStatusError as e:
+        raise exceptions.ResponseError("Error adding product to collection.") from e
+
+
+async def remove_product_from_collection(product_id: int, collection_id: int) -> None:
+    """Remove a product from a collection.
+
+    Raises:
+        exceptions.ResponseError: If no Collect matching the product and collection
+            indicated is found or a Collect cannot be deleted.
+    """
+    collects = await request.make_paginated_request(
+        "collects.json",
+        "collects",
+        fields=["id"],
+        product_id=product_id,
+        collection_id=collection_id,
+    )
+    if len(collects) == 0:
+        raise exceptions.ResponseError("No matching Collect found.")
+    try:
+        await asyncio.gather(
+            *(
+                request.make_request("DELETE", f"collects/{collect['id']}.json")
+                for collect in collects
+            )
+        )
+    except exceptions.ResponseStatusError as e:
+        raise exceptions.ResponseError("Error removing product from collection.") from e
+
+
+async def get_products_in_custom_collection(collection_id: int) -> list[int]:
+    """Return the IDs of all products in a custom collection."""
+    collects = await request.make_paginated_request(
+        "collects.json",
+        "collects",
+        fields=["product_id"],
+        collection_id=collection_id,
+    )
+    return [collect["product_id"] for collect in collects]
@@ -0,0 +1,224 @@
+"""Methods for making asynchronous Shopify API requests."""
+
+import asyncio
+from typing import Any, AsyncIterator, Iterable
+
+import httpx
+
+from shopify_api_py import exceptions, request
+from shopify_api_py.aio.session import get_client
+
+
+async def make_request(
+    method: str,
+    path: str,
+    params: dict[str, Any] | None = None,
+    json: dict[str, Any] | None = None,
+    retry_policy: request.RetryPolicy | None = None,
+) -> httpx.Response:
+    """Make a single shopify request.
+
+    Requests are paced by request.call_limiter and are not retried unless a
+    retry_policy is passed.
+
+    Args:
+        method (str): The HTTP method.
+        path (str): The path of the endpoint relative to the API root, or an
+            absolute URL.
+        params (dict[str, Any] | None, optional): Query parameters. Defaults to
+            None.
+        json (dict[str, Any] | None, optional): The JSON request body. Defaults to
+            None.
+        retry_policy (request.RetryPolicy | None, optional): The policy used to
+            retry transient errors. Defaults to None.
+
+    Raises:
+        exceptions.ResponseStatusError: If the response status is not successful.
+
+    Returns:
+        httpx.Response: The response.
+    """
+    client = get_client()
+    shop = str(client.base_url)
+    attempt = 0
+    while True:
+        delay = request.call_limiter.reserve(shop)
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            response = await client.request(method, path, params=params, json=json)
+        except httpx.TransportError:
+            if (
+                retry_policy is None
+                or not retry_policy.retry_connection_errors
+                or attempt >= retry_policy.max_retries
+            ):
+                raise
+            await asyncio.sleep(retry_policy.backoff(attempt))
+            attempt += 1
+            continue
+        call_limit = request.get_call_limit(response.headers)
+        if call_limit is not None:
+            request.call_limiter.update(shop, call_limit)
+        if response.status_code == 429:
+            request.call_limiter.throttled(shop)
+        if response.is_success:
+            return response
+        if (
+            retry_policy is not None
+            and attempt < retry_policy.max_retries
+            and response.status_code in retry_policy.retry_status_codes
+        ):
+            retry_after = response.headers.get("Retry-After")
+            await asyncio.sleep(retry_policy.backoff(attempt, retry_after=retry_after))
+            attempt += 1
+            continue
+        raise exceptions.ResponseStatusError(
+            status_code=response.status_code, url=str(response.url)
+        )
+
+
+async def iter_paginated_request(
+    path: str,
+    resource_key: str,
+    limit: int | None = None,
+    max_pages: int | None = None,
+    fields: Iterable[str] | None = None,
+    retry_policy: request.RetryPolicy | None = None,
+    **params: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield each item of a multi page shopify request as it is fetched.
+
+    Args:
+        path (str): The path of the endpoint relative to the API root.
+        resource_key (str): The key of the list of resources in the response.
+        limit (int | None, optional): The number of items per page, up to 250.
+            Shopify's default is used if None. Defaults to None.
+        max_pages (int | None, optional): The maximum number of pages to request
+            after the first. If None the budget is sized from limit. Defaults to
+            None.
+        fields (Iterable[str] | None, optional): The names of the resource fields
+            to return. All fields are returned if None. Defaults to None.
+        retry_policy (request.RetryPolicy | None, optional): The policy used to
+            retry a page after a transient error. If None
+            request.default_retry_policy is used. Defaults to None.
+        **params: Query parameters for the first request.
+
+    Raises:
+        exceptions.TooManyPageRequestsError: If more than max_pages pages are
+            requested.
+    """
+    if max_pages is None:
+        max_pages = request.page_budget(limit)
+    if retry_policy is None:
+        retry_policy = request.default_retry_policy
+    if limit is not None:
+        params["limit"] = limit
+    params.update(request.fields_query(fields))
+    response = await make_request("GET", path, params=params, retry_policy=retry_policy)
+    for item in response.json()[resource_key]:
+        yield item
+    for _ in range(max_pages):
+        next_page_url = response.links.get("next", {}).get("url")
+        if not next_page_url:
+            break
+        response = await make_request("GET", next_page_url, retry_policy=retry_policy)
+        for item in response.json()[resource_key]:
+            yield item
+    else:
+        raise exceptions.TooManyPageRequestsError()
+
+
+async def make_paginated_request(
+    path: str,
+    resource_key: str,
+    limit: int | None = None,
+    max_pages: int | None = None,
+    fields: Iterable[str] | None = None,
+    retry_policy: request.RetryPolicy | None = None,
+    **params: Any,
+) -> list[dict[str, Any]]:
+    """Make a multi page shopify request."""
+    return [
+        item
+        async for item in iter_paginated_request(
+            path,
+            resource_key,
+            limit=limit,
+            max_pages=max_pages,
+            fields=fields,
+            retry_policy=retry_policy,
+            **params,
+        )
+    ]
+
+
+_in_flight: dict[tuple[Any, ...], "asyncio.Task[httpx.Response]"] = {}
+
+
+async def make_coalesced_request(
+    path: str,
+    params: dict[str, Any] | None = None,
+    retry_policy: request.RetryPolicy | None = None,
+) -> httpx.Response:
+    """Make a GET request, sharing identical requests in flight.
+
+    Tasks that request the same path and parameters while this request runs
+    receive its response rather than making their own. Cancelling one of the
+    waiting tasks does not cancel the shared request.
+
+    Args:
+        path (str): The path of the endpoint relative to the API root.
+        params (dict[str, Any] | None, optional): Query parameters. Defaults to
+            None.
+        retry_policy (request.RetryPolicy | None, optional): The policy used to
+            retry transient errors. Defaults to None.
+    """
+    key = (
+        asyncio.get_running_loop(),
+        str(get_client().base_url),
+        path,
+        repr(sorted((params or {}).items())),
+    )
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            make_request("GET", path, params=params, retry_policy=retry_policy)
+        )
+        _in_flight[key] = task
+
+        def remove(done: "asyncio.Task[httpx.Response]") -> None:
+            if _in_flight.get(key) is done:
+                del _in_flight[key]
+
+        task.add_done_callback(remove)
+    return await asyncio.shield(task)
+
+
+async def get_resource(
+    path: str,
+    resource_key: str,
+    fields: Iterable[str] | None = None,
+) -> dict[str, Any] | None:
+    """Return a single resource or None if it does not exist.
+
+    Concurrent requests for the same resource share one request.
+
+    Args:
+        path (str): The path of the resource relative to the API root.
+        resource_key (str): The key of the resource in the response.
+        fields (Iterable[str] | None, optional): The names of the resource fields
+            to return. All fields are returned if None. Defaults to None.
+    """
+    try:
+        response = await make_coalesced_request(
+            path,
+            params=request.fields_query(fields),
+            retry_policy=request.default_retry_policy,
+        )
+    except exceptions.ResponseStatusError as e:
+        if e.status_code == 404:
+            return None
+        raise
+    resource: dict[str, Any] = response.json()[resource_key]
+    return resource
@@ -0,0 +1,90 @@
+"""Async session manager for the shopify API."""
+
+import contextvars
+from types import TracebackType
+
+from shopify_api_py import exceptions
+from shopify_api_py.session import ShopifyAPISession
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "shopify_api_py.aio requires httpx, install shopify_api_py[aio]."
+    ) from e
+
+_active_client: contextvars.ContextVar[httpx.AsyncClient] = contextvars.ContextVar(
+    "shopify_api_py_async_client"
+)
+
+
+class AsyncShopifyAPISession:
+    """Async session manager for the shopify API.
+
+    Opens a pooled httpx.AsyncClient which is used by the functions in
+    shopify_api_py.aio for the duration of the session. Login credentials are
+    taken from ShopifyAPISession.
+    """
+
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        timeout: float | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Async session manager for the shopify API.
+
+        Args:
+            max_connections (int | None, optional): The maximum number of concurrent
+                connections. Uses MAX_CONNECTIONS if None. Defaults to None.
+            timeout (float | None, optional): The request timeout in seconds. Uses
+                TIMEOUT if None. Defaults to None.
+            transport (httpx.AsyncBaseTransport | None, optional): A custom
+                transport for the client. Defaults to None.
+        """
+        self.max_connections = max_connections or self.MAX_CONNECTIONS
+        self.timeout = timeout or self.TIMEOUT
+        self.transport = transport
+
+    async def __aenter__(self) -> httpx.AsyncClient:
+        session = ShopifyAPISession.create_session()
+        self._client = httpx.AsyncClient(
+            base_url=session.site,
+            headers={
+                "X-Shopify-Access-Token": session.token or "",
+                "Accept": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=self.timeout,
+            transport=self.transport,
+        )
+        self._context_token = _active_client.set(self._client)
+        return self._client
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        _active_client.reset(self._context_token)
+        await self._client.aclose()
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the HTTP client of the active async session.
+
+    Raises:
+        exceptions.SessionNotActiveError: If no async session is active.
+    """
+    try:
+        return _active_client.get()
+    except LookupError:
+        raise exceptions.SessionNotActiveError() from None
@@ -0,0 +1,350 @@
+"""Export resources using GraphQL bulk operations.
+
+A bulk operation runs a query on Shopify's servers and writes the results to a
+JSON lines file, avoiding a paginated request for every page of resources.
+Results use the GraphQL Admin API's field names and global IDs rather than those
+of the REST API.
+"""
+
+import json
+import time
+import urllib.request
+from typing import Any, Iterable, Iterator, Mapping
+
+from shopify_api_py import exceptions, graphql, request
+
+POLL_INTERVAL = 5.0
+RESULT_TIMEOUT = 60.0
+
+COMPLETED = "COMPLETED"
+RUNNING_STATUSES = ("CREATED", "RUNNING")
+
+CHILD_KEYS = {
+    "ProductVariant": "variants",
+    "ProductImage": "images",
+    "MediaImage": "media",
+    "Collection": "collections",
+    "Product": "products",
+    "LineItem": "lineItems",
+    "InventoryLevel": "inventoryLevels",
+    "Metafield": "metafields",
+}
+
+RUN_QUERY_MUTATION = """
+mutation bulkOperationRunQuery($query: String!) {
+  bulkOperationRunQuery(query: $query) {
+    bulkOperation { id status }
+    userErrors { field message }
+  }
+}
+"""
+
+CANCEL_MUTATION = """
+mutation bulkOperationCancel($id: ID!) {
+  bulkOperationCancel(id: $id) {
+    bulkOperation { id status }
+    userErrors { field message }
+  }
+}
+"""
+
+BULK_OPERATION_QUERY = """
+query bulkOperation($id: ID!) {
+  node(id: $id) {
+    ... on BulkOperation { id status errorCode objectCount url partialDataUrl }
+  }
+}
+"""
+
+PRODUCTS_QUERY = """
+{
+  products {
+    edges {
+      node {
+        id
+        title
+        handle
+        vendor
+        productType
+        status
+        tags
+        createdAt
+        updatedAt
+        variants {
+          edges {
+            node {
+              id
+              title
+              sku
+              barcode
+              price
+              inventoryQuantity
+              selectedOptions { name value }
+              inventoryItem { id tracked }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+ORDERS_QUERY = """
+{
+  orders {
+    edges {
+      node {
+        id
+        name
+        createdAt
+        updatedAt
+        displayFinancialStatus
+        displayFulfillmentStatus
+        lineItems {
+          edges {
+            node {
+              id
+              sku
+              quantity
+              variant { id }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+COLLECTIONS_QUERY = """
+{
+  collections {
+    edges {
+      node {
+        id
+        title
+        handle
+        products {
+          edges {
+            node { id }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def run_bulk_query(query: str) -> str:
+    """Start a bulk operation running query and return the operation's ID.
+
+    Args:
+        query (str): The GraphQL query to run. Connections in the query are not
+            paginated.
+
+    Raises:
+        exceptions.BulkOperationError: If Shopify refuses to start the operation.
+    """
+    data = graphql.execute(
+        RUN_QUERY_MUTATION,
+        variables={"query": query},
+        retry_policy=request.default_retry_policy,
+    )
+    result = data["bulkOperationRunQuery"]
+    if result["userErrors"]:
+        messages = "; ".join(error["message"] for error in result["userErrors"])
+        raise exceptions.BulkOperationError("FAILED", message=messages)
+    operation_id: str = result["bulkOperation"]["id"]
+    return operation_id
+
+
+def get_bulk_operation(operation_id: str) -> dict[str, Any]:
+    """Return the current state of the bulk operation with ID operation_id."""
+    data = graphql.execute(
+        BULK_OPERATION_QUERY,
+        variables={"id": operation_id},
+        retry_policy=request.default_retry_policy,
+    )
+    operation: dict[str, Any] = data["node"]
+    return operation
+
+
+def cancel_bulk_operation(operation_id: str) -> None:
+    """Ask Shopify to cancel the bulk operation with ID operation_id.
+
+    Cancellation is asynchronous, so the operation may still be running briefly
+    after this returns.
+
+    Raises:
+        exceptions.BulkOperationError: If Shopify refuses to cancel the operation.
+    """
+    data = graphql.execute(
+        CANCEL_MUTATION,
+        variables={"id": operation_id},
+        retry_policy=request.default_retry_policy,
+    )
+    result = data["bulkOperationCancel"]
+    if result["userErrors"]:
+        messages = "; ".join(error["message"] for error in result["userErrors"])
+        raise exceptions.BulkOperationError("FAILED", message=messages)
+
+
+def wait_for_bulk_operation(
+    operation_id: str,
+    poll_interval: float = POLL_INTERVAL,
+    timeout: float | None = None,
+    cancel_on_timeout: bool = True,
+) -> dict[str, Any]:
+    """Poll a bulk operation until it has finished and return its final state.
+
+    Shopify runs only one bulk query at a time per shop, so an operation left
+    running after a timeout prevents new bulk queries from starting until it
+    finishes.
+
+    Args:
+        operation_id (str): The ID of the bulk operation.
+        poll_interval (float, optional): The number of seconds between polls.
+            Defaults to POLL_INTERVAL.
+        timeout (float | None, optional): The maximum number of seconds to wait.
+            Waits indefinitely if None. Defaults to None.
+        cancel_on_timeout (bool, optional): If True the operation is cancelled
+            when timeout is exceeded. Defaults to True.
+
+    Raises:
+        exceptions.BulkOperationError: If the operation fails, is cancelled or
+            expires, or if timeout is exceeded.
+    """
+    started = time.monotonic()
+    while True:
+        operation = get_bulk_operation(operation_id)
+        status = operation["status"]
+        if status == COMPLETED:
+            return operation
+        if status not in RUNNING_STATUSES:
+            raise exceptions.BulkOperationError(status, operation.get("errorCode"))
+        if timeout is not None and time.monotonic() - started >= timeout:
+            if cancel_on_timeout:
+                cancel_bulk_operation(operation_id)
+            raise exceptions.BulkOperationError(
+                status, message=f"Bulk operation did not finish within {timeout}s"
+            )
+        time.sleep(poll_interval)
+
+
+def _child_key(child: Mapping[str, Any], child_keys: Mapping[str, str]) -> str:
+    type_name = child.get("__typename")
+    if type_name is None:
+        # Global IDs take the form gid://shopify/<type>/<id>.
+        type_name = str(child.get("id", "")).split("/")[-2]
+    return child_keys.get(type_name, type_name)
+
+
+def iter_bulk_records(
+    lines: Iterable[bytes | str], child_keys: Mapping[str, str] = CHILD_KEYS
+) -> Iterator[dict[str, Any]]:
+    """Yield each top level object of a bulk operation result with its children.
+
+    Connections are written to the result file as separate lines which reference
+    their parent with a __parentId field. Each child is added to a list on its
+    parent, named from the child's type using child_keys. Shopify writes the
+    children of an object after it and before the next top level object, so only
+    one top level object is held in memory at a time.
+
+    Args:
+        lines (Iterable[bytes | str]): The lines of the JSON lines result file.
+        child_keys (Mapping[str, str], optional): The names of the lists children
+            are added to, by GraphQL type. Types not included use the type name.
+            Defaults to CHILD_KEYS.
+    """
+    root: dict[str, Any] | None = None
+    objects: dict[str, dict[str, Any]] = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        parent_id = record.pop("__parentId", None)
+        if parent_id is None:
+            if root is not None:
+                yield root
+            root = record
+            objects = {}
+        else:
+            parent = objects[parent_id]
+            parent.setdefault(_child_key(record, child_keys), []).append(record)
+        if "id" in record:
+            objects[record["id"]] = record
+    if root is not None:
+        yield root
+
+
+def iter_bulk_results(
+    url: str,
+    child_keys: Mapping[str, str] = CHILD_KEYS,
+    timeout: float = RESULT_TIMEOUT,
+) -> Iterator[dict[str, Any]]:
+    """Stream the result file of a bulk operation and yield each top level object.
+
+    Args:
+        url (str): The URL of the operation's result file.
+        child_keys (Mapping[str, str], optional): The names of the lists children
+            are added to, by GraphQL type. Defaults to CHILD_KEYS.
+        timeout (float, optional): The socket timeout in seconds for connecting to
+            and reading from the result file. Defaults to RESULT_TIMEOUT.
+    """
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        yield from iter_bulk_records(response, child_keys=child_keys)
+
+
+def iter_bulk_query(
+    query: str,
+    poll_interval: float = POLL_INTERVAL,
+    timeout: float | None = None,
+    child_keys: Mapping[str, str] = CHILD_KEYS,
+) -> Iterator[dict[str, Any]]:
+    """Run query as a bulk operation and yield each top level object of the result.
+
+    Args:
+        query (str): The GraphQL query to run.
+        poll_interval (float, optional): The number of seconds between polls of the
+            operation's status. Defaults to POLL_INTERVAL.
+        timeout (float | None, optional): The maximum number of seconds to wait for
+            the operation to finish. The operation is cancelled if it is exceeded.
+            Waits indefinitely if None. Defaults to None.
+        child_keys (Mapping[str, str], optional): The names of the lists children
+            are added to, by GraphQL type. Defaults to CHILD_KEYS.
+
+    Raises:
+        exceptions.BulkOperationError: If the operation does not complete.
+    """
+    operation_id = run_bulk_query(query)
+    operation = wait_for_bulk_operation(
+        operation_id, poll_interval=poll_interval, timeout=timeout
+    )
+    if operation.get("url") is None:
+        return
+    yield from iter_bulk_results(operation["url"], child_keys=child_keys)
+
+
+def iter_bulk_products(
+    poll_interval: float = POLL_INTERVAL, timeout: float | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield every product with its variants and their inventory items."""
+    return iter_bulk_query(PRODUCTS_QUERY, poll_interval=poll_interval, timeout=timeout)
+
+
+def iter_bulk_orders(
+    poll_interval: float = POLL_INTERVAL, timeout: float | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield every order with its line items."""
+    return iter_bulk_query(ORDERS_QUERY, poll_interval=poll_interval, timeout=timeout)
+
+
+def iter_bulk_collections(
+    poll_interval: float = POLL_INTERVAL, timeout: float | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield every collection with the IDs of the products in it."""
+    return iter_bulk_query(
+        COLLECTIONS_QUERY, poll_interval=poll_interval, timeout=timeout
+    )
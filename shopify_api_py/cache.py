@@ -0,0 +1,634 @@
+"""Caches of Shopify resources.
+
+ResourceCache is a persistent SQLite cache of products and collections.
+LookupCache is an in memory cache of resources requested by ID, enabled with
+enable_lookup_cache.
+
+Functions in this package that change a cached resource report it with
+invalidate. Every registered invalidation hook, such as that of an open
+ResourceCache or the lookup cache, is then called so that the changed resource
+is fetched again before it is next read.
+"""
+
+import contextlib
+import copy
+import json
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Iterator, Mapping, TypeVar
+
+import shopify
+from pyactiveresource.connection import ResourceNotFound
+
+from shopify_api_py import request
+
+PRODUCTS = "products"
+VARIANTS = "variants"
+CUSTOM_COLLECTIONS = "custom_collections"
+SMART_COLLECTIONS = "smart_collections"
+COLLECTS = "collects"
+INVENTORY_ITEMS = "inventory_items"
+
+RESOURCE_CLASSES: dict[str, type[shopify.ShopifyResource]] = {
+    PRODUCTS: shopify.Product,
+    CUSTOM_COLLECTIONS: shopify.CustomCollection,
+    SMART_COLLECTIONS: shopify.SmartCollection,
+}
+
+DEFAULT_TTLS: dict[str, float] = {
+    PRODUCTS: 60 * 60,
+    CUSTOM_COLLECTIONS: 60 * 60,
+    SMART_COLLECTIONS: 60 * 60,
+}
+
+DEFAULT_LOOKUP_SIZE = 1024
+DEFAULT_LOOKUP_TTLS: dict[str, float] = {
+    PRODUCTS: 60,
+    VARIANTS: 60,
+    INVENTORY_ITEMS: 60,
+    CUSTOM_COLLECTIONS: 300,
+    SMART_COLLECTIONS: 300,
+    COLLECTS: 300,
+}
+
+T = TypeVar("T")
+
+InvalidationHook = Callable[[str, int | None], None]
+
+_hooks: list[Callable[[], InvalidationHook | None]] = []
+_hooks_lock = threading.Lock()
+
+
+def register_invalidation_hook(hook: InvalidationHook) -> None:
+    """Call hook with the type and ID of each resource changed by this package.
+
+    Bound methods are held by weak reference so that registering one does not
+    keep its object alive.
+
+    Args:
+        hook (Callable[[str, int | None], None]): Called with the resource type and
+            the ID of the changed resource, or None if any resource of the type may
+            have changed.
+    """
+    reference: Callable[[], InvalidationHook | None]
+    if hasattr(hook, "__self__"):
+        reference = weakref.WeakMethod(hook)  # type: ignore[arg-type]
+    else:
+        reference = lambda: hook  # noqa: E731
+    with _hooks_lock:
+        _hooks.append(reference)
+
+
+def unregister_invalidation_hook(hook: InvalidationHook) -> None:
+    """Stop calling a hook registered with register_invalidation_hook."""
+    with _hooks_lock:
+        _hooks[:] = [ref for ref in _hooks if ref() not in (None, hook)]
+
+
+def invalidate(resource_type: str, resource_id: int | None = None) -> None:
+    """Report that a resource has been changed.
+
+    Args:
+        resource_type (str): The type of the changed resource, e.g. PRODUCTS.
+        resource_id (int | None, optional): The ID of the changed resource, or None
+            if any resource of the type may have changed. Defaults to None.
+    """
+    with _hooks_lock:
+        hooks = [ref() for ref in _hooks]
+        _hooks[:] = [
+            ref for ref, hook in zip(_hooks, hooks, strict=True) if hook is not None
+        ]
+    for hook in hooks:
+        if hook is not None:
+            hook(resource_type, resource_id)
+
+
+class ResourceCache:
+    """A persistent cache of products and collections in a SQLite database.
+
+    Each resource type is fetched in full when first read and again when its time
+    to live has expired. Until then reads, including from a new process, use the
+    database rather than the network. Resources reported as changed through
+    invalidate are fetched individually before the next read of their type.
+
+    The database uses write ahead logging so that several processes can read it
+    while one writes.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(
+        self,
+        path: Path | str,
+        ttls: Mapping[str, float] | None = None,
+        register: bool = True,
+    ) -> None:
+        """Create a cache in a SQLite database.
+
+        Args:
+            path (Path | str): The path to the database file. It is created if it
+                does not exist.
+            ttls (Mapping[str, float] | None, optional): The number of seconds each
+                resource type is cached for, overriding DEFAULT_TTLS. Defaults to
+                None.
+            register (bool, optional): If True the cache registers an invalidation
+                hook so that changes made through this package are reflected.
+                Defaults to True.
+        """
+        self.path = Path(path)
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        with self._transaction() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                # The database only holds cached data, so an older layout is
+                # discarded rather than migrated.
+                for table in ("resources", "variants", "loads", "stale"):
+                    connection.execute(f"DROP TABLE IF EXISTS {table}")
+                connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS resources (
+                    type TEXT NOT NULL, id INTEGER NOT NULL, handle TEXT,
+                    data TEXT NOT NULL, PRIMARY KEY (type, id));
+                CREATE INDEX IF NOT EXISTS resources_handle
+                    ON resources (type, handle);
+                CREATE TABLE IF NOT EXISTS variants (
+                    id INTEGER PRIMARY KEY, product_id INTEGER NOT NULL,
+                    inventory_item_id INTEGER, sku TEXT, data TEXT NOT NULL);
+                CREATE INDEX IF NOT EXISTS variants_sku ON variants (sku);
+                CREATE INDEX IF NOT EXISTS variants_product_id
+                    ON variants (product_id);
+                CREATE INDEX IF NOT EXISTS variants_inventory_item_id
+                    ON variants (inventory_item_id);
+                CREATE TABLE IF NOT EXISTS loads (
+                    type TEXT PRIMARY KEY, loaded_at REAL NOT NULL);
+                CREATE TABLE IF NOT EXISTS stale (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT, type TEXT NOT NULL,
+                    id INTEGER, UNIQUE (type, id));
+                """)
+        if register:
+            register_invalidation_hook(self.invalidate)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connect()
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _query(self, sql: str, parameters: Iterable[Any]) -> list[Any]:
+        connection = self._connect()
+        try:
+            return connection.execute(sql, tuple(parameters)).fetchall()
+        finally:
+            connection.close()
+
+    def _is_fresh(self, resource_type: str) -> bool:
+        rows = self._query(
+            "SELECT loaded_at FROM loads WHERE type = ?", [resource_type]
+        )
+        return bool(rows) and time.time() - rows[0][0] < self.ttls[resource_type]
+
+    def _write_resource(
+        self, connection: sqlite3.Connection, resource_type: str, item: dict[str, Any]
+    ) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO resources (type, id, handle, data) "
+            "VALUES (?, ?, ?, ?)",
+            (resource_type, item["id"], item.get("handle"), json.dumps(item)),
+        )
+        if resource_type == PRODUCTS:
+            connection.execute(
+                "DELETE FROM variants WHERE product_id = ?", (item["id"],)
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO variants "
+                "(id, product_id, inventory_item_id, sku, data) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        variant["id"],
+                        item["id"],
+                        variant.get("inventory_item_id"),
+                        variant.get("sku"),
+                        json.dumps(variant),
+                    )
+                    for variant in item.get("variants") or []
+                ],
+            )
+
+    def _delete_resource(
+        self, connection: sqlite3.Connection, resource_type: str, resource_id: int
+    ) -> None:
+        connection.execute(
+            "DELETE FROM resources WHERE type = ? AND id = ?",
+            (resource_type, resource_id),
+        )
+        if resource_type == PRODUCTS:
+            connection.execute(
+                "DELETE FROM variants WHERE product_id = ?", (resource_id,)
+            )
+
+    def load(self, resource_type: str) -> None:
+        """Fetch every resource of a type and replace those held in the cache.
+
+        Invalidations recorded while the resources are being fetched are kept, as
+        the fetched data may predate them.
+        """
+        marker = self._query("SELECT COALESCE(MAX(seq), 0) FROM stale", [])[0][0]
+        items: list[dict[str, Any]] = request.make_paginated_request(
+            request.RawFinder(RESOURCE_CLASSES[resource_type]),
+            limit=request.MAX_PAGE_LIMIT,
+        )  # type: ignore[assignment]
+        with self._lock, self._transaction() as connection:
+            connection.execute("DELETE FROM resources WHERE type = ?", (resource_type,))
+            if resource_type == PRODUCTS:
+                connection.execute("DELETE FROM variants")
+            for item in items:
+                self._write_resource(connection, resource_type, item)
+            connection.execute(
+                "DELETE FROM stale WHERE type = ? AND seq <= ?", (resource_type, marker)
+            )
+            reload_pending = connection.execute(
+                "SELECT 1 FROM stale WHERE type = ? AND id IS NULL", (resource_type,)
+            ).fetchone()
+            if reload_pending is None:
+                connection.execute(
+                    "INSERT OR REPLACE INTO loads (type, loaded_at) VALUES (?, ?)",
+                    (resource_type, time.time()),
+                )
+
+    def _refresh_stale(self, resource_type: str) -> None:
+        stale = self._query(
+            "SELECT id, seq FROM stale WHERE type = ? AND id IS NOT NULL",
+            [resource_type],
+        )
+        if not stale:
+            return
+        find = request.RawFinder(RESOURCE_CLASSES[resource_type])
+        for resource_id, seq in stale:
+            try:
+                item: dict[str, Any] | None = find(id_=resource_id)  # type: ignore[assignment]
+            except ResourceNotFound:
+                item = None
+            with self._lock, self._transaction() as connection:
+                if item is None:
+                    self._delete_resource(connection, resource_type, resource_id)
+                else:
+                    self._write_resource(connection, resource_type, item)
+                connection.execute(
+                    "DELETE FROM stale WHERE type = ? AND id = ? AND seq <= ?",
+                    (resource_type, resource_id, seq),
+                )
+
+    def _ensure_loaded(self, resource_type: str) -> None:
+        if self._is_fresh(resource_type):
+            self._refresh_stale(resource_type)
+        else:
+            self.load(resource_type)
+
+    def invalidate(self, resource_type: str, resource_id: int | None = None) -> None:
+        """Mark a resource as changed so it is fetched before it is next read.
+
+        Args:
+            resource_type (str): The type of the changed resource. A change to an
+                inventory item marks the product of its variant as changed. Other
+                types not held in the cache are ignored.
+            resource_id (int | None, optional): The ID of the changed resource, or
+                None to fetch every resource of the type again. Defaults to None.
+        """
+        if resource_type == INVENTORY_ITEMS:
+            if resource_id is None:
+                resource_type = PRODUCTS
+            else:
+                rows = self._query(
+                    "SELECT product_id FROM variants WHERE inventory_item_id = ?",
+                    [resource_id],
+                )
+                if not rows:
+                    return
+                resource_type, resource_id = PRODUCTS, rows[0][0]
+        if resource_type not in RESOURCE_CLASSES:
+            return
+        with self._lock, self._transaction() as connection:
+            if resource_id is None:
+                connection.execute("DELETE FROM loads WHERE type = ?", (resource_type,))
+            # Replacing the row gives it a new sequence number, so a fetch that
+            # started before this invalidation does not clear it.
+            connection.execute(
+                "INSERT OR REPLACE INTO stale (type, id) VALUES (?, ?)",
+                (resource_type, resource_id),
+            )
+
+    def clear(self) -> None:
+        """Remove every resource from the cache."""
+        with self._lock, self._transaction() as connection:
+            for table in ("resources", "variants", "loads", "stale"):
+                connection.execute(f"DELETE FROM {table}")
+
+    def close(self) -> None:
+        """Stop receiving invalidations from this package."""
+        unregister_invalidation_hook(self.invalidate)
+
+    def iter_all(self, resource_type: str) -> Iterator[dict[str, Any]]:
+        """Yield every cached resource of a type, fetching them if needed."""
+        self._ensure_loaded(resource_type)
+        for (data,) in self._query(
+            "SELECT data FROM resources WHERE type = ? ORDER BY id", [resource_type]
+        ):
+            yield json.loads(data)
+
+    def get(self, resource_type: str, resource_id: int) -> dict[str, Any] | None:
+        """Return the resource of a type with ID resource_id or None."""
+        self._ensure_loaded(resource_type)
+        rows = self._query(
+            "SELECT data FROM resources WHERE type = ? AND id = ?",
+            [resource_type, resource_id],
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def get_by_handle(self, resource_type: str, handle: str) -> dict[str, Any] | None:
+        """Return the resource of a type with handle handle or None."""
+        self._ensure_loaded(resource_type)
+        rows = self._query(
+            "SELECT data FROM resources WHERE type = ? AND handle = ?",
+            [resource_type, handle],
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def get_all_products(self) -> list[dict[str, Any]]:
+        """Return every product."""
+        return list(self.iter_all(PRODUCTS))
+
+    def get_all_custom_collections(self) -> list[dict[str, Any]]:
+        """Return every custom collection."""
+        return list(self.iter_all(CUSTOM_COLLECTIONS))
+
+    def get_all_smart_collections(self) -> list[dict[str, Any]]:
+        """Return every smart collection."""
+        return list(self.iter_all(SMART_COLLECTIONS))
+
+    def get_product(self, product_id: int) -> dict[str, Any] | None:
+        """Return the product with ID product_id or None."""
+        return self.get(PRODUCTS, product_id)
+
+    def get_product_by_handle(self, handle: str) -> dict[str, Any] | None:
+        """Return the product with handle handle or None."""
+        return self.get_by_handle(PRODUCTS, handle)
+
+    def get_variants_by_sku(self, sku: str) -> list[dict[str, Any]]:
+        """Return every variant with SKU sku."""
+        self._ensure_loaded(PRODUCTS)
+        rows = self._query("SELECT data FROM variants WHERE sku = ? ORDER BY id", [sku])
+        return [json.loads(data) for (data,) in rows]
+
+
+class LookupStats:
+    """Counts of lookup cache activity.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that were requested, including expired entries.
+        evictions (int): Entries removed to keep the cache within its size.
+        invalidations (int): Entries removed because the resource changed.
+    """
+
+    def __init__(self) -> None:
+        """Create zeroed lookup cache statistics."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the proportion of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, invalidations={self.invalidations})"
+        )
+
+
+def _get_value(item: Any, name: str) -> Any:
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def _resource_tags(resource_type: str, item: Any) -> set[tuple[str, Any]]:
+    # The resources whose changes make a cached item out of date.
+    tags = {(resource_type, _get_value(item, "id"))}
+    if resource_type == PRODUCTS:
+        for variant in _get_value(item, "variants") or []:
+            tags.add((VARIANTS, _get_value(variant, "id")))
+            tags.add((INVENTORY_ITEMS, _get_value(variant, "inventory_item_id")))
+    elif resource_type == VARIANTS:
+        tags.add((INVENTORY_ITEMS, _get_value(item, "inventory_item_id")))
+    elif resource_type == COLLECTS:
+        tags.add((CUSTOM_COLLECTIONS, _get_value(item, "collection_id")))
+    return tags
+
+
+class LookupCache:
+    """A bounded in memory cache of resources requested by ID.
+
+    Entries expire after the time to live of their resource type and the least
+    recently used entry is removed when the cache is full. Entries are removed
+    when a change to their resource, or to a resource they include such as the
+    variants of a product, is reported through invalidate.
+
+    Values are held as given to put and returned as they are cached. lookup
+    stores and returns copies, so changes made to a returned resource are not
+    seen by other callers.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_LOOKUP_SIZE,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        """Create an in memory lookup cache.
+
+        Args:
+            max_size (int, optional): The maximum number of entries held. Defaults
+                to DEFAULT_LOOKUP_SIZE.
+            ttls (Mapping[str, float] | None, optional): The number of seconds each
+                resource type is cached for, overriding DEFAULT_LOOKUP_TTLS.
+                Defaults to None.
+        """
+        self.max_size = max_size
+        self.ttls = dict(DEFAULT_LOOKUP_TTLS, **(ttls or {}))
+        self.stats = LookupStats()
+        self._entries: OrderedDict[Hashable, tuple[float, Any, set[Any]]] = (
+            OrderedDict()
+        )
+        self._keys_by_tag: dict[tuple[str, Any], set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, key: Hashable) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return whether key is cached and unexpired, and its value if so."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                self._discard(key)
+            self.stats.misses += 1
+            return False, None
+
+    def put(
+        self,
+        key: Hashable,
+        resource_type: str,
+        value: Any,
+        generation: int | None = None,
+    ) -> None:
+        """Cache value, a resource of resource_type, under key.
+
+        Args:
+            key (Hashable): The key to cache value under.
+            resource_type (str): The type of the resource.
+            value (Any): The resource.
+            generation (int | None, optional): The value of generation when the
+                resource was requested. If an invalidation has happened since, the
+                resource may be out of date and is not cached. Defaults to None.
+        """
+        tags = _resource_tags(resource_type, value)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if key in self._entries:
+                self._discard(key)
+            expires = time.monotonic() + self.ttls.get(resource_type, 0)
+            self._entries[key] = (expires, value, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._discard(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def invalidate(self, resource_type: str, resource_id: int | None = None) -> None:
+        """Remove the entries affected by a change to a resource.
+
+        Args:
+            resource_type (str): The type of the changed resource.
+            resource_id (int | None, optional): The ID of the changed resource, or
+                None to remove every entry that includes a resource of the type.
+                Defaults to None.
+        """
+        with self._lock:
+            self.generation += 1
+            if resource_id is None:
+                tags = [tag for tag in self._keys_by_tag if tag[0] == resource_type]
+            else:
+                tags = [(resource_type, resource_id)]
+            for tag in tags:
+                for key in list(self._keys_by_tag.get(tag, ())):
+                    self._discard(key)
+                    self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+
+lookup_cache: LookupCache | None = None
+
+
+def enable_lookup_cache(
+    max_size: int = DEFAULT_LOOKUP_SIZE, ttls: Mapping[str, float] | None = None
+) -> LookupCache:
+    """Cache the resources returned by the get_*_by_id functions in memory.
+
+    Args:
+        max_size (int, optional): The maximum number of entries held. Defaults to
+            DEFAULT_LOOKUP_SIZE.
+        ttls (Mapping[str, float] | None, optional): The number of seconds each
+            resource type is cached for, overriding DEFAULT_LOOKUP_TTLS. Defaults
+            to None.
+
+    Returns:
+        LookupCache: The enabled cache, replacing any previously enabled.
+    """
+    global lookup_cache
+    disable_lookup_cache()
+    lookup_cache = LookupCache(max_size=max_size, ttls=ttls)
+    register_invalidation_hook(lookup_cache.invalidate)
+    return lookup_cache
+
+
+def disable_lookup_cache() -> None:
+    """Stop caching the resources returned by the get_*_by_id functions."""
+    global lookup_cache
+    if lookup_cache is not None:
+        unregister_invalidation_hook(lookup_cache.invalidate)
+        lookup_cache = None
+
+
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value  # type: ignore[no-any-return]
+
+
+def lookup(
+    resource_type: str, resource_id: int, fetch: Callable[[], T], **options: Any
+) -> T:
+    """Return fetch() for a resource, from the lookup cache if it is enabled.
+
+    Each call returns its own copy of a cached resource so that a caller changing
+    it, for example before a save that fails, does not change the cache.
+
+    Args:
+        resource_type (str): The type of the requested resource.
+        resource_id (int): The ID of the requested resource.
+        fetch (Callable[[], T]): Requests the resource. Exceptions are not cached.
+        **options: Arguments that change the returned value, such as fields.
+    """
+    cache = lookup_cache
+    if cache is None:
+        return fetch()
+    key = (
+        resource_type,
+        resource_id,
+        tuple(sorted((name, _hashable(value)) for name, value in options.items())),
+    )
+    found, value = cache.get(key)
+    if found:
+        return copy.deepcopy(value)  # type: ignore[no-any-return]
+    generation = cache.generation
+    value = fetch()
+    cache.put(key, resource_type, copy.deepcopy(value), generation=generation)
+    return value
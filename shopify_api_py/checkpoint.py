@@ -0,0 +1,268 @@
+"""Checkpoint stores for resuming paginated requests."""
+
+import abc
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import urllib.parse
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+
+def checkpoint_key(request_method: Callable[..., Any], **query: Any) -> str:
+    """Return the key identifying a paginated request in a checkpoint store.
+
+    Args:
+        request_method (Callable): The find method of the requested resource.
+        **query: The query parameters of the first request.
+    """
+    name = request_method.__name__
+    owner = getattr(request_method, "__self__", None)
+    if owner is not None:
+        name = f"{owner.__name__}.{name}"
+    return f"{name}?{urllib.parse.urlencode(sorted(query.items()))}"
+
+
+class Checkpoint:
+    """The progress of a paginated request held in a CheckpointStore.
+
+    A checkpoint records the cursor of the next page to request and the items of
+    every page already emitted.
+    """
+
+    def __init__(
+        self,
+        store: "CheckpointStore",
+        key: str,
+        next_page_url: str | None = None,
+        pages: int = 0,
+    ) -> None:
+        """Create a checkpoint for a paginated request held in a CheckpointStore.
+
+        Args:
+            store (CheckpointStore): The store holding the checkpoint.
+            key (str): The key of the request in the store.
+            next_page_url (str | None, optional): The cursor URL of the next page
+                to request. Defaults to None.
+            pages (int, optional): The number of pages already emitted. Defaults
+                to 0.
+        """
+        self.store = store
+        self.key = key
+        self.next_page_url = next_page_url
+        self.pages = pages
+
+    @property
+    def resumable(self) -> bool:
+        """Return True if the request can be resumed from a saved cursor."""
+        return self.next_page_url is not None
+
+    def items(self) -> Iterator[dict[str, Any]]:
+        """Yield the attributes of each item already emitted."""
+        return self.store.iter_items(self.key)
+
+    def save_page(self, next_page_url: str, items: list[dict[str, Any]]) -> None:
+        """Record that a page has been emitted.
+
+        Args:
+            next_page_url (str): The cursor URL of the page after it.
+            items (list[dict[str, Any]]): The attributes of the page's items.
+        """
+        self.store.append_page(self.key, next_page_url, items)
+        self.next_page_url = next_page_url
+        self.pages += 1
+
+    def clear(self) -> None:
+        """Remove the checkpoint from its store."""
+        self.store.clear(self.key)
+        self.next_page_url = None
+        self.pages = 0
+
+
+class CheckpointStore(abc.ABC):
+    """Base class for persistent paginated request checkpoints."""
+
+    def open(self, key: str) -> Checkpoint:
+        """Return the checkpoint for key, empty if none has been saved."""
+        next_page_url, pages = self.load_state(key)
+        return Checkpoint(self, key, next_page_url=next_page_url, pages=pages)
+
+    @abc.abstractmethod
+    def load_state(self, key: str) -> tuple[str | None, int]:
+        """Return the saved cursor and the number of saved pages for key."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_items(self, key: str) -> Iterator[dict[str, Any]]:
+        """Yield the attributes of each saved item for key."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def append_page(
+        self, key: str, next_page_url: str, items: list[dict[str, Any]]
+    ) -> None:
+        """Durably save a page of items and the cursor following it for key."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self, key: str) -> None:
+        """Remove any saved progress for key."""
+        raise NotImplementedError
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Store checkpoints as JSON lines files in a directory.
+
+    Each request is saved to its own file with one line per emitted page. A line
+    left incomplete by an interrupted write is discarded when the checkpoint is
+    loaded.
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        """Store checkpoints as JSON lines files in a directory.
+
+        Args:
+            directory (Path | str): The directory to save checkpoint files in. It
+                is created if it does not exist.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get_path(self, key: str) -> Path:
+        """Return the path of the checkpoint file for key."""
+        digest = hashlib.sha1(key.encode("utf8")).hexdigest()
+        return self.directory / f"{digest}.jsonl"
+
+    def _iter_lines(self, key: str) -> Iterator[tuple[int, Mapping[str, Any]]]:
+        path = self.get_path(key)
+        if not path.exists():
+            return
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                yield offset, record
+
+    def load_state(self, key: str) -> tuple[str | None, int]:
+        """Return the saved cursor and the number of saved pages for key."""
+        next_page_url, pages, end = None, 0, 0
+        for offset, record in self._iter_lines(key):
+            next_page_url = record["next_page_url"]
+            pages += 1
+            end = offset
+        path = self.get_path(key)
+        if path.exists() and path.stat().st_size != end:
+            os.truncate(path, end)
+        return next_page_url, pages
+
+    def iter_items(self, key: str) -> Iterator[dict[str, Any]]:
+        """Yield the attributes of each saved item for key."""
+        for _, record in self._iter_lines(key):
+            yield from record["items"]
+
+    def append_page(
+        self, key: str, next_page_url: str, items: list[dict[str, Any]]
+    ) -> None:
+        """Durably save a page of items and the cursor following it for key."""
+        line = json.dumps({"next_page_url": next_page_url, "items": items})
+        with open(self.get_path(key), "a", encoding="utf8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self, key: str) -> None:
+        """Remove any saved progress for key."""
+        self.get_path(key).unlink(missing_ok=True)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Store checkpoints in a SQLite database.
+
+    Each emitted page is saved as a row in a single transaction.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Store checkpoints in a SQLite database.
+
+        Args:
+            path (Path | str): The path to the database file. It is created if it
+                does not exist.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS checkpoint_pages ("
+                    "key TEXT NOT NULL, page INTEGER NOT NULL, "
+                    "next_page_url TEXT NOT NULL, items TEXT NOT NULL, "
+                    "PRIMARY KEY (key, page))"
+                )
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def load_state(self, key: str) -> tuple[str | None, int]:
+        """Return the saved cursor and the number of saved pages for key."""
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT next_page_url, page FROM checkpoint_pages WHERE key = ? "
+                "ORDER BY page DESC LIMIT 1",
+                (key,),
+            ).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            return None, 0
+        return row[0], row[1] + 1
+
+    def iter_items(self, key: str) -> Iterator[dict[str, Any]]:
+        """Yield the attributes of each saved item for key."""
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT items FROM checkpoint_pages WHERE key = ? ORDER BY page",
+                (key,),
+            )
+            for (items,) in rows:
+                yield from json.loads(items)
+        finally:
+            connection.close()
+
+    def append_page(
+        self, key: str, next_page_url: str, items: list[dict[str, Any]]
+    ) -> None:
+        """Durably save a page of items and the cursor following it for key."""
+        with self._lock:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT INTO checkpoint_pages (key, page, next_page_url, items) "
+                        "SELECT ?, COUNT(*), ?, ? FROM checkpoint_pages WHERE key = ?",
+                        (key, next_page_url, json.dumps(items), key),
+                    )
+            finally:
+                connection.close()
+
+    def clear(self, key: str) -> None:
+        """Remove any saved progress for key."""
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("DELETE FROM checkpoint_pages WHERE key = ?", (key,))
+        finally:
+            connection.close()
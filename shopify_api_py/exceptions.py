@@ -1,6 +1,6 @@
 """Exceptions for the shopify_api_py package."""
 
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 
 class LoginCredentialsNotSetError(ValueError):
@@ -19,6 +19,14 @@ class TooManyPageRequestsError(Exception):
         super().__init__("Too many pages requested.")
 
 
+class PageLimitOutOfRangeError(ValueError):
+    """Exception raised when a page size outside the range Shopify allows is requested."""
+
+    def __init__(self, limit: int) -> None:
+        """Exception raised when a page size outside the range Shopify allows is requested."""
+        super().__init__(f"Page limit must be between 1 and 250, not {limit}.")
+
+
 class ResponseError(Exception):
     """Exception raised wthen a request returns a non success response."""
 
@@ -27,6 +35,24 @@ class ResponseError(Exception):
         super().__init__(*args, **kwargs)
 
 
+class ResponseStatusError(ResponseError):
+    """Exception raised when a request returns an unsuccessful HTTP status code."""
+
+    def __init__(self, status_code: int, url: str) -> None:
+        """Exception raised when a request returns an unsuccessful HTTP status code."""
+        self.status_code = status_code
+        self.url = url
+        super().__init__(f"Request to {url} returned status code {status_code}.")
+
+
+class SessionNotActiveError(Exception):
+    """Exception raised when making an async request outside of a session."""
+
+    def __init__(self, *args: list[Any], **kwargs: Mapping[str, Any]) -> None:
+        """Exception raised when making an async request outside of a session."""
+        super().__init__("No AsyncShopifyAPISession is active.")
+
+
 class ResourceNotFoundError(Exception):
     """Exception raised when a non-existant resource is requested."""
 
@@ -81,3 +107,60 @@ class CollectNotFoundError(ResourceNotFoundError):
     def __init__(self, collect_id: int | str) -> None:
         """Exception raised when a non-existant collect is requested."""
         super().__init__(resource_type="Collect", resource_id=collect_id)
+
+
+class ResourcesNotFoundError(ResourceNotFoundError):
+    """Exception raised when some of a list of requested resources do not exist."""
+
+    def __init__(
+        self,
+        resource_type: str,
+        resource_ids: Iterable[int | str],
+        found: list[Any] | None = None,
+    ) -> None:
+        """Exception raised when some of a list of requested resources do not exist.
+
+        Args:
+            resource_type (str): The type of the requested resources.
+            resource_ids (Iterable[int | str]): The IDs that were not found.
+            found (list[Any] | None, optional): The resources that were found.
+                Defaults to None.
+        """
+        self.resource_type = resource_type
+        self.resource_ids = list(resource_ids)
+        self.found = found or []
+        ids = ", ".join(str(resource_id) for resource_id in self.resource_ids)
+        Exception.__init__(self, f"{resource_type} with IDs {ids} not found.")
+
+
+class GraphQLError(ResponseError):
+    """Exception raised when a GraphQL request returns errors."""
+
+    def __init__(self, errors: Any) -> None:
+        """Exception raised when a GraphQL request returns errors."""
+        self.errors = errors
+        if isinstance(errors, list):
+            message = "; ".join(str(error.get("message", error)) for error in errors)
+        else:
+            message = str(errors)
+        super().__init__(f"GraphQL request failed: {message}")
+
+
+class GraphQLThrottledError(GraphQLError):
+    """Exception raised when a GraphQL request is throttled."""
+
+
+class BulkOperationError(ResponseError):
+    """Exception raised when a bulk operation cannot be run or does not complete."""
+
+    def __init__(
+        self, status: str, error_code: str | None = None, message: str | None = None
+    ) -> None:
+        """Exception raised when a bulk operation cannot be run or does not complete."""
+        self.status = status
+        self.error_code = error_code
+        if message is None:
+            message = f"Bulk operation {status.lower()}"
+            if error_code is not None:
+                message += f": {error_code}"
+        super().__init__(message)
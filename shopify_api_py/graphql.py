@@ -0,0 +1,66 @@
+"""Methods for making Shopify GraphQL Admin API requests."""
+
+import json
+from typing import Any
+
+import shopify
+
+from shopify_api_py import exceptions, request
+
+THROTTLED = "THROTTLED"
+
+
+def get_endpoint() -> str:
+    """Return the URL of the GraphQL endpoint for the active session."""
+    return f"{shopify.ShopifyResource.site}/graphql.json"
+
+
+def _post(body: bytes) -> dict[str, Any]:
+    response = shopify.ShopifyResource.connection.post(
+        get_endpoint(), shopify.ShopifyResource.headers, body
+    )
+    result = json.loads(response.body)
+    errors = result.get("errors")
+    if errors:
+        if isinstance(errors, list) and any(
+            error.get("extensions", {}).get("code") == THROTTLED for error in errors
+        ):
+            raise exceptions.GraphQLThrottledError(errors)
+        raise exceptions.GraphQLError(errors)
+    data: dict[str, Any] = result["data"]
+    return data
+
+
+def execute(
+    query: str,
+    variables: dict[str, Any] | None = None,
+    retry_policy: request.RetryPolicy | None = None,
+) -> dict[str, Any]:
+    """Execute a GraphQL query or mutation and return its data.
+
+    Args:
+        query (str): The GraphQL document to execute.
+        variables (dict[str, Any] | None, optional): Values for the document's
+            variables. Defaults to None.
+        retry_policy (request.RetryPolicy | None, optional): The policy used to
+            retry throttled requests and transient errors. Requests are not retried
+            if None. Defaults to None.
+
+    Raises:
+        exceptions.GraphQLError: If the response contains errors.
+
+    Returns:
+        dict[str, Any]: The data returned by the query.
+    """
+    body = json.dumps({"query": query, "variables": variables or {}}).encode("utf8")
+    return request.make_request(_post, retry_policy=retry_policy, body=body)
+
+
+def gid(resource_type: str, resource_id: int | str) -> str:
+    """Return the GraphQL global ID of a resource from its REST API ID.
+
+    Args:
+        resource_type (str): The GraphQL type of the resource, e.g. "Location".
+        resource_id (int | str): The resource's REST API ID.
+    """
+    return f"gid://shopify/{resource_type}/{resource_id}"
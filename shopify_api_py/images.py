@@ -1,13 +1,277 @@
 """Methods for interacting with Shopify products."""
 
+import hashlib
+import os
+import threading
+import urllib.request
+from pathlib import Path
+from typing import IO, Iterable, Iterator, NamedTuple
+
 import shopify
 
-from shopify_api_py import request
+from shopify_api_py import cache, exceptions, products, request
+
+HASH_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_TIMEOUT = 30.0
+MAX_BYTES_IN_FLIGHT = 64 * 1024 * 1024
+
 
+def get_images_for_product(
+    product_id: str | int, limit: int | None = None
+) -> list[shopify.Image]:
+    """Return a list of all images for a product.
 
-def get_images_for_product(product_id: str | int) -> list[shopify.Image]:
-    """Return a list of all shopify variants."""
+    Args:
+        product_id (str | int): The ID of the product.
+        limit (int | None, optional): The number of images to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+    """
     request_method = shopify.Image.find
     return request.make_paginated_request(
-        request_method=request_method, product_id=int(product_id)
+        request_method=request_method, product_id=int(product_id), limit=limit
     )  # type: ignore[return-value]
+
+
+def iter_images_for_product(
+    product_id: str | int, limit: int | None = None
+) -> Iterator[shopify.Image]:
+    """Yield every image for a product, fetching one page at a time.
+
+    Args:
+        product_id (str | int): The ID of the product.
+        limit (int | None, optional): The number of images to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+    """
+    request_method = shopify.Image.find
+    return request.iter_paginated_request(
+        request_method=request_method, product_id=int(product_id), limit=limit
+    )  # type: ignore[return-value]
+
+
+class ImageUpload(NamedTuple):
+    """An image to attach to a product.
+
+    Attributes:
+        product_id (int): The ID of the product.
+        source (str): The URL or local path of the image.
+        variant_ids (tuple[int, ...]): The IDs of variants to attach the image to.
+    """
+
+    product_id: int
+    source: str
+    variant_ids: tuple[int, ...] = ()
+
+
+class ImageUploadReport(request.BatchReport[ImageUpload]):
+    """The outcome of attaching images to products.
+
+    Attributes:
+        succeeded (list[ImageUpload]): The images that were uploaded.
+        failed (list[tuple[ImageUpload, str]]): The images that could not be
+            uploaded and the reason each failed.
+        skipped (list[ImageUpload]): The images not uploaded because their product
+            already has an image with the same content.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty report."""
+        super().__init__()
+        self.skipped: list[ImageUpload] = []
+
+
+def is_url(source: str) -> bool:
+    """Return True if an image source is a URL rather than a local path."""
+    return source.startswith(("http://", "https://"))
+
+
+def _open_source(source: str, timeout: float) -> IO[bytes]:
+    if is_url(source):
+        return urllib.request.urlopen(  # type: ignore[no-any-return]
+            source, timeout=timeout
+        )
+    return open(source, "rb")
+
+
+def hash_image(source: str, timeout: float = DOWNLOAD_TIMEOUT) -> str:
+    """Return the SHA-256 hash of an image's content.
+
+    The image is read in chunks of HASH_CHUNK_SIZE bytes so that it is never held
+    in memory.
+
+    Args:
+        source (str): The URL or local path of the image.
+        timeout (float, optional): The socket timeout in seconds for downloading
+            an image from a URL. Defaults to DOWNLOAD_TIMEOUT.
+    """
+    digest = hashlib.sha256()
+    with _open_source(source, timeout) as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _ByteBudget:
+    # Limits the number of image bytes held in memory by concurrent uploads. An
+    # image larger than the whole budget is admitted when nothing else is held.
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int) -> None:
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.used == 0 or self.used + size <= self.limit
+            )
+            self.used += size
+
+    def release(self, size: int) -> None:
+        with self._condition:
+            self.used -= size
+            self._condition.notify_all()
+
+
+def _upload_file(upload: ImageUpload, budget: _ByteBudget) -> shopify.Image:
+    size = os.path.getsize(upload.source)
+    budget.acquire(size)
+    try:
+        image = shopify.Image()
+        image.product_id = upload.product_id
+        path = Path(upload.source)
+        image.attach_image(path.read_bytes(), filename=path.name)
+        if upload.variant_ids:
+            image.variant_ids = list(upload.variant_ids)
+        response = request.make_request(
+            image.save, retry_policy=request.throttle_retry_policy
+        )
+    finally:
+        budget.release(size)
+    if response is False:
+        raise exceptions.ResponseError("Error adding image.")
+    cache.invalidate(cache.PRODUCTS, upload.product_id)
+    return image
+
+
+def _hash_all(
+    sources: Iterable[str], known_hashes: dict[str, str], max_workers: int
+) -> None:
+    # Adds the hash of each source not already known. Sources that can not be read
+    # are left out.
+    sources = [
+        source for source in dict.fromkeys(sources) if source not in known_hashes
+    ]
+
+    def try_hash(source: str) -> str | None:
+        try:
+            return hash_image(source)
+        except OSError:
+            return None
+
+    for source, digest in zip(
+        sources,
+        request.map_concurrently(try_hash, sources, max_workers=max_workers),
+        strict=True,
+    ):
+        if digest is not None:
+            known_hashes[source] = digest
+
+
+def attach_images(
+    uploads: Iterable[tuple[int, str] | tuple[int, str, tuple[int, ...]]],
+    known_hashes: dict[str, str] | None = None,
+    max_workers: int = request.DEFAULT_WORKERS,
+    max_bytes_in_flight: int = MAX_BYTES_IN_FLIGHT,
+) -> ImageUploadReport:
+    """Attach images to products, skipping images a product already has.
+
+    The images of every product are read from the products' image lists, fetched
+    a chunk of products at a time. The content of existing and new images is
+    hashed and a new image is only uploaded if its product has no image with the
+    same content and it is not a duplicate of another upload. Uploads are paced by
+    request.call_limiter and retried if throttled. Images with a URL source are
+    uploaded by URL. Images with a local path are uploaded as
+    attachments, holding at most max_bytes_in_flight bytes of images in memory.
+
+    Args:
+        uploads (Iterable[tuple]): Tuples of product ID, image URL or path and
+            optionally a tuple of variant IDs to attach the image to.
+        known_hashes (dict[str, str] | None, optional): Content hashes by image
+            source, used instead of reading the image. The hashes of images read and
+            uploaded are added to it, so it can be saved and passed to a later run
+            to avoid downloading existing images again. Defaults to None.
+        max_workers (int, optional): The number of images hashed or uploaded at
+            the same time. Defaults to request.DEFAULT_WORKERS.
+        max_bytes_in_flight (int, optional): The maximum number of bytes of local
+            images held in memory by uploads at the same time. Defaults to
+            MAX_BYTES_IN_FLIGHT.
+
+    Returns:
+        ImageUploadReport: The images that were uploaded, skipped or failed.
+    """
+    if known_hashes is None:
+        known_hashes = {}
+    image_uploads = [ImageUpload(*upload) for upload in uploads]
+    report = ImageUploadReport()
+    product_ids = list(dict.fromkeys(upload.product_id for upload in image_uploads))
+    try:
+        found = products.get_products_by_ids(
+            product_ids, fields=["images"], raw=True, max_workers=max_workers
+        )
+    except exceptions.ResourcesNotFoundError as e:
+        found = e.found
+    existing_sources = {
+        product["id"]: [image["src"] for image in product.get("images") or []]
+        for product in found
+    }
+    _hash_all(
+        [src for sources in existing_sources.values() for src in sources]
+        + [upload.source for upload in image_uploads],
+        known_hashes,
+        max_workers,
+    )
+    product_hashes = {
+        product_id: {known_hashes[src] for src in sources if src in known_hashes}
+        for product_id, sources in existing_sources.items()
+    }
+    to_upload = []
+    for upload in image_uploads:
+        if upload.product_id not in product_hashes:
+            report.add_failure(upload, f"Product {upload.product_id} not found.")
+        elif upload.source not in known_hashes:
+            report.add_failure(upload, f"Could not read {upload.source}.")
+        elif known_hashes[upload.source] in product_hashes[upload.product_id]:
+            report.skipped.append(upload)
+        else:
+            product_hashes[upload.product_id].add(known_hashes[upload.source])
+            to_upload.append(upload)
+
+    budget = _ByteBudget(max_bytes_in_flight)
+
+    def upload_image(upload: ImageUpload) -> str | None:
+        try:
+            if is_url(upload.source):
+                image = products.add_product_image(
+                    upload.product_id,
+                    upload.source,
+                    variant_ids=list(upload.variant_ids) or None,
+                )
+            else:
+                image = _upload_file(upload, budget)
+        except Exception as e:
+            return str(e) or e.__class__.__name__
+        src = getattr(image, "src", None)
+        if src:
+            known_hashes[src] = known_hashes[upload.source]
+        return None
+
+    for upload, error in zip(
+        to_upload,
+        request.map_concurrently(upload_image, to_upload, max_workers=max_workers),
+        strict=True,
+    ):
+        if error is None:
+            report.add_success(upload)
+        else:
+            report.add_failure(upload, error)
+    return report
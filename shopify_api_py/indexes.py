@@ -0,0 +1,419 @@
+"""In memory indexes of Shopify resources that can be saved and refreshed."""
+
+import bisect
+import datetime as dt
+import json
+import os
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import shopify
+
+from shopify_api_py import cache, products, request
+
+
+def _is_later(timestamp: str | None, than: str | None) -> bool:
+    """Return True if ISO 8601 timestamp is after than, or than is None."""
+    if timestamp is None:
+        return False
+    if than is None:
+        return True
+    return dt.datetime.fromisoformat(timestamp) > dt.datetime.fromisoformat(than)
+
+
+class VariantRecord:
+    """The identifying fields of a variant."""
+
+    __slots__ = (
+        "id",
+        "product_id",
+        "inventory_item_id",
+        "sku",
+        "barcode",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        product_id: int,
+        inventory_item_id: int,
+        sku: str | None = None,
+        barcode: str | None = None,
+        updated_at: str | None = None,
+    ) -> None:
+        """Create a record of the identifying fields of a variant."""
+        self.id = id
+        self.product_id = product_id
+        self.inventory_item_id = inventory_item_id
+        self.sku = sku
+        self.barcode = barcode
+        self.updated_at = updated_at
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.id}, sku={self.sku!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VariantRecord):
+            return NotImplemented
+        return self.to_row() == other.to_row()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "VariantRecord":
+        """Return a record from a variant's decoded JSON."""
+        return cls(
+            id=data["id"],
+            product_id=data["product_id"],
+            inventory_item_id=data["inventory_item_id"],
+            sku=data.get("sku"),
+            barcode=data.get("barcode"),
+            updated_at=data.get("updated_at"),
+        )
+
+    def to_row(self) -> list[Any]:
+        """Return the record's values as a list."""
+        return [getattr(self, field) for field in self.__slots__]
+
+
+def _discard(ids_by_key: dict[str, set[int]], key: str, variant_id: int) -> None:
+    ids = ids_by_key.get(key)
+    if ids is None:
+        return
+    ids.discard(variant_id)
+    if not ids:
+        del ids_by_key[key]
+
+
+class VariantIndex:
+    """An index of variants by ID, SKU, barcode and inventory item ID.
+
+    Only the identifying fields of each variant are held, as VariantRecord
+    objects. The index can be saved to a file and refreshed with the products that
+    have changed since it was last updated instead of being rebuilt.
+
+    Where several variants share a SKU or barcode, get_by_sku and get_by_barcode
+    return the one with the lowest ID and get_all_by_sku and get_all_by_barcode
+    return all of them.
+    """
+
+    FIELDS = list(VariantRecord.__slots__)
+    FILE_VERSION = 1
+
+    def __init__(
+        self, records: Iterable[VariantRecord] = (), updated_at: str | None = None
+    ) -> None:
+        """Create an index of variants.
+
+        Args:
+            records (Iterable[VariantRecord], optional): The variants to index.
+                Defaults to ().
+            updated_at (str | None, optional): The time of the most recent change
+                included in the index. Defaults to None.
+        """
+        self.updated_at = updated_at
+        self._by_id: dict[int, VariantRecord] = {}
+        self._by_sku: dict[str, set[int]] = {}
+        self._by_barcode: dict[str, set[int]] = {}
+        self._by_inventory_item_id: dict[int, int] = {}
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[VariantRecord]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, variant_id: object) -> bool:
+        return variant_id in self._by_id
+
+    def add(self, record: VariantRecord) -> None:
+        """Add a variant to the index, replacing any record with the same ID."""
+        if record.id in self._by_id:
+            self.remove(record.id)
+        self._by_id[record.id] = record
+        if record.sku:
+            self._by_sku.setdefault(record.sku, set()).add(record.id)
+        if record.barcode:
+            self._by_barcode.setdefault(record.barcode, set()).add(record.id)
+        self._by_inventory_item_id[record.inventory_item_id] = record.id
+        if _is_later(record.updated_at, self.updated_at):
+            self.updated_at = record.updated_at
+
+    def remove(self, variant_id: int) -> None:
+        """Remove the variant with ID variant_id from the index if it is present."""
+        record = self._by_id.pop(variant_id, None)
+        if record is None:
+            return
+        if record.sku:
+            _discard(self._by_sku, record.sku, variant_id)
+        if record.barcode:
+            _discard(self._by_barcode, record.barcode, variant_id)
+        if self._by_inventory_item_id.get(record.inventory_item_id) == variant_id:
+            del self._by_inventory_item_id[record.inventory_item_id]
+
+    def get_by_id(self, variant_id: int) -> VariantRecord | None:
+        """Return the variant with ID variant_id or None."""
+        return self._by_id.get(variant_id)
+
+    def get_by_sku(self, sku: str) -> VariantRecord | None:
+        """Return the variant with SKU sku and the lowest ID or None."""
+        return self._get(min(self._by_sku.get(sku, ()), default=None))
+
+    def get_by_barcode(self, barcode: str) -> VariantRecord | None:
+        """Return the variant with barcode barcode and the lowest ID or None."""
+        return self._get(min(self._by_barcode.get(barcode, ()), default=None))
+
+    def get_all_by_sku(self, sku: str) -> list[VariantRecord]:
+        """Return every variant with SKU sku, ordered by ID."""
+        return [self._by_id[id_] for id_ in sorted(self._by_sku.get(sku, ()))]
+
+    def get_all_by_barcode(self, barcode: str) -> list[VariantRecord]:
+        """Return every variant with barcode barcode, ordered by ID."""
+        return [self._by_id[id_] for id_ in sorted(self._by_barcode.get(barcode, ()))]
+
+    def get_by_inventory_item_id(self, inventory_item_id: int) -> VariantRecord | None:
+        """Return the variant with inventory item ID inventory_item_id or None."""
+        return self._get(self._by_inventory_item_id.get(inventory_item_id))
+
+    def _get(self, variant_id: int | None) -> VariantRecord | None:
+        if variant_id is None:
+            return None
+        return self._by_id[variant_id]
+
+    @classmethod
+    def build(cls) -> "VariantIndex":
+        """Return an index of every variant."""
+        variants: list[dict[str, Any]] = products.get_all_variants(
+            limit=request.MAX_PAGE_LIMIT, fields=cls.FIELDS, raw=True
+        )  # type: ignore[assignment]
+        return cls(VariantRecord.from_dict(variant) for variant in variants)
+
+    def refresh(self) -> int:
+        """Update the index with the products changed since it was last updated.
+
+        The variants of each changed product replace those held for it, so variants
+        deleted from a product are removed. Deleted products are only removed by
+        building a new index.
+
+        Returns:
+            int: The number of changed products.
+        """
+        query: dict[str, Any] = {}
+        if self.updated_at is not None:
+            query["updated_at_min"] = self.updated_at
+        changed: list[dict[str, Any]] = request.make_paginated_request(
+            request.RawFinder(shopify.Product),
+            limit=request.MAX_PAGE_LIMIT,
+            fields=["id", "updated_at", "variants"],
+            **query,
+        )  # type: ignore[assignment]
+        changed_ids = {product["id"] for product in changed}
+        for record in [record for record in self if record.product_id in changed_ids]:
+            self.remove(record.id)
+        for product in changed:
+            for variant in product["variants"]:
+                self.add(VariantRecord.from_dict(variant))
+            if _is_later(product["updated_at"], self.updated_at):
+                self.updated_at = product["updated_at"]
+        return len(changed_ids)
+
+    def save(self, path: Path | str) -> None:
+        """Save the index to a file, replacing it atomically."""
+        path = Path(path)
+        data = {
+            "version": self.FILE_VERSION,
+            "updated_at": self.updated_at,
+            "fields": self.FIELDS,
+            "variants": [record.to_row() for record in self],
+        }
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "VariantIndex":
+        """Return an index loaded from a file written by save.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version.
+        """
+        with open(path, encoding="utf8") as f:
+            data = json.load(f)
+        if data.get("version") != cls.FILE_VERSION or data["fields"] != cls.FIELDS:
+            raise ValueError(f"{path} is not a compatible variant index file.")
+        index = cls(VariantRecord(*row) for row in data["variants"])
+        index.updated_at = data["updated_at"]
+        return index
+
+
+def _insert(values: array, value: int) -> bool:
+    index = bisect.bisect_left(values, value)
+    if index < len(values) and values[index] == value:
+        return False
+    values.insert(index, value)
+    return True
+
+
+def _delete(values: array, value: int) -> bool:
+    index = bisect.bisect_left(values, value)
+    if index < len(values) and values[index] == value:
+        del values[index]
+        return True
+    return False
+
+
+class CollectionMembershipIndex:
+    """An index of which products are in which custom collections.
+
+    The index is built from a single pass over every collect. The IDs related to
+    each product and collection are held as sorted arrays of 64 bit integers, so
+    membership is tested with a binary search.
+
+    refresh adds collects created since the index was built and reads again the
+    members of collections changed through this package. Collects removed by
+    other means are only removed by building a new index.
+    """
+
+    EMPTY = array("q")
+
+    def __init__(self) -> None:
+        """Create an empty index of collection membership."""
+        self.max_collect_id = 0
+        self._by_product: dict[int, array] = {}
+        self._by_collection: dict[int, array] = {}
+        self._changed_collections: set[int] = set()
+        cache.register_invalidation_hook(self.invalidate)
+
+    def __len__(self) -> int:
+        return sum(len(product_ids) for product_ids in self._by_collection.values())
+
+    def __contains__(self, membership: object) -> bool:
+        if not isinstance(membership, tuple) or len(membership) != 2:
+            return False
+        return self.contains(*membership)
+
+    def add(self, product_id: int, collection_id: int) -> bool:
+        """Record that a product is in a collection.
+
+        Returns:
+            bool: True if the product was not already recorded in the collection.
+        """
+        added = _insert(
+            self._by_product.setdefault(product_id, array("q")), collection_id
+        )
+        _insert(self._by_collection.setdefault(collection_id, array("q")), product_id)
+        return added
+
+    def remove(self, product_id: int, collection_id: int) -> bool:
+        """Record that a product is not in a collection.
+
+        Returns:
+            bool: True if the product was recorded in the collection.
+        """
+        removed = False
+        collection_ids = self._by_product.get(product_id)
+        if collection_ids is not None:
+            removed = _delete(collection_ids, collection_id)
+            if not collection_ids:
+                del self._by_product[product_id]
+        product_ids = self._by_collection.get(collection_id)
+        if product_ids is not None:
+            _delete(product_ids, product_id)
+            if not product_ids:
+                del self._by_collection[collection_id]
+        return removed
+
+    def contains(self, product_id: int, collection_id: int) -> bool:
+        """Return True if the product is in the collection."""
+        collection_ids = self._by_product.get(product_id, self.EMPTY)
+        index = bisect.bisect_left(collection_ids, collection_id)
+        return index < len(collection_ids) and collection_ids[index] == collection_id
+
+    def get_collection_ids(self, product_id: int) -> array:
+        """Return the sorted IDs of the collections containing a product.
+
+        The returned array belongs to the index and must not be changed.
+        """
+        return self._by_product.get(product_id, self.EMPTY)
+
+    def get_product_ids(self, collection_id: int) -> array:
+        """Return the sorted IDs of the products in a collection.
+
+        The returned array belongs to the index and must not be changed.
+        """
+        return self._by_collection.get(collection_id, self.EMPTY)
+
+    def _add_collects(self, collects: Iterable[dict[str, Any]]) -> int:
+        added = 0
+        for collect in collects:
+            added += self.add(collect["product_id"], collect["collection_id"])
+            self.max_collect_id = max(self.max_collect_id, collect["id"])
+        return added
+
+    def _iter_collects(self, **query: Any) -> Iterator[dict[str, Any]]:
+        return request.iter_paginated_request(
+            request.RawFinder(shopify.Collect),
+            limit=request.MAX_PAGE_LIMIT,
+            fields=["id", "product_id", "collection_id"],
+            **query,
+        )  # type: ignore[return-value]
+
+    @classmethod
+    def build(cls) -> "CollectionMembershipIndex":
+        """Return an index built from every collect."""
+        grouped: dict[int, list[int]] = {}
+        index = cls()
+        for collect in index._iter_collects():
+            grouped.setdefault(collect["product_id"], []).append(
+                collect["collection_id"]
+            )
+            index.max_collect_id = max(index.max_collect_id, collect["id"])
+        by_collection: dict[int, list[int]] = {}
+        for product_id, collection_ids in grouped.items():
+            index._by_product[product_id] = array("q", sorted(set(collection_ids)))
+            for collection_id in index._by_product[product_id]:
+                by_collection.setdefault(collection_id, []).append(product_id)
+        for collection_id, product_ids in by_collection.items():
+            index._by_collection[collection_id] = array("q", sorted(product_ids))
+        return index
+
+    def invalidate(self, resource_type: str, resource_id: int | None = None) -> None:
+        """Mark a collection as changed so its members are read on refresh."""
+        if resource_type != cache.CUSTOM_COLLECTIONS:
+            return
+        if resource_id is None:
+            self._changed_collections.update(self._by_collection)
+        else:
+            self._changed_collections.add(resource_id)
+
+    def refresh_collection(self, collection_id: int) -> int:
+        """Replace the recorded members of a collection with its current members.
+
+        Returns:
+            int: The number of memberships added or removed.
+        """
+        current = set(products.get_products_in_custom_collection(collection_id))
+        recorded = set(self.get_product_ids(collection_id))
+        for product_id in recorded - current:
+            self.remove(product_id, collection_id)
+        for product_id in current - recorded:
+            self.add(product_id, collection_id)
+        self._changed_collections.discard(collection_id)
+        return len(recorded ^ current)
+
+    def refresh(self) -> int:
+        """Update the index with collects created since it was built or refreshed.
+
+        The members of collections changed through this package since the last
+        refresh are read again, so removals made through this package are seen.
+
+        Returns:
+            int: The number of memberships added or removed.
+        """
+        changes = self._add_collects(self._iter_collects(since_id=self.max_collect_id))
+        for collection_id in sorted(self._changed_collections):
+            changes += self.refresh_collection(collection_id)
+        return changes
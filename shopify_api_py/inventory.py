@@ -0,0 +1,380 @@
+"""Methods for updating Shopify inventory in bulk."""
+
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple
+
+import shopify
+
+from shopify_api_py import cache, graphql, request
+
+MAX_BATCH_SIZE = 250
+MAX_IDS_PER_REQUEST = 50
+
+SET_QUANTITIES_MUTATION = """
+mutation inventorySetQuantities($input: InventorySetQuantitiesInput!) {
+  inventorySetQuantities(input: $input) {
+    inventoryAdjustmentGroup { id }
+    userErrors { field message }
+  }
+}
+"""
+
+
+class StockChange(NamedTuple):
+    """A new available stock level for an inventory item at a location."""
+
+    location_id: int
+    inventory_item_id: int
+    quantity: int
+
+
+def _batch_input(batch: list[StockChange], reason: str) -> dict[str, object]:
+    return {
+        "name": "available",
+        "reason": reason,
+        "ignoreCompareQuantity": True,
+        "quantities": [
+            {
+                "locationId": graphql.gid("Location", change.location_id),
+                "inventoryItemId": graphql.gid(
+                    "InventoryItem", change.inventory_item_id
+                ),
+                "quantity": change.quantity,
+            }
+            for change in batch
+        ],
+    }
+
+
+def _error_index(field: list[str] | None) -> int | None:
+    # User errors for a single quantity have a field like
+    # ["input", "quantities", "3", "quantity"].
+    if field and len(field) >= 3 and field[1] == "quantities" and field[2].isdigit():
+        return int(field[2])
+    return None
+
+
+def _set_batch(
+    batch: list[StockChange], reason: str
+) -> request.BatchReport[StockChange]:
+    report: request.BatchReport[StockChange] = request.BatchReport()
+    try:
+        data = graphql.execute(
+            SET_QUANTITIES_MUTATION,
+            variables={"input": _batch_input(batch, reason)},
+            retry_policy=request.default_retry_policy,
+        )
+    except Exception as e:
+        for change in batch:
+            report.add_failure(change, str(e))
+        return report
+    user_errors = data["inventorySetQuantities"]["userErrors"]
+    if not user_errors:
+        for change in batch:
+            cache.invalidate(cache.INVENTORY_ITEMS, change.inventory_item_id)
+            report.add_success(change)
+        return report
+    reasons: dict[int, str] = {}
+    for error in user_errors:
+        index = _error_index(error.get("field"))
+        if index is not None:
+            reasons[index] = error["message"]
+    batch_reason = "; ".join(
+        error["message"]
+        for error in user_errors
+        if _error_index(error.get("field")) is None
+    )
+    for index, change in enumerate(batch):
+        report.add_failure(
+            change,
+            reasons.get(index)
+            or batch_reason
+            or "Not applied due to errors for other items in the batch",
+        )
+    return report
+
+
+def set_stock_levels(
+    changes: Iterable[tuple[int, int, int]],
+    batch_size: int = MAX_BATCH_SIZE,
+    max_workers: int = request.DEFAULT_WORKERS,
+    reason: str = "correction",
+) -> request.BatchReport[StockChange]:
+    """Set the available stock level of many inventory items.
+
+    Changes are sent in batches using the GraphQL inventorySetQuantities
+    mutation, with several batches in flight at once. Throttled batches are
+    retried. A batch that Shopify rejects is not applied, so every item in it is
+    reported as failed.
+
+    Args:
+        changes (Iterable[tuple[int, int, int]]): Tuples of location ID, inventory
+            item ID and new stock level.
+        batch_size (int, optional): The number of changes sent in each mutation, up
+            to MAX_BATCH_SIZE. Defaults to MAX_BATCH_SIZE.
+        max_workers (int, optional): The number of batches sent at the same time.
+            Defaults to request.DEFAULT_WORKERS.
+        reason (str, optional): The reason recorded for the inventory adjustments.
+            Defaults to "correction".
+
+    Raises:
+        ValueError: If batch_size is out of range.
+
+    Returns:
+        request.BatchReport[StockChange]: The changes that were and were not
+            applied.
+    """
+    if not 1 <= batch_size <= MAX_BATCH_SIZE:
+        raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}.")
+    batches = request.chunked((StockChange(*change) for change in changes), batch_size)
+    report: request.BatchReport[StockChange] = request.BatchReport()
+    for batch_report in request.map_concurrently(
+        lambda batch: _set_batch(batch, reason), batches, max_workers=max_workers
+    ):
+        report.update(batch_report)
+    return report
+
+
+class StockSyncReport(request.BatchReport[StockChange]):
+    """The outcome of synchronising stock levels with a desired state.
+
+    Attributes:
+        succeeded (list[StockChange]): The changes that were applied.
+        failed (list[tuple[StockChange, str]]): The changes that could not be
+            applied and the reason each failed.
+        unchanged (int): The number of stock levels that already matched.
+        unknown (list[int | str]): Keys of the desired state that do not match an
+            inventory item.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty report."""
+        super().__init__()
+        self.unchanged = 0
+        self.unknown: list[int | str] = []
+
+
+def get_inventory_levels(
+    location_ids: Iterable[int] | None = None,
+    inventory_item_ids: Iterable[int] | None = None,
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> dict[tuple[int, int], int | None]:
+    """Return the available stock of inventory items at locations.
+
+    The IDs are split into chunks of up to MAX_IDS_PER_REQUEST, the most an
+    inventory level request accepts, and the chunks are fetched at the same time.
+
+    Args:
+        location_ids (Iterable[int] | None, optional): The IDs of the locations to
+            return levels for. Levels at all locations are returned if None.
+            Defaults to None.
+        inventory_item_ids (Iterable[int] | None, optional): The IDs of the
+            inventory items to return levels for. Levels of all inventory items are
+            returned if None. Defaults to None.
+        max_workers (int, optional): The number of chunks fetched at the same time.
+            Defaults to request.DEFAULT_WORKERS.
+
+    Raises:
+        ValueError: If neither location_ids nor inventory_item_ids is passed.
+
+    Returns:
+        dict[tuple[int, int], int | None]: The available stock level by location ID
+            and inventory item ID. The level is None for items that do not track
+            inventory.
+    """
+    if location_ids is None and inventory_item_ids is None:
+        raise ValueError("location_ids or inventory_item_ids must be passed.")
+    queries: list[dict[str, Any]] = [{}]
+    for name, ids in (
+        ("location_ids", location_ids),
+        ("inventory_item_ids", inventory_item_ids),
+    ):
+        if ids is None:
+            continue
+        chunks = [
+            ",".join(str(id_) for id_ in chunk)
+            for chunk in request.chunked(ids, MAX_IDS_PER_REQUEST)
+        ]
+        queries = [
+            dict(query, **{name: chunk}) for query in queries for chunk in chunks
+        ]
+
+    def fetch(query: dict[str, Any]) -> list[dict[str, Any]]:
+        return request.make_paginated_request(
+            request.RawFinder(shopify.InventoryLevel),
+            limit=request.MAX_PAGE_LIMIT,
+            **query,
+        )  # type: ignore[return-value]
+
+    levels: dict[tuple[int, int], int | None] = {}
+    for page in request.map_concurrently(fetch, queries, max_workers=max_workers):
+        for level in page:
+            key = (level["location_id"], level["inventory_item_id"])
+            levels[key] = level["available"]
+    return levels
+
+
+def get_location_stock_levels(location_id: int) -> dict[int, int | None]:
+    """Return the available stock of every inventory item stocked at a location.
+
+    Args:
+        location_id (int): The ID of the location.
+
+    Returns:
+        dict[int, int | None]: The available stock level by inventory item ID. The
+            level is None for items that do not track inventory.
+    """
+    levels = get_inventory_levels(location_ids=[location_id])
+    return {
+        inventory_item_id: available
+        for (_, inventory_item_id), available in levels.items()
+    }
+
+
+def get_inventory_item_ids_by_sku() -> dict[str, list[int]]:
+    """Return the IDs of the inventory items of every variant by SKU."""
+    variants: Iterator[dict[str, Any]] = request.iter_paginated_request(
+        request.RawFinder(shopify.Variant),
+        limit=request.MAX_PAGE_LIMIT,
+        fields=["sku", "inventory_item_id"],
+    )  # type: ignore[assignment]
+    inventory_item_ids: dict[str, list[int]] = {}
+    for variant in variants:
+        if variant["sku"]:
+            inventory_item_ids.setdefault(variant["sku"], []).append(
+                variant["inventory_item_id"]
+            )
+    return inventory_item_ids
+
+
+def get_stock_changes(
+    location_id: int,
+    desired: Mapping[int, int],
+    current: Mapping[int, int | None],
+) -> list[StockChange]:
+    """Return the changes needed to bring current stock levels to desired ones.
+
+    Args:
+        location_id (int): The ID of the location the levels are for.
+        desired (Mapping[int, int]): The desired level by inventory item ID.
+        current (Mapping[int, int | None]): The current level by inventory item ID.
+    """
+    return [
+        StockChange(location_id, inventory_item_id, quantity)
+        for inventory_item_id, quantity in desired.items()
+        if current.get(inventory_item_id) != quantity
+    ]
+
+
+def sync_stock_levels(
+    location_id: int,
+    desired: Mapping[int, int] | Mapping[str, int],
+    by_sku: bool = False,
+    batch_size: int = MAX_BATCH_SIZE,
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> StockSyncReport:
+    """Set stock levels at a location to a desired state, sending only differences.
+
+    The current stock levels at the location are fetched in pages of the maximum
+    size and compared with desired. Only the levels that differ are sent, using
+    set_stock_levels.
+
+    Args:
+        location_id (int): The ID of the location to update.
+        desired (Mapping[int, int] | Mapping[str, int]): The desired stock level by
+            inventory item ID, or by SKU if by_sku is True.
+        by_sku (bool, optional): If True the keys of desired are SKUs. A SKU shared
+            by several variants sets the level of each of them. Defaults to False.
+        batch_size (int, optional): The number of changes sent in each mutation.
+            Defaults to MAX_BATCH_SIZE.
+        max_workers (int, optional): The number of batches sent at the same time.
+            Defaults to request.DEFAULT_WORKERS.
+
+    Returns:
+        StockSyncReport: The changes that were and were not applied, the number of
+            levels left unchanged and any SKUs that were not found.
+    """
+    report = StockSyncReport()
+    desired_levels: dict[int, int] = {}
+    if by_sku:
+        inventory_item_ids = get_inventory_item_ids_by_sku()
+        for sku, quantity in desired.items():
+            if sku not in inventory_item_ids:
+                report.unknown.append(sku)
+                continue
+            for inventory_item_id in inventory_item_ids[str(sku)]:
+                desired_levels[inventory_item_id] = quantity
+    else:
+        desired_levels = {int(key): quantity for key, quantity in desired.items()}
+    current = get_location_stock_levels(location_id)
+    changes = get_stock_changes(location_id, desired_levels, current)
+    report.unchanged = len(desired_levels) - len(changes)
+    report.update(
+        set_stock_levels(changes, batch_size=batch_size, max_workers=max_workers)
+    )
+    return report
+
+
+class CustomsUpdate(NamedTuple):
+    """New customs information for an inventory item."""
+
+    inventory_item_id: int
+    country_code_of_origin: str
+    harmonized_system_code: str
+
+
+def _set_customs_information(update: CustomsUpdate) -> str | None:
+    # Only the changed fields are sent, so the inventory item is not read first.
+    inventory_item = shopify.InventoryItem(
+        {
+            "id": update.inventory_item_id,
+            "country_code_of_origin": update.country_code_of_origin,
+            "harmonized_system_code": update.harmonized_system_code,
+        }
+    )
+    try:
+        response = request.make_request(
+            inventory_item.save, retry_policy=request.default_retry_policy
+        )
+    except Exception as e:
+        return str(e) or e.__class__.__name__
+    if response is not True:
+        errors = inventory_item.errors.full_messages()
+        return "; ".join(errors) or "Error setting customs information"
+    cache.invalidate(cache.INVENTORY_ITEMS, update.inventory_item_id)
+    return None
+
+
+def set_customs_information(
+    updates: Iterable[tuple[int, str, str]],
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> request.BatchReport[CustomsUpdate]:
+    """Set the customs information of many inventory items.
+
+    Each inventory item is updated with a single request containing only the
+    customs fields, without first requesting the item. Updates are made several
+    at a time, paced by request.call_limiter, and transient errors are retried.
+
+    Args:
+        updates (Iterable[tuple[int, str, str]]): Tuples of inventory item ID, two
+            letter country code of origin and harmonised system code.
+        max_workers (int, optional): The number of updates made at the same time.
+            Defaults to request.DEFAULT_WORKERS.
+
+    Returns:
+        request.BatchReport[CustomsUpdate]: The updates that were and were not
+            applied.
+    """
+    customs_updates = [CustomsUpdate(*update) for update in updates]
+    report: request.BatchReport[CustomsUpdate] = request.BatchReport()
+    for update, error in zip(
+        customs_updates,
+        request.map_concurrently(
+            _set_customs_information, customs_updates, max_workers=max_workers
+        ),
+        strict=True,
+    ):
+        if error is None:
+            report.add_success(update)
+        else:
+            report.add_failure(update, error)
+    return report
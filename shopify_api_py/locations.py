@@ -1,11 +1,29 @@
 """Methods for interacting with Shopify locations."""
 
+from typing import Iterator
+
 import shopify
 
 from shopify_api_py import request
 
 
-def get_inventory_locations() -> list[shopify.Location]:
-    """Return a list of all shopify products."""
+def get_inventory_locations(limit: int | None = None) -> list[shopify.Location]:
+    """Return a list of all shopify products.
+
+    Args:
+        limit (int | None, optional): The number of locations to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+    """
+    request_method = shopify.Location.find
+    return request.make_paginated_request(request_method=request_method, limit=limit)  # type: ignore[return-value]
+
+
+def iter_inventory_locations(limit: int | None = None) -> Iterator[shopify.Location]:
+    """Yield every shopify location, fetching one page at a time.
+
+    Args:
+        limit (int | None, optional): The number of locations to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+    """
     request_method = shopify.Location.find
-    return request.make_paginated_request(request_method=request_method)  # type: ignore[return-value]
+    return request.iter_paginated_request(request_method=request_method, limit=limit)  # type: ignore[return-value]
@@ -1,11 +1,116 @@
 """Methods for interacting with Shopify orders."""
 
+from typing import Any, Iterator, Literal, overload
+
 import shopify
 
 from shopify_api_py import request
+from shopify_api_py.checkpoint import CheckpointStore
+
+
+@overload
+def get_all_orders(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    partitions: int | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    raw: Literal[False] = False,
+) -> list[shopify.Order]: ...
+
+
+@overload
+def get_all_orders(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    partitions: int | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    *,
+    raw: Literal[True],
+) -> list[dict[str, Any]]: ...
+
+
+def get_all_orders(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    partitions: int | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    raw: bool = False,
+) -> list[shopify.Order] | list[dict[str, Any]]:
+    """Return a list of all shopify orders.
+
+    Args:
+        limit (int | None, optional): The number of orders to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the order fields to
+            return. All fields are returned if None. Defaults to None.
+        partitions (int | None, optional): If not None orders are fetched in up
+            to this many created_at windows at the same time. Defaults to None.
+        checkpoint_store (CheckpointStore | None, optional): If not None progress
+            is saved to this store after each page and an interrupted request
+            resumes from the last saved page. Not used with partitions. Defaults
+            to None.
+        raw (bool, optional): If True orders are returned as plain dicts instead of
+            shopify resources. Defaults to False.
+    """
+    if partitions is not None:
+        return request.make_partitioned_request(
+            shopify.Order,
+            partitions=partitions,
+            limit=limit,
+            fields=fields,
+            raw=raw,
+        )  # type: ignore[return-value]
+    request_method = request.RawFinder(shopify.Order) if raw else shopify.Order.find
+    return request.make_paginated_request(
+        request_method=request_method,
+        limit=limit,
+        fields=fields,
+        checkpoint_store=checkpoint_store,
+    )  # type: ignore[return-value]
+
+
+@overload
+def iter_all_orders(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    raw: Literal[False] = False,
+) -> Iterator[shopify.Order]: ...
+
+
+@overload
+def iter_all_orders(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    *,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
+
 
+def iter_all_orders(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    raw: bool = False,
+) -> Iterator[shopify.Order] | Iterator[dict[str, Any]]:
+    """Yield every shopify order, fetching one page at a time.
 
-def get_all_orders() -> list[shopify.Order]:
-    """Return a list of all shopify orders."""
-    request_method = shopify.Order.find
-    return request.make_paginated_request(request_method=request_method)  # type: ignore[return-value]
+    Args:
+        limit (int | None, optional): The number of orders to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the order fields to
+            return. All fields are returned if None. Defaults to None.
+        checkpoint_store (CheckpointStore | None, optional): If not None progress
+            is saved to this store after each page and an interrupted request
+            resumes from the last saved page. Defaults to None.
+        raw (bool, optional): If True orders are returned as plain dicts instead of
+            shopify resources. Defaults to False.
+    """
+    request_method = request.RawFinder(shopify.Order) if raw else shopify.Order.find
+    return request.iter_paginated_request(
+        request_method=request_method,
+        limit=limit,
+        fields=fields,
+        checkpoint_store=checkpoint_store,
+    )  # type: ignore[return-value]
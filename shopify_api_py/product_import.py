@@ -0,0 +1,361 @@
+"""Create many products from a stream of product specifications.
+
+A product specification is a dict such as a line of a JSON lines file::
+
+    {
+        "key": "SUP-1001",
+        "title": "Shirt",
+        "body_html": "<p>A shirt.</p>",
+        "vendor": "Supplier",
+        "tags": ["new"],
+        "options": {"Size": ["S", "M"]},
+        "variants": [
+            {"sku": "SUP-1001-S", "option_values": ["S"], "barcode": "1",
+             "grams": 200, "price": 9.99},
+            {"sku": "SUP-1001-M", "option_values": ["M"], "barcode": "2",
+             "grams": 220, "price": 9.99}
+        ]
+    }
+
+The key identifies the specification in the import's results and checkpoint and
+defaults to the title.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple
+
+import shopify
+
+from shopify_api_py import products, request
+
+MAX_OPTIONS = 3
+MAX_VARIANTS = 100
+
+
+class CreatedProduct(NamedTuple):
+    """The IDs of a product created from a specification."""
+
+    key: str
+    product_id: int
+    variant_ids: list[int]
+
+
+def get_spec_key(spec: Mapping[str, Any]) -> str:
+    """Return the key identifying a product specification."""
+    return str(spec.get("key") or spec.get("title") or "")
+
+
+def read_product_specs(path: Path | str) -> Iterator[dict[str, Any]]:
+    """Yield each product specification in a JSON lines file.
+
+    Blank lines are skipped.
+    """
+    with open(path, encoding="utf8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def validate_product_spec(spec: Mapping[str, Any]) -> list[str]:
+    """Return the problems that would prevent a product being created from spec.
+
+    Args:
+        spec (Mapping[str, Any]): A product specification.
+
+    Returns:
+        list[str]: A description of each problem. Empty if spec is valid.
+    """
+    errors = []
+    if not get_spec_key(spec):
+        errors.append("A key or title is required.")
+    if not spec.get("title"):
+        errors.append("A title is required.")
+    options = spec.get("options") or {}
+    if len(options) > MAX_OPTIONS:
+        errors.append(f"A product can have at most {MAX_OPTIONS} options.")
+    for name, values in options.items():
+        if not values:
+            errors.append(f"Option {name!r} has no values.")
+        elif len(set(values)) != len(values):
+            errors.append(f"Option {name!r} has duplicate values.")
+    variants = spec.get("variants") or []
+    if len(variants) > MAX_VARIANTS:
+        errors.append(f"A product can have at most {MAX_VARIANTS} variants.")
+    if not options and len(variants) > 1:
+        errors.append("A product with more than one variant must have options.")
+    option_values = list(options.values())
+    combinations = set()
+    for number, variant in enumerate(variants, 1):
+        values = tuple(variant.get("option_values") or ())
+        if len(values) != len(option_values):
+            errors.append(
+                f"Variant {number} has {len(values)} option values, "
+                f"expected {len(option_values)}."
+            )
+        elif any(
+            value not in allowed
+            for value, allowed in zip(values, option_values, strict=True)
+        ):
+            errors.append(f"Variant {number} has an unknown option value.")
+        elif values in combinations:
+            errors.append(f"Variant {number} duplicates the options of another.")
+        combinations.add(values)
+        if variant.get("price") is None:
+            errors.append(f"Variant {number} has no price.")
+    return errors
+
+
+class ImportCheckpoint:
+    """Record the products created by an import in a JSON lines file.
+
+    Each created product is written and synced to disk as soon as it is created,
+    so an interrupted import can be repeated without creating products twice. A
+    line left incomplete by an interrupted write is removed when the file is
+    loaded.
+
+    A pending line is written before each product is requested. If the import
+    stops after Shopify creates a product but before it is recorded, the key is
+    left pending and the product is looked up before the specification is
+    created again.
+
+    Attributes:
+        pending (set[str]): The keys of specifications that were being created
+            when the import stopped, set by load.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Record the products created by an import in a JSON lines file.
+
+        Args:
+            path (Path | str): The path of the file. It is created if it does not
+                exist.
+        """
+        self.path = Path(path)
+        self.pending: set[str] = set()
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[str, CreatedProduct]:
+        """Return the products already created, by specification key."""
+        created: dict[str, CreatedProduct] = {}
+        self.pending = set()
+        if not self.path.exists():
+            return created
+        end = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if record.get("pending"):
+                    self.pending.add(record["key"])
+                else:
+                    created[record["key"]] = CreatedProduct(
+                        record["key"], record["product_id"], record["variant_ids"]
+                    )
+                end += len(line)
+        if self.path.stat().st_size != end:
+            os.truncate(self.path, end)
+        self.pending -= created.keys()
+        return created
+
+    def record_pending(self, key: str) -> None:
+        """Durably record that the product for key is about to be created."""
+        self._write({"key": key, "pending": True})
+
+    def record(self, created: CreatedProduct) -> None:
+        """Durably record a created product."""
+        self._write(created._asdict())
+
+    def _write(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record)
+        with self._lock, open(self.path, "a", encoding="utf8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class ProductImportReport(request.BatchReport[str]):
+    """The outcome of importing product specifications.
+
+    Attributes:
+        succeeded (list[str]): The keys of the specifications products were created
+            from.
+        failed (list[tuple[str, str]]): The keys of the specifications that were
+            invalid or could not be created and the reason each failed.
+        created (dict[str, CreatedProduct]): The IDs of the created product and
+            variants by specification key, including those created by an earlier
+            run of the import.
+        resumed (list[str]): The keys of specifications skipped because an earlier
+            run created their products, including products found by
+            find_created_product.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty report."""
+        super().__init__()
+        self.created: dict[str, CreatedProduct] = {}
+        self.resumed: list[str] = []
+
+
+def create_product_from_spec(spec: Mapping[str, Any]) -> CreatedProduct:
+    """Create a product from a valid product specification.
+
+    Raises:
+        exceptions.ResponseError: If the product is not created.
+    """
+    options = spec.get("options") or {}
+    variants = [
+        products.create_variation(
+            sku=variant.get("sku"),
+            option_values=variant.get("option_values") or [],
+            barcode=variant.get("barcode"),
+            grams=variant.get("grams"),
+            price=variant["price"],
+            tracked=variant.get("tracked", True),
+        )
+        for variant in spec.get("variants") or []
+    ]
+    product = products.create_product(
+        title=spec["title"],
+        body_html=spec.get("body_html", ""),
+        vendor=spec.get("vendor", ""),
+        options=products.create_options(options) if variants else None,
+        variants=variants or None,
+        tags=spec.get("tags"),
+    )
+    return CreatedProduct(
+        get_spec_key(spec),
+        product.id,
+        [variant.id for variant in getattr(product, "variants", [])],
+    )
+
+
+def find_created_product(spec: Mapping[str, Any]) -> CreatedProduct | None:
+    """Return the product created from spec by an interrupted import, if any.
+
+    A product matches if it has the specification's title and vendor and its
+    variants have the specification's SKUs.
+
+    Raises:
+        ValueError: If more than one product matches.
+    """
+    found: list[dict[str, Any]] = request.make_paginated_request(
+        request.RawFinder(shopify.Product),
+        limit=request.MAX_PAGE_LIMIT,
+        fields=["id", "vendor", "variants"],
+        retry_policy=request.default_retry_policy,
+        title=spec["title"],
+    )  # type: ignore[assignment]
+    skus = sorted(variant.get("sku") or "" for variant in spec.get("variants") or [])
+    matches = [
+        product
+        for product in found
+        if (product.get("vendor") or "") == (spec.get("vendor") or "")
+        and (
+            not skus
+            or sorted(variant.get("sku") or "" for variant in product["variants"])
+            == skus
+        )
+    ]
+    if len(matches) > 1:
+        raise ValueError(
+            f"{len(matches)} products match an interrupted creation; "
+            "remove the duplicates and record the product in the checkpoint."
+        )
+    if not matches:
+        return None
+    product = matches[0]
+    return CreatedProduct(
+        get_spec_key(spec),
+        product["id"],
+        [variant["id"] for variant in product["variants"]],
+    )
+
+
+def import_products(
+    specs: Iterable[Mapping[str, Any]],
+    checkpoint: ImportCheckpoint | None = None,
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> ProductImportReport:
+    """Create a product from each of a stream of product specifications.
+
+    Specifications are validated before any request is made and invalid ones are
+    reported as failed. Valid specifications are created several at a time, paced
+    by request.call_limiter and retried if throttled. Specifications are read from
+    specs as they are needed so that large files are not held in memory.
+
+    With a checkpoint, a specification left pending by an interrupted run is
+    looked up with find_created_product before it is created again, so a product
+    created just before the interruption is recorded rather than duplicated.
+
+    Args:
+        specs (Iterable[Mapping[str, Any]]): The product specifications, such as
+            those returned by read_product_specs.
+        checkpoint (ImportCheckpoint | None, optional): If not None each created
+            product is recorded in it and specifications recorded by an earlier
+            run are not created again. Defaults to None.
+        max_workers (int, optional): The number of products created at the same
+            time. Defaults to request.DEFAULT_WORKERS.
+
+    Returns:
+        ProductImportReport: The products that were and were not created.
+    """
+    report = ProductImportReport()
+    if checkpoint is not None:
+        report.created.update(checkpoint.load())
+    seen: set[str] = set()
+
+    def valid_specs() -> Iterator[Mapping[str, Any]]:
+        for spec in specs:
+            key = get_spec_key(spec)
+            errors = validate_product_spec(spec)
+            if key in seen:
+                errors.append("Duplicate key.")
+            seen.add(key)
+            if errors:
+                report.add_failure(key, " ".join(errors))
+            elif key in report.created:
+                report.resumed.append(key)
+            else:
+                yield spec
+
+    def create(spec: Mapping[str, Any]) -> tuple[CreatedProduct, bool] | str:
+        key = get_spec_key(spec)
+        try:
+            if checkpoint is not None and key in checkpoint.pending:
+                found = find_created_product(spec)
+                if found is not None:
+                    checkpoint.record(found)
+                    return found, True
+            if checkpoint is not None:
+                checkpoint.record_pending(key)
+            created = create_product_from_spec(spec)
+        except Exception as e:
+            return str(e) or e.__class__.__name__
+        if checkpoint is not None:
+            checkpoint.record(created)
+        return created, False
+
+    for batch in request.chunked(valid_specs(), max_workers * 4):
+        for spec, result in zip(
+            batch,
+            request.map_concurrently(create, batch, max_workers=max_workers),
+            strict=True,
+        ):
+            key = get_spec_key(spec)
+            if isinstance(result, str):
+                report.add_failure(key, result)
+                continue
+            created, recovered = result
+            report.created[key] = created
+            if recovered:
+                report.resumed.append(key)
+            else:
+                report.add_success(key)
+    return report
@@ -1,22 +1,155 @@
 """Methods for interacting with Shopify products."""
 
+from typing import Any, Iterable, Iterator, Literal, NamedTuple, overload
+
 import shopify
 from pyactiveresource.connection import ResourceNotFound
 
-from shopify_api_py import exceptions, request
+from shopify_api_py import cache, exceptions, request
+from shopify_api_py.checkpoint import CheckpointStore
+
+MAX_IDS_PER_REQUEST = 250
+MAX_INVENTORY_ITEM_IDS_PER_REQUEST = 100
+
+
+@overload
+def get_all_products(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    partitions: int | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    raw: Literal[False] = False,
+) -> list[shopify.Product]: ...
 
 
-def get_all_products() -> list[shopify.Product]:
-    """Return a list of all shopify products."""
-    request_method = shopify.Product.find
-    return request.make_paginated_request(request_method=request_method)  # type: ignore[return-value]
+@overload
+def get_all_products(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    partitions: int | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    *,
+    raw: Literal[True],
+) -> list[dict[str, Any]]: ...
 
 
-def get_product_by_id(product_id: int) -> shopify.Product:
+def get_all_products(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    partitions: int | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    raw: bool = False,
+) -> list[shopify.Product] | list[dict[str, Any]]:
+    """Return a list of all shopify products.
+
+    Args:
+        limit (int | None, optional): The number of products to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the product fields to
+            return. All fields are returned if None. Defaults to None.
+        partitions (int | None, optional): If not None products are fetched in up
+            to this many created_at windows at the same time. Defaults to None.
+        checkpoint_store (CheckpointStore | None, optional): If not None progress
+            is saved to this store after each page and an interrupted request
+            resumes from the last saved page. Not used with partitions. Defaults
+            to None.
+        raw (bool, optional): If True products are returned as plain dicts instead of
+            shopify resources. Defaults to False.
+    """
+    if partitions is not None:
+        return request.make_partitioned_request(
+            shopify.Product,
+            partitions=partitions,
+            limit=limit,
+            fields=fields,
+            raw=raw,
+        )  # type: ignore[return-value]
+    request_method = request.RawFinder(shopify.Product) if raw else shopify.Product.find
+    return request.make_paginated_request(
+        request_method=request_method,
+        limit=limit,
+        fields=fields,
+        checkpoint_store=checkpoint_store,
+    )  # type: ignore[return-value]
+
+
+@overload
+def iter_all_products(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    raw: Literal[False] = False,
+) -> Iterator[shopify.Product]: ...
+
+
+@overload
+def iter_all_products(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    *,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
+
+
+def iter_all_products(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    raw: bool = False,
+) -> Iterator[shopify.Product] | Iterator[dict[str, Any]]:
+    """Yield every shopify product, fetching one page at a time.
+
+    Args:
+        limit (int | None, optional): The number of products to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the product fields to
+            return. All fields are returned if None. Defaults to None.
+        checkpoint_store (CheckpointStore | None, optional): If not None progress
+            is saved to this store after each page and an interrupted request
+            resumes from the last saved page. Defaults to None.
+        raw (bool, optional): If True products are returned as plain dicts instead of
+            shopify resources. Defaults to False.
+    """
+    request_method = request.RawFinder(shopify.Product) if raw else shopify.Product.find
+    return request.iter_paginated_request(
+        request_method=request_method,
+        limit=limit,
+        fields=fields,
+        checkpoint_store=checkpoint_store,
+    )  # type: ignore[return-value]
+
+
+@overload
+def get_product_by_id(
+    product_id: int,
+    fields: list[str] | None = None,
+    raw: Literal[False] = False,
+) -> shopify.Product: ...
+
+
+@overload
+def get_product_by_id(
+    product_id: int,
+    fields: list[str] | None = None,
+    *,
+    raw: Literal[True],
+) -> dict[str, Any]: ...
+
+
+def get_product_by_id(
+    product_id: int,
+    fields: list[str] | None = None,
+    raw: bool = False,
+) -> shopify.Product | dict[str, Any]:
     """Return the product with ID product_id.
 
     Args:
         product_id (int): ID of the product to return.
+        fields (list[str] | None, optional): The names of the product fields to
+            return. All fields are returned if None. Defaults to None.
+        raw (bool, optional): If True the product is returned as a plain dict instead of
+            a shopify resource. Defaults to False.
 
     Raises:
         exceptions.ProductNotFoundError: If no product is found.
@@ -24,23 +157,317 @@ def get_product_by_id(product_id: int) -> shopify.Product:
     Returns:
         shopify.Product: shopify.Product: The Shopify product with the ID product_id.
     """
-    try:
-        return shopify.Product.find(id_=product_id)
-    except ResourceNotFound:
-        raise exceptions.ProductNotFoundError(product_id) from None
+
+    def fetch() -> shopify.Product:
+        try:
+            find = request.RawFinder(shopify.Product) if raw else shopify.Product.find
+            query: dict[str, Any] = request.fields_query(fields)
+            return request.make_coalesced_request(  # type: ignore[no-any-return]
+                find, id_=product_id, **query
+            )
+        except ResourceNotFound:
+            raise exceptions.ProductNotFoundError(product_id) from None
+
+    return cache.lookup(cache.PRODUCTS, product_id, fetch, fields=fields, raw=raw)
+
+
+def _get_by_ids(
+    resource_class: type[shopify.ShopifyResource],
+    resource_type: str,
+    ids: Iterable[int],
+    chunk_size: int,
+    fields: list[str] | None,
+    raw: bool,
+    max_workers: int,
+) -> list[Any]:
+    ids = list(dict.fromkeys(ids))
+    if fields is not None:
+        fields = list(dict.fromkeys(["id", *fields]))
+    find = request.RawFinder(resource_class) if raw else resource_class.find
+
+    def fetch(chunk: list[int]) -> list[Any]:
+        return request.make_paginated_request(
+            find,
+            limit=request.MAX_PAGE_LIMIT,
+            fields=fields,
+            retry_policy=request.default_retry_policy,
+            ids=",".join(str(id_) for id_ in chunk),
+        )
+
+    found: dict[int, Any] = {}
+    for page in request.map_concurrently(
+        fetch, request.chunked(ids, chunk_size), max_workers=max_workers
+    ):
+        for item in page:
+            found[item["id"] if raw else item.id] = item
+    resources = [found[id_] for id_ in ids if id_ in found]
+    missing = [id_ for id_ in ids if id_ not in found]
+    if missing:
+        raise exceptions.ResourcesNotFoundError(resource_type, missing, found=resources)
+    return resources
+
+
+@overload
+def get_products_by_ids(
+    product_ids: Iterable[int],
+    fields: list[str] | None = None,
+    raw: Literal[False] = False,
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> list[shopify.Product]: ...
+
+
+@overload
+def get_products_by_ids(
+    product_ids: Iterable[int],
+    fields: list[str] | None = None,
+    *,
+    raw: Literal[True],
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> list[dict[str, Any]]: ...
+
+
+def get_products_by_ids(
+    product_ids: Iterable[int],
+    fields: list[str] | None = None,
+    raw: bool = False,
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> list[shopify.Product] | list[dict[str, Any]]:
+    """Return the products with the given IDs.
+
+    The IDs are requested in chunks of up to MAX_IDS_PER_REQUEST using the ids
+    filter, with several chunks fetched at the same time.
+
+    Args:
+        product_ids (Iterable[int]): The IDs of the products to return.
+        fields (list[str] | None, optional): The names of the product fields to
+            return. The id field is always included. All fields are returned if
+            None. Defaults to None.
+        raw (bool, optional): If True products are returned as plain dicts instead of
+            shopify resources. Defaults to False.
+        max_workers (int, optional): The number of chunks fetched at the same time.
+            Defaults to request.DEFAULT_WORKERS.
+
+    Raises:
+        exceptions.ResourcesNotFoundError: If any of the products are not found.
+            The products that were found are available as its found attribute.
+
+    Returns:
+        list[shopify.Product]: The products, in the order of product_ids.
+    """
+    return _get_by_ids(
+        shopify.Product,
+        "Product",
+        product_ids,
+        chunk_size=MAX_IDS_PER_REQUEST,
+        fields=fields,
+        raw=raw,
+        max_workers=max_workers,
+    )
+
+
+@overload
+def get_variants_by_ids(
+    variant_ids: Iterable[int],
+    fields: list[str] | None = None,
+    raw: Literal[False] = False,
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> list[shopify.Variant]: ...
+
+
+@overload
+def get_variants_by_ids(
+    variant_ids: Iterable[int],
+    fields: list[str] | None = None,
+    *,
+    raw: Literal[True],
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> list[dict[str, Any]]: ...
 
 
-def get_all_variants() -> list[shopify.Variant]:
-    """Return a list of all shopify variants."""
-    request_method = shopify.Variant.find
-    return request.make_paginated_request(request_method=request_method)  # type: ignore[return-value]
+def get_variants_by_ids(
+    variant_ids: Iterable[int],
+    fields: list[str] | None = None,
+    raw: bool = False,
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> list[shopify.Variant] | list[dict[str, Any]]:
+    """Return the variants with the given IDs.
+
+    The IDs are requested in chunks of up to MAX_IDS_PER_REQUEST using the ids
+    filter, with several chunks fetched at the same time.
+
+    Args:
+        variant_ids (Iterable[int]): The IDs of the variants to return.
+        fields (list[str] | None, optional): The names of the variant fields to
+            return. The id field is always included. All fields are returned if
+            None. Defaults to None.
+        raw (bool, optional): If True variants are returned as plain dicts instead of
+            shopify resources. Defaults to False.
+        max_workers (int, optional): The number of chunks fetched at the same time.
+            Defaults to request.DEFAULT_WORKERS.
+
+    Raises:
+        exceptions.ResourcesNotFoundError: If any of the variants are not found.
+            The variants that were found are available as its found attribute.
+
+    Returns:
+        list[shopify.Variant]: The variants, in the order of variant_ids.
+    """
+    return _get_by_ids(
+        shopify.Variant,
+        "Variant",
+        variant_ids,
+        chunk_size=MAX_IDS_PER_REQUEST,
+        fields=fields,
+        raw=raw,
+        max_workers=max_workers,
+    )
+
+
+@overload
+def get_inventory_items_by_ids(
+    inventory_item_ids: Iterable[int],
+    raw: Literal[False] = False,
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> list[shopify.InventoryItem]: ...
+
+
+@overload
+def get_inventory_items_by_ids(
+    inventory_item_ids: Iterable[int],
+    *,
+    raw: Literal[True],
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> list[dict[str, Any]]: ...
+
+
+def get_inventory_items_by_ids(
+    inventory_item_ids: Iterable[int],
+    raw: bool = False,
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> list[shopify.InventoryItem] | list[dict[str, Any]]:
+    """Return the inventory items with the given IDs.
+
+    The IDs are requested in chunks of up to MAX_INVENTORY_ITEM_IDS_PER_REQUEST
+    using the ids filter, with several chunks fetched at the same time.
+
+    Args:
+        inventory_item_ids (Iterable[int]): The IDs of the inventory items to
+            return.
+        raw (bool, optional): If True inventory items are returned as plain dicts
+            instead of shopify resources. Defaults to False.
+        max_workers (int, optional): The number of chunks fetched at the same time.
+            Defaults to request.DEFAULT_WORKERS.
+
+    Raises:
+        exceptions.ResourcesNotFoundError: If any of the inventory items are not
+            found. The inventory items that were found are available as its found
+            attribute.
+
+    Returns:
+        list[shopify.InventoryItem]: The inventory items, in the order of
+            inventory_item_ids.
+    """
+    return _get_by_ids(
+        shopify.InventoryItem,
+        "Inventory Item",
+        inventory_item_ids,
+        chunk_size=MAX_INVENTORY_ITEM_IDS_PER_REQUEST,
+        fields=None,
+        raw=raw,
+        max_workers=max_workers,
+    )
 
 
-def get_variant_by_id(variant_id: int) -> shopify.Variant:
+@overload
+def get_all_variants(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    raw: Literal[False] = False,
+) -> list[shopify.Variant]: ...
+
+
+@overload
+def get_all_variants(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    *,
+    raw: Literal[True],
+) -> list[dict[str, Any]]: ...
+
+
+def get_all_variants(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    raw: bool = False,
+) -> list[shopify.Variant] | list[dict[str, Any]]:
+    """Return a list of all shopify variants.
+
+    Args:
+        limit (int | None, optional): The number of variants to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the variant fields to
+            return. All fields are returned if None. Defaults to None.
+        raw (bool, optional): If True variants are returned as plain dicts instead of
+            shopify resources. Defaults to False.
+    """
+    request_method = request.RawFinder(shopify.Variant) if raw else shopify.Variant.find
+    return request.make_paginated_request(
+        request_method=request_method, limit=limit, fields=fields
+    )  # type: ignore[return-value]
+
+
+@overload
+def iter_all_variants(
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    raw: Literal[False] = False,
+) -> Iterator[shopify.Variant]: ...
+
+
+@overload
+def iter_all_variants(
+    limit: int | None = None, fields: list[str] | None = None, *, raw: Literal[True]
+) -> Iterator[dict[str, Any]]: ...
+
+
+def iter_all_variants(
+    limit: int | None = None, fields: list[str] | None = None, raw: bool = False
+) -> Iterator[shopify.Variant] | Iterator[dict[str, Any]]:
+    """Yield every shopify variant, fetching one page at a time.
+
+    Args:
+        limit (int | None, optional): The number of variants to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        fields (list[str] | None, optional): The names of the variant fields to
+            return. All fields are returned if None. Defaults to None.
+        raw (bool, optional): If True variants are returned as plain dicts instead of
+            shopify resources. Defaults to False.
+    """
+    request_method = request.RawFinder(shopify.Variant) if raw else shopify.Variant.find
+    return request.iter_paginated_request(
+        request_method=request_method, limit=limit, fields=fields
+    )  # type: ignore[return-value]
+
+
+@overload
+def get_variant_by_id(
+    variant_id: int, raw: Literal[False] = False
+) -> shopify.Variant: ...
+
+
+@overload
+def get_variant_by_id(variant_id: int, *, raw: Literal[True]) -> dict[str, Any]: ...
+
+
+def get_variant_by_id(
+    variant_id: int, raw: bool = False
+) -> shopify.Variant | dict[str, Any]:
     """Return the variant with ID variant_id.
 
     Args:
         variant_id (int): ID of the variant to return.
+        raw (bool, optional): If True the variant is returned as a plain dict instead of
+            a shopify resource. Defaults to False.
 
     Raises:
         exceptions.VariantNotFoundError: If no variant is found.
@@ -48,17 +475,40 @@ def get_variant_by_id(variant_id: int) -> shopify.Variant:
     Returns:
         shopify.Variant: The Shopify variant with the ID variant_id.
     """
-    try:
-        return shopify.Variant.find(id_=variant_id)
-    except ResourceNotFound:
-        raise exceptions.VariantNotFoundError(variant_id) from None
 
+    def fetch() -> shopify.Variant:
+        try:
+            find = request.RawFinder(shopify.Variant) if raw else shopify.Variant.find
+            return request.make_coalesced_request(  # type: ignore[no-any-return]
+                find, id_=variant_id
+            )
+        except ResourceNotFound:
+            raise exceptions.VariantNotFoundError(variant_id) from None
 
-def get_inventory_item_by_id(inventory_item_id: int) -> shopify.InventoryItem:
+    return cache.lookup(cache.VARIANTS, variant_id, fetch, raw=raw)
+
+
+@overload
+def get_inventory_item_by_id(
+    inventory_item_id: int, raw: Literal[False] = False
+) -> shopify.InventoryItem: ...
+
+
+@overload
+def get_inventory_item_by_id(
+    inventory_item_id: int, *, raw: Literal[True]
+) -> dict[str, Any]: ...
+
+
+def get_inventory_item_by_id(
+    inventory_item_id: int, raw: bool = False
+) -> shopify.InventoryItem | dict[str, Any]:
     """Return the inventory item with ID variant_id.
 
     Args:
         inventory_item_id (int): ID of the inventory item to return.
+        raw (bool, optional): If True the inventory item is returned as a plain dict
+            instead of a shopify resource. Defaults to False.
 
     Raises:
         exceptions.VariantNotFoundError: If no inventory item is found.
@@ -66,33 +516,53 @@ def get_inventory_item_by_id(inventory_item_id: int) -> shopify.InventoryItem:
     Returns:
         shopify.Variant: The Shopify inventory item with the ID inventory_item_id.
     """
-    try:
-        return shopify.InventoryItem.find(id_=inventory_item_id)
-    except ResourceNotFound:
-        raise exceptions.InventoryItemNotFoundError(inventory_item_id) from None
+
+    def fetch() -> shopify.InventoryItem:
+        try:
+            find = (
+                request.RawFinder(shopify.InventoryItem)
+                if raw
+                else shopify.InventoryItem.find
+            )
+            return request.make_coalesced_request(  # type: ignore[no-any-return]
+                find, id_=inventory_item_id
+            )
+        except ResourceNotFound:
+            raise exceptions.InventoryItemNotFoundError(inventory_item_id) from None
+
+    return cache.lookup(cache.INVENTORY_ITEMS, inventory_item_id, fetch, raw=raw)
 
 
 def set_stock_level(
     location_id: int, inventory_item_id: int, new_stock_level: int
 ) -> shopify.ShopifyResource:
-    """Set the stock level for a variant and location."""
+    """Set the stock level for a variant and location.
+
+    Setting an absolute stock level is idempotent so transient errors are retried.
+    """
     request_method = shopify.InventoryLevel.set
     kwargs = {
         "location_id": location_id,
         "inventory_item_id": inventory_item_id,
         "available": new_stock_level,
     }
-    return request.make_request(request_method=request_method, **kwargs)
+    response = request.make_request(
+        request_method=request_method,
+        retry_policy=request.default_retry_policy,
+        **kwargs,
+    )
+    cache.invalidate(cache.INVENTORY_ITEMS, inventory_item_id)
+    return response
 
 
 def update_variant_stock(
     variant: shopify.Variant, location_id: int, new_stock_level: int
 ) -> shopify.ShopifyResource:
     """
-    Update the stock level of a variant.
+    Update the stock level of a variant at a location.
 
-    If the updated stock level matches variant.inventory_quantity do nothing and return
-    None.
+    The level is always set, as variant.inventory_quantity is the total stock across
+    all locations and cannot show whether the level at location_id would change.
     """
     response = set_stock_level(
         location_id=location_id,
@@ -123,6 +593,7 @@ def set_customs_information(
     response = inventory_item.save()
     if response is not True:
         raise exceptions.ResponseError("Error setting customs information")
+    cache.invalidate(cache.INVENTORY_ITEMS, inventory_item_id)
 
 
 def create_options(variation_matrix: dict[str, list[str]]) -> list[shopify.Option]:
@@ -186,6 +657,8 @@ def add_product_image(
 ) -> shopify.Image:
     """Add a new image to a product.
 
+    The request is paced by request.call_limiter and retried if it is throttled.
+
     Args:
         product_id (int): The ID of the product the image will be added to.
         image_url (str): The source URL of the image.
@@ -204,9 +677,12 @@ def add_product_image(
     image.src = image_url
     if variant_ids is not None:
         image.variant_ids = variant_ids
-    response = image.save()
+    response = request.make_request(
+        image.save, retry_policy=request.throttle_retry_policy
+    )
     if response is False:
         raise exceptions.ResponseError("Error adding image.")
+    cache.invalidate(cache.PRODUCTS, product_id)
     return image
 
 
@@ -220,6 +696,8 @@ def create_product(
 ) -> shopify.Product:
     """Create a new product on Shopify.
 
+    The request is paced by request.call_limiter and retried if it is throttled.
+
     Args:
         title (str): The product's name.
         body_html (str): The product's description as HTML.
@@ -250,23 +728,106 @@ def create_product(
         product.options = options
     if tags is not None:
         product.tags = ",".join(tags)
-    response = product.save()
+    response = request.make_request(
+        product.save, retry_policy=request.throttle_retry_policy
+    )
     if response is False:
         raise exceptions.ResponseError("Error creating product.")
+    cache.invalidate(cache.PRODUCTS, product.id)
     return product
 
 
-def get_all_custom_collections() -> list[shopify.CustomCollection]:
-    """Return a list of all shopify custom collections."""
-    request_method = shopify.CustomCollection.find
-    return request.make_paginated_request(request_method=request_method)  # type: ignore[return-value]
+@overload
+def get_all_custom_collections(
+    limit: int | None = None,
+    raw: Literal[False] = False,
+) -> list[shopify.CustomCollection]: ...
+
+
+@overload
+def get_all_custom_collections(
+    limit: int | None = None,
+    *,
+    raw: Literal[True],
+) -> list[dict[str, Any]]: ...
+
+
+def get_all_custom_collections(
+    limit: int | None = None,
+    raw: bool = False,
+) -> list[shopify.CustomCollection] | list[dict[str, Any]]:
+    """Return a list of all shopify custom collections.
+
+    Args:
+        limit (int | None, optional): The number of custom collections to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        raw (bool, optional): If True custom collections are returned as plain dicts
+            instead of shopify resources. Defaults to False.
+    """
+    request_method = (
+        request.RawFinder(shopify.CustomCollection)
+        if raw
+        else shopify.CustomCollection.find
+    )
+    return request.make_paginated_request(request_method=request_method, limit=limit)  # type: ignore[return-value]
+
+
+@overload
+def iter_all_custom_collections(
+    limit: int | None = None,
+    raw: Literal[False] = False,
+) -> Iterator[shopify.CustomCollection]: ...
+
+
+@overload
+def iter_all_custom_collections(
+    limit: int | None = None,
+    *,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
+
+
+def iter_all_custom_collections(
+    limit: int | None = None,
+    raw: bool = False,
+) -> Iterator[shopify.CustomCollection] | Iterator[dict[str, Any]]:
+    """Yield every shopify custom collection, fetching one page at a time.
+
+    Args:
+        limit (int | None, optional): The number of custom collections to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        raw (bool, optional): If True custom collections are returned as plain dicts
+            instead of shopify resources. Defaults to False.
+    """
+    request_method = (
+        request.RawFinder(shopify.CustomCollection)
+        if raw
+        else shopify.CustomCollection.find
+    )
+    return request.iter_paginated_request(request_method=request_method, limit=limit)  # type: ignore[return-value]
+
 
+@overload
+def get_custom_collection_by_id(
+    collection_id: int, raw: Literal[False] = False
+) -> shopify.CustomCollection: ...
 
-def get_custom_collection_by_id(collection_id: int) -> shopify.CustomCollection:
+
+@overload
+def get_custom_collection_by_id(
+    collection_id: int, *, raw: Literal[True]
+) -> dict[str, Any]: ...
+
+
+def get_custom_collection_by_id(
+    collection_id: int, raw: bool = False
+) -> shopify.CustomCollection | dict[str, Any]:
     """Return the custom collection with ID collection_id.
 
     Args:
         collection_id (int): ID of the custom collection to return.
+        raw (bool, optional): If True the custom collection is returned as a plain dict
+            instead of a shopify resource. Defaults to False.
 
     Raises:
         exceptions.CustomCollectionNotFoundError: If no custom collection is found.
@@ -274,23 +835,114 @@ def get_custom_collection_by_id(collection_id: int) -> shopify.CustomCollection:
     Returns:
         shopify.CustomCollection: The Shopify custom collection with the ID collection_id.
     """
-    try:
-        return shopify.CustomCollection.find(id_=collection_id)
-    except ResourceNotFound:
-        raise exceptions.CustomCollectionNotFoundError(collection_id) from None
 
+    def fetch() -> shopify.CustomCollection:
+        try:
+            find = (
+                request.RawFinder(shopify.CustomCollection)
+                if raw
+                else shopify.CustomCollection.find
+            )
+            return request.make_coalesced_request(  # type: ignore[no-any-return]
+                find, id_=collection_id
+            )
+        except ResourceNotFound:
+            raise exceptions.CustomCollectionNotFoundError(collection_id) from None
+
+    return cache.lookup(cache.CUSTOM_COLLECTIONS, collection_id, fetch, raw=raw)
 
-def get_all_smart_collections() -> list[shopify.SmartCollection]:
-    """Return a list of all shopify smart collections."""
-    request_method = shopify.SmartCollection.find
-    return request.make_paginated_request(request_method=request_method)  # type: ignore[return-value]
 
+@overload
+def get_all_smart_collections(
+    limit: int | None = None,
+    raw: Literal[False] = False,
+) -> list[shopify.SmartCollection]: ...
 
-def get_smart_collection_by_id(collection_id: int) -> shopify.SmartCollection:
+
+@overload
+def get_all_smart_collections(
+    limit: int | None = None,
+    *,
+    raw: Literal[True],
+) -> list[dict[str, Any]]: ...
+
+
+def get_all_smart_collections(
+    limit: int | None = None,
+    raw: bool = False,
+) -> list[shopify.SmartCollection] | list[dict[str, Any]]:
+    """Return a list of all shopify smart collections.
+
+    Args:
+        limit (int | None, optional): The number of smart collections to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        raw (bool, optional): If True smart collections are returned as plain dicts
+            instead of shopify resources. Defaults to False.
+    """
+    request_method = (
+        request.RawFinder(shopify.SmartCollection)
+        if raw
+        else shopify.SmartCollection.find
+    )
+    return request.make_paginated_request(request_method=request_method, limit=limit)  # type: ignore[return-value]
+
+
+@overload
+def iter_all_smart_collections(
+    limit: int | None = None,
+    raw: Literal[False] = False,
+) -> Iterator[shopify.SmartCollection]: ...
+
+
+@overload
+def iter_all_smart_collections(
+    limit: int | None = None,
+    *,
+    raw: Literal[True],
+) -> Iterator[dict[str, Any]]: ...
+
+
+def iter_all_smart_collections(
+    limit: int | None = None,
+    raw: bool = False,
+) -> Iterator[shopify.SmartCollection] | Iterator[dict[str, Any]]:
+    """Yield every shopify smart collection, fetching one page at a time.
+
+    Args:
+        limit (int | None, optional): The number of smart collections to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        raw (bool, optional): If True smart collections are returned as plain dicts
+            instead of shopify resources. Defaults to False.
+    """
+    request_method = (
+        request.RawFinder(shopify.SmartCollection)
+        if raw
+        else shopify.SmartCollection.find
+    )
+    return request.iter_paginated_request(request_method=request_method, limit=limit)  # type: ignore[return-value]
+
+
+@overload
+def get_smart_collection_by_id(
+    collection_id: int, raw: Literal[False] = False
+) -> shopify.SmartCollection: ...
+
+
+@overload
+def get_smart_collection_by_id(
+    collection_id: int, *, raw: Literal[True]
+) -> dict[str, Any]: ...
+
+
+def get_smart_collection_by_id(
+    collection_id: int, raw: bool = False
+) -> shopify.SmartCollection | dict[str, Any]:
     """Return the smart collection with ID collection_id.
 
     Args:
         collection_id (int): ID of the smart collection to return.
+        raw (bool, optional): If True the smart collection is returned as a plain dict
+            instead of a shopify resource. Defaults to False.
 
     Raises:
         exceptions.SmartCollectionNotFoundError: If no smart collection is found.
@@ -298,23 +950,96 @@ def get_smart_collection_by_id(collection_id: int) -> shopify.SmartCollection:
     Returns:
         shopify.SmartCollection: The Shopify smart collection with the ID collection_id.
     """
-    try:
-        return shopify.SmartCollection.find(id_=collection_id)
-    except ResourceNotFound:
-        raise exceptions.SmartCollectionNotFoundError(collection_id) from None
 
+    def fetch() -> shopify.SmartCollection:
+        try:
+            find = (
+                request.RawFinder(shopify.SmartCollection)
+                if raw
+                else shopify.SmartCollection.find
+            )
+            return request.make_coalesced_request(  # type: ignore[no-any-return]
+                find, id_=collection_id
+            )
+        except ResourceNotFound:
+            raise exceptions.SmartCollectionNotFoundError(collection_id) from None
 
-def get_all_collects() -> list[shopify.Collect]:
-    """Return a list of all shopify collects."""
-    request_method = shopify.Collect.find
-    return request.make_paginated_request(request_method=request_method)  # type: ignore[return-value]
+    return cache.lookup(cache.SMART_COLLECTIONS, collection_id, fetch, raw=raw)
+
+
+@overload
+def get_all_collects(
+    limit: int | None = None, raw: Literal[False] = False
+) -> list[shopify.Collect]: ...
+
+
+@overload
+def get_all_collects(
+    limit: int | None = None, *, raw: Literal[True]
+) -> list[dict[str, Any]]: ...
 
 
-def get_collect_by_id(collect_id: int) -> shopify.Collect:
+def get_all_collects(
+    limit: int | None = None, raw: bool = False
+) -> list[shopify.Collect] | list[dict[str, Any]]:
+    """Return a list of all shopify collects.
+
+    Args:
+        limit (int | None, optional): The number of collects to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        raw (bool, optional): If True collects are returned as plain dicts instead of
+            shopify resources. Defaults to False.
+    """
+    request_method = request.RawFinder(shopify.Collect) if raw else shopify.Collect.find
+    return request.make_paginated_request(request_method=request_method, limit=limit)  # type: ignore[return-value]
+
+
+@overload
+def iter_all_collects(
+    limit: int | None = None, raw: Literal[False] = False
+) -> Iterator[shopify.Collect]: ...
+
+
+@overload
+def iter_all_collects(
+    limit: int | None = None, *, raw: Literal[True]
+) -> Iterator[dict[str, Any]]: ...
+
+
+def iter_all_collects(
+    limit: int | None = None, raw: bool = False
+) -> Iterator[shopify.Collect] | Iterator[dict[str, Any]]:
+    """Yield every shopify collect, fetching one page at a time.
+
+    Args:
+        limit (int | None, optional): The number of collects to request per page, up
+            to 250. Shopify's default page size is used if None. Defaults to None.
+        raw (bool, optional): If True collects are returned as plain dicts instead of
+            shopify resources. Defaults to False.
+    """
+    request_method = request.RawFinder(shopify.Collect) if raw else shopify.Collect.find
+    return request.iter_paginated_request(request_method=request_method, limit=limit)  # type: ignore[return-value]
+
+
+@overload
+def get_collect_by_id(
+    collect_id: int, raw: Literal[False] = False
+) -> shopify.Collect: ...
+
+
+@overload
+def get_collect_by_id(collect_id: int, *, raw: Literal[True]) -> dict[str, Any]: ...
+
+
+def get_collect_by_id(
+    collect_id: int, raw: bool = False
+) -> shopify.Collect | dict[str, Any]:
     """Return the collect with ID collect_id.
 
     Args:
         collect_id (int): ID of the collect to return.
+        raw (bool, optional): If True the collect is returned as a plain dict instead of
+            a shopify resource. Defaults to False.
 
     Raises:
         exceptions.CollectNotFoundError: If no collect is found.
@@ -322,15 +1047,24 @@ def get_collect_by_id(collect_id: int) -> shopify.Collect:
     Returns:
         shopify.Collect: The Shopify collect with the ID collect_id.
     """
-    try:
-        return shopify.Collect.find(id_=collect_id)
-    except ResourceNotFound:
-        raise exceptions.CollectNotFoundError(collect_id) from None
+
+    def fetch() -> shopify.Collect:
+        try:
+            find = request.RawFinder(shopify.Collect) if raw else shopify.Collect.find
+            return request.make_coalesced_request(  # type: ignore[no-any-return]
+                find, id_=collect_id
+            )
+        except ResourceNotFound:
+            raise exceptions.CollectNotFoundError(collect_id) from None
+
+    return cache.lookup(cache.COLLECTS, collect_id, fetch, raw=raw)
 
 
 def add_product_to_collection(product_id: int, collection_id: int) -> None:
     """Add a product to a custom collection.
 
+    The request is paced by request.call_limiter and retried if it is throttled.
+
     Args:
         product_id (int): ID of the product to add.
         collection_id (int): ID of the collection to add the product to.
@@ -343,11 +1077,14 @@ def add_product_to_collection(product_id: int, collection_id: int) -> None:
     collect.product_id = product_id
     collect.collection_id = collection_id
     try:
-        response = collect.save()
+        response = request.make_request(
+            collect.save, retry_policy=request.throttle_retry_policy
+        )
     except Exception as e:
         raise exceptions.ResponseError("Error adding product to collection.") from e
     if not response:
         raise exceptions.ResponseError("Error adding product to collection.")
+    cache.invalidate(cache.CUSTOM_COLLECTIONS, collection_id)
 
 
 def remove_product_from_collection(product_id: int, collection_id: int) -> None:
@@ -361,7 +1098,11 @@ def remove_product_from_collection(product_id: int, collection_id: int) -> None:
         exceptions.ResponseError: If no Collect matching the product and collection
             indicated is found.
     """
-    collects = shopify.Collect.find(product_id=product_id, collection_id=collection_id)
+    collects = request.make_paginated_request(
+        request_method=shopify.Collect.find,
+        product_id=product_id,
+        collection_id=collection_id,
+    )
     if len(collects) == 0:
         raise exceptions.ResponseError("No matching Collect found.")
     else:
@@ -372,11 +1113,14 @@ def remove_product_from_collection(product_id: int, collection_id: int) -> None:
                 raise exceptions.ResponseError(
                     "Error removing product from collection."
                 ) from e
+    cache.invalidate(cache.CUSTOM_COLLECTIONS, collection_id)
 
 
 def get_products_in_custom_collection(collection_id: int) -> list[int]:
     """Return the IDs of all products in a custom collection.
 
+    Only the product ID of each collect is requested.
+
     Args:
         collection_id (int): ID of the collection.
 
@@ -385,6 +1129,115 @@ def get_products_in_custom_collection(collection_id: int) -> list[int]:
     """
     request_method = shopify.Collect.find
     collects: list[shopify.Collect] = request.make_paginated_request(
-        request_method=request_method, kwargs={"collection_id": collection_id}
+        request_method=request_method,
+        fields=["product_id"],
+        collection_id=collection_id,
     )  # type: ignore[return-value, assignment]
     return [collect.product_id for collect in collects]
+
+
+class CollectionChange(NamedTuple):
+    """A product to add to or remove from a collection."""
+
+    action: str
+    product_id: int
+
+
+class CollectionSyncReport(request.BatchReport[CollectionChange]):
+    """The outcome of synchronising the members of a collection.
+
+    Attributes:
+        succeeded (list[CollectionChange]): The changes that were applied.
+        failed (list[tuple[CollectionChange, str]]): The changes that could not be
+            applied and the reason each failed.
+        unchanged (int): The number of desired products already in the collection.
+    """
+
+    ADD = "add"
+    REMOVE = "remove"
+
+    def __init__(self) -> None:
+        """Create an empty report."""
+        super().__init__()
+        self.unchanged = 0
+
+
+def _delete_collect(collect_id: int) -> None:
+    try:
+        request.make_request(
+            shopify.Collect({"id": collect_id}).destroy,
+            retry_policy=request.default_retry_policy,
+        )
+    except ResourceNotFound:
+        # Already removed, possibly by an earlier attempt of a retried request.
+        pass
+
+
+def sync_collection_members(
+    collection_id: int,
+    desired_product_ids: Iterable[int],
+    max_workers: int = request.DEFAULT_WORKERS,
+) -> CollectionSyncReport:
+    """Make a custom collection contain exactly the desired products.
+
+    The collection's collects are fetched once and compared with
+    desired_product_ids. Only the missing products are added and only the
+    unwanted collects are deleted, by ID, with several requests made at the same
+    time and paced by request.call_limiter.
+
+    Args:
+        collection_id (int): The ID of the custom collection.
+        desired_product_ids (Iterable[int]): The IDs of the products the collection
+            should contain.
+        max_workers (int, optional): The number of changes made at the same time.
+            Defaults to request.DEFAULT_WORKERS.
+
+    Returns:
+        CollectionSyncReport: The changes that were and were not applied.
+    """
+    collects: list[dict[str, Any]] = request.make_paginated_request(
+        request_method=request.RawFinder(shopify.Collect),
+        limit=request.MAX_PAGE_LIMIT,
+        fields=["id", "product_id"],
+        retry_policy=request.default_retry_policy,
+        collection_id=collection_id,
+    )  # type: ignore[assignment]
+    desired = set(desired_product_ids)
+    current: dict[int, list[int]] = {}
+    for collect in collects:
+        current.setdefault(collect["product_id"], []).append(collect["id"])
+    changes: list[tuple[CollectionChange, int | None]] = [
+        (CollectionChange(CollectionSyncReport.ADD, product_id), None)
+        for product_id in sorted(desired - current.keys())
+    ]
+    changes.extend(
+        (CollectionChange(CollectionSyncReport.REMOVE, product_id), collect_id)
+        for product_id in sorted(current.keys() - desired)
+        for collect_id in current[product_id]
+    )
+
+    def apply(change: tuple[CollectionChange, int | None]) -> str | None:
+        (action, product_id), collect_id = change
+        try:
+            if collect_id is None:
+                add_product_to_collection(product_id, collection_id)
+            else:
+                _delete_collect(collect_id)
+        except Exception as e:
+            return str(e) or e.__class__.__name__
+        return None
+
+    report = CollectionSyncReport()
+    report.unchanged = len(desired & current.keys())
+    for (change, _), error in zip(
+        changes,
+        request.map_concurrently(apply, changes, max_workers=max_workers),
+        strict=True,
+    ):
+        if error is None:
+            report.add_success(change)
+        else:
+            report.add_failure(change, error)
+    if any(change.action == CollectionSyncReport.REMOVE for change, _ in changes):
+        cache.invalidate(cache.CUSTOM_COLLECTIONS, collection_id)
+    return report
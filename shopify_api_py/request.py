@@ -1,32 +1,825 @@
 """Methods for making Shopify API requests."""
 
-from typing import Any, Callable
+import copy
+import datetime as dt
+import itertools
+import math
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+)
 
 import shopify
+from pyactiveresource import connection
 
 from shopify_api_py import exceptions
+from shopify_api_py.checkpoint import Checkpoint, CheckpointStore, checkpoint_key
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 250
+MAX_ITEMS = 1_000_000
+
+CALL_LIMIT_HEADER = "X-Shopify-Shop-Api-Call-Limit"
+
+DEFAULT_WORKERS = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Bucket:
+    __slots__ = ("level", "capacity", "updated")
+
+    def __init__(self, capacity: int) -> None:
+        self.level = 0.0
+        self.capacity = capacity
+        self.updated = time.monotonic()
+
+
+class CallLimiter:
+    """Pace requests to stay under each shop's leaky bucket API call limit.
+
+    Shopify reports the state of a shop's bucket in the
+    X-Shopify-Shop-Api-Call-Limit header of every response (e.g. "32/40"). The
+    bucket empties completely in DRAIN_SECONDS, so larger buckets leak faster.
+    """
+
+    DRAIN_SECONDS = 20
+    DEFAULT_CAPACITY = 40
+
+    def __init__(self, headroom: int = 2) -> None:
+        """Pace requests to stay under each shop's leaky bucket API call limit.
+
+        Args:
+            headroom (int, optional): The number of calls to leave unused in the
+                bucket. Defaults to 2.
+        """
+        self.headroom = headroom
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, shop: str) -> _Bucket:
+        if shop not in self._buckets:
+            self._buckets[shop] = _Bucket(self.DEFAULT_CAPACITY)
+        bucket = self._buckets[shop]
+        now = time.monotonic()
+        leak_rate = bucket.capacity / self.DRAIN_SECONDS
+        bucket.level = max(0.0, bucket.level - (now - bucket.updated) * leak_rate)
+        bucket.updated = now
+        return bucket
+
+    def reserve(self, shop: str) -> float:
+        """Reserve a call to shop and return the seconds to wait before making it."""
+        with self._lock:
+            bucket = self._get_bucket(shop)
+            bucket.level += 1
+            excess = bucket.level - (bucket.capacity - self.headroom)
+            return max(0.0, excess * self.DRAIN_SECONDS / bucket.capacity)
+
+    def acquire(self, shop: str) -> None:
+        """Reserve a call to shop, blocking until the bucket has room for it."""
+        delay = self.reserve(shop)
+        if delay:
+            time.sleep(delay)
+
+    def update(self, shop: str, call_limit: str) -> None:
+        """Record the bucket state reported in a call limit header.
+
+        Args:
+            shop (str): The shop the response came from.
+            call_limit (str): The value of the call limit header, e.g. "32/40".
+        """
+        try:
+            used, capacity = (int(value) for value in call_limit.split("/"))
+        except ValueError:
+            return
+        with self._lock:
+            bucket = self._get_bucket(shop)
+            bucket.level = float(used)
+            bucket.capacity = capacity
+
+    def throttled(self, shop: str) -> None:
+        """Record that a request to shop was refused for exceeding the limit."""
+        with self._lock:
+            bucket = self._get_bucket(shop)
+            bucket.level = float(bucket.capacity)
+
+    def level(self, shop: str) -> float:
+        """Return the estimated number of calls currently in shop's bucket."""
+        with self._lock:
+            return self._get_bucket(shop).level
+
+
+call_limiter = CallLimiter()
+
+
+def get_call_limit(headers: Mapping[str, str]) -> str | None:
+    """Return the call limit header from a mapping of response headers."""
+    return get_header(headers, CALL_LIMIT_HEADER)
+
+
+def _limited_call(request_method: Callable[..., T], **kwargs: Any) -> T:
+    """Call request_method, pacing it with call_limiter if a session is active."""
+    shop = shopify.ShopifyResource.site
+    if shop is None:
+        return request_method(**kwargs)
+    call_limiter.acquire(shop)
+    try:
+        return request_method(**kwargs)
+    except connection.ClientError as e:
+        if e.code == 429:
+            call_limiter.throttled(shop)
+        raise
+    finally:
+        response = shopify.ShopifyResource.connection.response
+        if response is not None:
+            call_limit = get_call_limit(response.headers)
+            if call_limit is not None:
+                call_limiter.update(shop, call_limit)
+
+
+class RetryPolicy:
+    """Policy for retrying requests that fail with a transient error.
+
+    Requests are retried after a Retry-After header's delay if one is returned,
+    otherwise after a random delay of up to backoff_factor * 2 ** attempt seconds.
+    """
+
+    RETRY_STATUS_CODES = frozenset((429, 502, 503, 504))
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_factor: float = 1.0,
+        max_backoff: float = 60.0,
+        retry_status_codes: Iterable[int] = RETRY_STATUS_CODES,
+        retry_connection_errors: bool = True,
+    ) -> None:
+        """Policy for retrying requests that fail with a transient error.
+
+        Args:
+            max_retries (int, optional): The number of times to retry a request.
+                Defaults to 5.
+            backoff_factor (float, optional): The base backoff delay in seconds.
+                Defaults to 1.0.
+            max_backoff (float, optional): The longest delay in seconds between
+                attempts. Defaults to 60.0.
+            retry_status_codes (Iterable[int], optional): HTTP status codes that
+                will be retried. Defaults to 429, 502, 503 and 504.
+            retry_connection_errors (bool, optional): If True requests that fail
+                without a response, such as on a timeout, are retried. Defaults to
+                True.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_connection_errors = retry_connection_errors
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Return True if error is transient and the request may be retried."""
+        if isinstance(error, exceptions.GraphQLThrottledError):
+            return True
+        if isinstance(error, (TimeoutError, ConnectionError)):
+            return self.retry_connection_errors
+        if isinstance(error, connection.Error):
+            if error.code is None:
+                return self.retry_connection_errors
+            return error.code in self.retry_status_codes
+        return False
+
+    def get_delay(self, attempt: int, error: Exception) -> float:
+        """Return the number of seconds to wait before retrying a request.
+
+        Args:
+            attempt (int): The number of retries already made.
+            error (Exception): The error raised by the last attempt.
+        """
+        retry_after = None
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = response.get("Retry-After")
+        return self.backoff(attempt, retry_after=retry_after)
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """Return the number of seconds to wait before retry number attempt.
+
+        Args:
+            attempt (int): The number of retries already made.
+            retry_after (str | None, optional): The value of the response's
+                Retry-After header, if any. Defaults to None.
+        """
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, backoff)
+
+
+default_retry_policy = RetryPolicy()
+
+# For requests that are not safe to repeat, such as creating a resource. Only
+# throttled requests, which Shopify has not applied, are retried.
+throttle_retry_policy = RetryPolicy(
+    retry_status_codes=(429,), retry_connection_errors=False
+)
+
+
+def _retrying_call(
+    request_method: Callable[..., T],
+    retry_policy: RetryPolicy | None,
+    **kwargs: Any,
+) -> T:
+    """Call request_method, retrying transient errors according to retry_policy."""
+    attempt = 0
+    while True:
+        try:
+            return _limited_call(request_method, **kwargs)
+        except Exception as e:
+            if retry_policy is None or attempt >= retry_policy.max_retries:
+                raise
+            if not retry_policy.is_retryable(e):
+                raise
+            time.sleep(retry_policy.get_delay(attempt, e))
+            attempt += 1
 
 
 def make_request(
-    request_method: Callable[..., shopify.ShopifyResource], **kwargs: Any
-) -> shopify.ShopifyResource:
-    """Make a single page shopify request."""
-    response = request_method(**kwargs)
+    request_method: Callable[..., T],
+    retry_policy: RetryPolicy | None = None,
+    **kwargs: Any,
+) -> T:
+    """Make a single page shopify request.
+
+    Requests are not retried unless a retry_policy is passed, which should only be
+    done when repeating the request is safe.
+
+    Args:
+        request_method (Callable): The resource method making the request.
+        retry_policy (RetryPolicy | None, optional): The policy used to retry
+            transient errors. Defaults to None.
+        **kwargs: Keyword arguments for request_method.
+    """
+    response = _retrying_call(request_method, retry_policy, **kwargs)
     return response
 
 
-def make_paginated_request(
-    request_method: Callable[..., shopify.collection.PaginatedCollection], **kwargs: Any
-) -> list[shopify.ShopifyResource]:
-    """Make a multi page shopify request."""
-    response = request_method(**kwargs)
-    items = list(response)
-    for _ in range(1000):
+class SingleFlight:
+    """Share the result of a call with identical calls made while it runs.
+
+    The first call for a key runs its function. Calls for the same key made from
+    other threads before it returns wait for it and receive a copy of its result,
+    or raise the same exception, instead of running their own.
+
+    Attributes:
+        shared (int): The number of calls that received another call's result.
+    """
+
+    def __init__(self) -> None:
+        """Create a coalescer of identical concurrent calls."""
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[Any]] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Return func(), or the result of a call for key already running.
+
+        Args:
+            key (Hashable): Identifies calls that return the same result.
+            func (Callable[[], T]): The function to call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not is_leader:
+            result: T = copy.deepcopy(future.result())
+            return result
+        try:
+            result = func()
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._calls[key]
+        future.set_result(result)
+        return result
+
+
+single_flight = SingleFlight()
+
+
+def make_coalesced_request(
+    request_method: Callable[..., T],
+    retry_policy: RetryPolicy | None = None,
+    **kwargs: Any,
+) -> T:
+    """Make a single page shopify GET request, sharing identical requests in flight.
+
+    Requests from other threads for the same resource method and arguments made
+    while this one runs receive a copy of its response rather than making their
+    own, so no two callers share a resource object.
+
+    Args:
+        request_method (Callable[..., T]): The method that makes the request. It
+            must not change any resource.
+        retry_policy (RetryPolicy | None, optional): The policy used to retry
+            transient errors. Defaults to None.
+        **kwargs: Keyword arguments for request_method.
+    """
+    key = (
+        shopify.ShopifyResource.site,
+        request_method,
+        repr(sorted(kwargs.items())),
+    )
+    return single_flight.do(
+        key,
+        lambda: make_request(request_method, retry_policy=retry_policy, **kwargs),
+    )
+
+
+def fields_query(fields: Iterable[str] | None = None) -> dict[str, str]:
+    """Return query parameters requesting only the given resource fields.
+
+    Args:
+        fields (Iterable[str] | None, optional): The names of the fields to return or
+            None to return full resources. Defaults to None.
+
+    Returns:
+        dict[str, str]: Keyword arguments to pass to a resource's find method.
+    """
+    if fields is None:
+        return {}
+    return {"fields": ",".join(fields)}
+
+
+def get_header(headers: Mapping[str, str], name: str) -> str | None:
+    """Return a header from a mapping of response headers, ignoring case."""
+    for key, value in headers.items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
+def get_next_page_url(headers: Mapping[str, str]) -> str | None:
+    """Return the URL of the next page from a response's Link header."""
+    links = get_header(headers, "Link")
+    if links is None:
+        return None
+    for link in links.split(","):
+        url, _, params = link.partition(";")
+        if 'rel="next"' in params:
+            return url.strip().strip("<>")
+    return None
+
+
+class RawPage(list[dict[str, Any]]):
+    """A page of resources decoded to plain dicts.
+
+    Provides the pagination interface of shopify.collection.PaginatedCollection.
+    """
+
+    def __init__(
+        self, items: Iterable[dict[str, Any]], next_page_url: str | None = None
+    ) -> None:
+        """Create a page of resources decoded to plain dicts.
+
+        Args:
+            items (Iterable[dict[str, Any]]): The resources on the page.
+            next_page_url (str | None, optional): The cursor URL of the next page.
+                Defaults to None.
+        """
+        super().__init__(items)
+        self.next_page_url = next_page_url
+
+    def has_next_page(self) -> bool:
+        """Return True if there is a page after this one."""
+        return self.next_page_url is not None
+
+
+class RawFinder:
+    """A find method for a resource type that returns plain dicts.
+
+    The decoded JSON of each response is returned as is, without building
+    ShopifyResource objects for the resources and their nested resources. Lists of
+    resources are returned as a RawPage and can be passed as the request method of
+    a paginated request.
+    """
+
+    def __init__(self, resource_class: type[shopify.ShopifyResource]) -> None:
+        """Create a find method for a resource type that returns plain dicts.
+
+        Args:
+            resource_class (type[shopify.ShopifyResource]): The resource to find.
+        """
+        self.resource_class = resource_class
+        self.__name__ = f"{resource_class.__name__}.find_raw"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RawFinder):
+            return NotImplemented
+        return self.resource_class is other.resource_class
+
+    def __hash__(self) -> int:
+        return hash((RawFinder, self.resource_class))
+
+    def __call__(
+        self, id_: int | str | None = None, from_: str | None = None, **kwargs: Any
+    ) -> Any:
+        """Return the resource with id_ as a dict or a RawPage of resources."""
+        resource_class = self.resource_class
+        prefix_options, query_options = resource_class._split_options(kwargs)
+        if from_ is not None:
+            path = from_
+        elif id_ is not None:
+            path = resource_class._element_path(id_, prefix_options, query_options)
+        else:
+            path = resource_class._collection_path(prefix_options, query_options)
+        response = resource_class.connection.get(path, resource_class.headers)
+        data = resource_class.format.decode(response.body)
+        if id_ is not None:
+            return data
+        return RawPage(data, next_page_url=get_next_page_url(response.headers))
+
+
+def _item_attributes(item: Any) -> dict[str, Any]:
+    if isinstance(item, dict):
+        return item
+    attributes: dict[str, Any] = item.to_dict()
+    return attributes
+
+
+def _build_item(request_method: Callable[..., Any], attributes: dict[str, Any]) -> Any:
+    if isinstance(request_method, RawFinder):
+        return attributes
+    return request_method.__self__(attributes)  # type: ignore[attr-defined]
+
+
+def page_budget(limit: int | None = None) -> int:
+    """Return the maximum number of pages to request at a given page size.
+
+    The budget allows MAX_ITEMS items to be fetched whatever the page size.
+
+    Args:
+        limit (int | None, optional): The number of items per page or None for
+            Shopify's default page size. Defaults to None.
+
+    Raises:
+        exceptions.PageLimitOutOfRangeError: If limit is not between 1 and
+            MAX_PAGE_LIMIT.
+
+    Returns:
+        int: The number of pages that may be requested after the first.
+    """
+    if limit is None:
+        limit = DEFAULT_PAGE_LIMIT
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise exceptions.PageLimitOutOfRangeError(limit)
+    return math.ceil(MAX_ITEMS / limit)
+
+
+def iter_paginated_pages(
+    request_method: Callable[..., shopify.collection.PaginatedCollection],
+    limit: int | None = None,
+    max_pages: int | None = None,
+    fields: Iterable[str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    checkpoint: Checkpoint | None = None,
+    **kwargs: Any,
+) -> Iterator[shopify.collection.PaginatedCollection]:
+    """Yield each page of a multi page shopify request as it is fetched.
+
+    Only the current page is held in memory. Subsequent pages are requested using
+    only the cursor URL returned by Shopify, which carries the original query.
+
+    Args:
+        request_method (Callable): The find method of the resource to request.
+        limit (int | None, optional): The number of items per page, up to
+            MAX_PAGE_LIMIT. Shopify's default is used if None. Defaults to None.
+        max_pages (int | None, optional): The maximum number of pages to request
+            after the first. If None the budget is sized from limit. Defaults to
+            None.
+        fields (Iterable[str] | None, optional): The names of the resource fields
+            to return. All fields are returned if None. Defaults to None.
+        retry_policy (RetryPolicy | None, optional): The policy used to retry a
+            page after a transient error. Retrying resumes from the failed page.
+            If None default_retry_policy is used. Defaults to None.
+        checkpoint (Checkpoint | None, optional): If given, each page is saved to
+            the checkpoint once the next page is requested and the request resumes
+            from the checkpoint's cursor. The checkpoint is cleared when the last
+            page has been emitted. Defaults to None.
+        **kwargs: Query parameters for the first request.
+
+    Raises:
+        exceptions.PageLimitOutOfRangeError: If limit is not between 1 and
+            MAX_PAGE_LIMIT.
+        exceptions.TooManyPageRequestsError: If more than max_pages pages are
+            requested.
+    """
+    budget = page_budget(limit)
+    if max_pages is None:
+        max_pages = budget
+    if retry_policy is None:
+        retry_policy = default_retry_policy
+    if limit is not None:
+        kwargs["limit"] = limit
+    kwargs.update(fields_query(fields))
+    if checkpoint is not None and checkpoint.resumable:
+        kwargs = {"from_": checkpoint.next_page_url}
+    response = _retrying_call(request_method, retry_policy, **kwargs)
+    yield response
+    for _ in range(max_pages):
         if not response.has_next_page():
             break
-        kwargs["from_"] = response.next_page_url
-        response = request_method(**kwargs)
-        items.extend(list(response))
+        next_page_url = response.next_page_url
+        if checkpoint is not None and next_page_url is not None:
+            checkpoint.save_page(
+                next_page_url, [_item_attributes(item) for item in response]
+            )
+        response = _retrying_call(request_method, retry_policy, from_=next_page_url)
+        yield response
     else:
         raise exceptions.TooManyPageRequestsError()
-    return items
+    if checkpoint is not None:
+        checkpoint.clear()
+
+
+def iter_paginated_request(
+    request_method: Callable[..., shopify.collection.PaginatedCollection],
+    limit: int | None = None,
+    max_pages: int | None = None,
+    fields: Iterable[str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    **kwargs: Any,
+) -> Iterator[shopify.ShopifyResource]:
+    """Yield each item of a multi page shopify request as it is fetched.
+
+    If a checkpoint_store is given progress is saved to it after each page. If the
+    request is interrupted, repeating it with the same store and arguments first
+    yields the items already emitted from the store and then resumes from the
+    first page that was not completed.
+    """
+    checkpoint = None
+    if checkpoint_store is not None:
+        query = dict(kwargs, **fields_query(fields))
+        if limit is not None:
+            query["limit"] = limit
+        checkpoint = checkpoint_store.open(checkpoint_key(request_method, **query))
+        if checkpoint.resumable:
+            for attributes in checkpoint.items():
+                yield _build_item(request_method, attributes)
+    for page in iter_paginated_pages(
+        request_method,
+        limit=limit,
+        max_pages=max_pages,
+        fields=fields,
+        retry_policy=retry_policy,
+        checkpoint=checkpoint,
+        **kwargs,
+    ):
+        yield from page
+
+
+def make_paginated_request(
+    request_method: Callable[..., shopify.collection.PaginatedCollection],
+    limit: int | None = None,
+    max_pages: int | None = None,
+    fields: Iterable[str] | None = None,
+    retry_policy: RetryPolicy | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    **kwargs: Any,
+) -> list[shopify.ShopifyResource]:
+    """Make a multi page shopify request."""
+    return list(
+        iter_paginated_request(
+            request_method,
+            limit=limit,
+            max_pages=max_pages,
+            fields=fields,
+            retry_policy=retry_policy,
+            checkpoint_store=checkpoint_store,
+            **kwargs,
+        )
+    )
+
+
+def map_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = DEFAULT_WORKERS
+) -> Iterator[R]:
+    """Yield func(item) for each item, calling func from a pool of threads.
+
+    Results are yielded in the order of items. The headers of the active session
+    are copied to each worker thread so that requests made by func are
+    authenticated. Requests are still paced by call_limiter.
+
+    Args:
+        func (Callable[[T], R]): The function to call.
+        items (Iterable[T]): The arguments to call func with.
+        max_workers (int, optional): The number of threads. Defaults to
+            DEFAULT_WORKERS.
+    """
+    headers = dict(shopify.ShopifyResource.headers)
+
+    def call(item: T) -> R:
+        shopify.ShopifyResource.headers = dict(headers)
+        return func(item)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(call, items)
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield successive lists of up to size items from items."""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+class BatchReport(Generic[T]):
+    """The outcome of applying a change to each of a collection of items.
+
+    Attributes:
+        succeeded (list): The items the change was applied to.
+        failed (list[tuple]): Tuples of each item the change could not be applied
+            to and the reason it failed.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty report."""
+        self.succeeded: list[T] = []
+        self.failed: list[tuple[T, str]] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(succeeded={len(self.succeeded)}, "
+            f"failed={len(self.failed)})"
+        )
+
+    @property
+    def ok(self) -> bool:
+        """Return True if no item failed."""
+        return not self.failed
+
+    def add_success(self, item: T) -> None:
+        """Record that the change was applied to item."""
+        self.succeeded.append(item)
+
+    def add_failure(self, item: T, reason: str) -> None:
+        """Record that the change could not be applied to item."""
+        self.failed.append((item, reason))
+
+    def update(self, other: "BatchReport[T]") -> None:
+        """Add the outcomes recorded in another report to this one."""
+        self.succeeded.extend(other.succeeded)
+        self.failed.extend(other.failed)
+
+
+def _created_at_windows(
+    start: dt.datetime, end: dt.datetime, count: int
+) -> list[dict[str, Any]]:
+    """Return query parameters splitting start to end into count created_at windows.
+
+    The first window is open at the start and the last is open at the end so that
+    no resource is missed.
+    """
+    step = (end - start) / count
+    boundaries = [(start + step * i).isoformat() for i in range(1, count)]
+    windows: list[dict[str, Any]] = []
+    for i in range(count):
+        window = {}
+        if i > 0:
+            window["created_at_min"] = boundaries[i - 1]
+        if i < count - 1:
+            window["created_at_max"] = boundaries[i]
+        windows.append(window)
+    return windows
+
+
+def iter_partitioned_request(
+    resource_class: type[shopify.ShopifyResource],
+    partitions: int = DEFAULT_WORKERS,
+    limit: int | None = None,
+    fields: Iterable[str] | None = None,
+    raw: bool = False,
+    **kwargs: Any,
+) -> Iterator[shopify.ShopifyResource]:
+    """Yield every resource of a type, fetching created_at windows concurrently.
+
+    The number of windows is sized from the resource's count endpoint so that no
+    more windows are fetched than there are pages. The windows span from the
+    creation of the oldest resource to the present and are fetched at the same time
+    in a thread pool. Results are yielded window by window in order of creation
+    date, with resources falling on a boundary between windows only yielded once.
+
+    Args:
+        resource_class (type[shopify.ShopifyResource]): The resource type to fetch.
+        partitions (int, optional): The maximum number of windows to fetch at the
+            same time. Defaults to DEFAULT_WORKERS.
+        limit (int | None, optional): The number of items per page, up to
+            MAX_PAGE_LIMIT. Shopify's default is used if None. Defaults to None.
+        fields (Iterable[str] | None, optional): The names of the resource fields
+            to return. The id field is always requested. All fields are returned if
+            None. Defaults to None.
+        raw (bool, optional): If True resources are returned as plain dicts.
+            Defaults to False.
+        **kwargs: Query parameters for every window. ISO 8601 created_at_min and
+            created_at_max parameters limit the span that is split into windows.
+    """
+    created_at_min = kwargs.pop("created_at_min", None)
+    created_at_max = kwargs.pop("created_at_max", None)
+    bounds = {
+        name: value
+        for name, value in (
+            ("created_at_min", created_at_min),
+            ("created_at_max", created_at_max),
+        )
+        if value is not None
+    }
+    total = _retrying_call(
+        resource_class.count, default_retry_policy, **bounds, **kwargs
+    )
+    if not total:
+        return
+    if fields is not None:
+        fields = ["id", *(field for field in fields if field != "id")]
+    pages = math.ceil(total / (limit or DEFAULT_PAGE_LIMIT))
+    oldest = _retrying_call(
+        resource_class.find,
+        default_retry_policy,
+        since_id=0,
+        limit=1,
+        fields="created_at",
+        **bounds,
+        **kwargs,
+    )
+    if not oldest:
+        return
+    start = dt.datetime.fromisoformat(oldest[0].created_at)
+    if created_at_max is None:
+        end = dt.datetime.now(tz=start.tzinfo)
+    else:
+        end = dt.datetime.fromisoformat(created_at_max)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=start.tzinfo)
+    windows = _created_at_windows(start, end, max(1, min(partitions, pages)))
+    # The open ends of the first and last windows are closed by the caller's bounds.
+    if created_at_min is not None:
+        windows[0]["created_at_min"] = created_at_min
+    if created_at_max is not None:
+        windows[-1]["created_at_max"] = created_at_max
+
+    find = RawFinder(resource_class) if raw else resource_class.find
+
+    def fetch_window(window: dict[str, Any]) -> list[shopify.ShopifyResource]:
+        return make_paginated_request(
+            find, limit=limit, fields=fields, **window, **kwargs
+        )
+
+    previous_ids: set[int] = set()
+    for items in map_concurrently(fetch_window, windows, max_workers=partitions):
+        ids = set()
+        for item in items:
+            item_id = item["id"] if raw else item.id  # type: ignore[index]
+            ids.add(item_id)
+            if item_id not in previous_ids:
+                yield item
+        previous_ids = ids
+
+
+def make_partitioned_request(
+    resource_class: type[shopify.ShopifyResource],
+    partitions: int = DEFAULT_WORKERS,
+    limit: int | None = None,
+    fields: Iterable[str] | None = None,
+    raw: bool = False,
+    **kwargs: Any,
+) -> list[shopify.ShopifyResource]:
+    """Return every resource of a type, fetching created_at windows concurrently."""
+    return list(
+        iter_partitioned_request(
+            resource_class,
+            partitions=partitions,
+            limit=limit,
+            fields=fields,
+            raw=raw,
+            **kwargs,
+        )
+    )
@@ -6,11 +6,16 @@ from typing import Any, Callable, Optional, Union
 import shopify
 import toml
 
+from . import transport
 from .exceptions import LoginCredentialsNotSetError
 
 
 class ShopifyAPISession:
-    """Session manager for the shopify API."""
+    """Session manager for the shopify API.
+
+    Requests made within the session are sent over a pool of keep-alive
+    connections shared by all sessions and threads.
+    """
 
     SHOP_URL = None
     API_VERSION = None
@@ -18,23 +23,53 @@ class ShopifyAPISession:
 
     CONFIG_FILENAME = ".shopify_api.toml"
 
+    POOL_SIZE = transport.DEFAULT_POOL_SIZE
+    TIMEOUT = transport.DEFAULT_TIMEOUT
+
+    def __init__(
+        self, pool_size: Optional[int] = None, timeout: Optional[float] = None
+    ) -> None:
+        """Session manager for the shopify API.
+
+        Args:
+            pool_size (Optional[int], optional): The maximum number of idle
+                connections kept open. Uses POOL_SIZE if None. Defaults to None.
+            timeout (Optional[float], optional): The socket timeout for connections
+                in seconds. Uses TIMEOUT if None. Defaults to None.
+        """
+        self.pool_size = self.POOL_SIZE if pool_size is None else pool_size
+        self.timeout = self.TIMEOUT if timeout is None else timeout
+
     def __enter__(self) -> shopify.Session:
-        if not self.__class__.credentails_are_set():
-            config_path = self.__class__.find_config_filepath()
-            if config_path is not None:
-                self.__class__.load_from_config_file(config_file_path=config_path)
-        if not self.__class__.credentails_are_set():
-            raise LoginCredentialsNotSetError()
-        session = shopify.Session(
-            shop_url=self.__class__.SHOP_URL,
-            version=self.__class__.API_VERSION,
-            token=self.__class__.API_PASSWORD,
-        )
+        session = self.__class__.create_session()
+        transport.install(pool_size=self.pool_size, timeout=self.timeout)
         shopify.ShopifyResource.activate_session(session)
         return session
 
     def __exit__(self, exc_type: None, exc_value: None, exc_tb: None) -> None:
         shopify.ShopifyResource.clear_session()
+        transport.uninstall()
+
+    @classmethod
+    def create_session(cls) -> shopify.Session:
+        """Return a new shopify.Session using the configured login credentials.
+
+        Credentials are loaded from a config file if they have not been set.
+
+        Raises:
+            LoginCredentialsNotSetError: If no login credentials are available.
+        """
+        if not cls.credentails_are_set():
+            config_path = cls.find_config_filepath()
+            if config_path is not None:
+                cls.load_from_config_file(config_file_path=config_path)
+        if not cls.credentails_are_set():
+            raise LoginCredentialsNotSetError()
+        return shopify.Session(
+            shop_url=cls.SHOP_URL,
+            version=cls.API_VERSION,
+            token=cls.API_PASSWORD,
+        )
 
     @classmethod
     def set_login(
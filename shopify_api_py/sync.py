@@ -0,0 +1,343 @@
+"""Fetch only the resources that have changed since a previous sync.
+
+A sync does not save its progress. Apply the returned upserts and deletions,
+then call the result's commit method so that the next sync starts after them::
+
+    result = sync_products(store)
+    apply(result.upserts, result.deleted_ids)
+    result.commit()
+
+If applying the changes fails the next sync returns them again.
+"""
+
+import datetime as dt
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import shopify
+
+from shopify_api_py import request
+
+OVERLAP = dt.timedelta(minutes=5)
+
+PRODUCTS = "products"
+VARIANTS = "variants"
+ORDERS = "orders"
+
+
+class SyncState:
+    """The progress of delta syncs of one resource type.
+
+    Attributes:
+        high_water_mark (str | None): The latest updated_at time seen by a sync, as
+            reported by Shopify.
+        ids (set[int] | None): The IDs of every resource seen by the last sync that
+            checked for deletions.
+    """
+
+    def __init__(
+        self, high_water_mark: str | None = None, ids: Iterable[int] | None = None
+    ) -> None:
+        """Create the state of delta syncs of one resource type.
+
+        Args:
+            high_water_mark (str | None, optional): The latest updated_at time seen.
+                Defaults to None.
+            ids (Iterable[int] | None, optional): The IDs of every known resource.
+                Defaults to None.
+        """
+        self.high_water_mark = high_water_mark
+        self.ids = None if ids is None else set(ids)
+
+
+class SyncStateStore:
+    """Store the state of delta syncs of each resource type in a JSON file."""
+
+    def __init__(self, path: Path | str) -> None:
+        """Store the state of delta syncs in a JSON file.
+
+        Args:
+            path (Path | str): The path of the file. It is created when state is
+                first saved.
+        """
+        self.path = Path(path)
+
+    def _read(self) -> dict[str, Any]:
+        if not self.path.exists():
+            return {}
+        with open(self.path, encoding="utf8") as f:
+            data: dict[str, Any] = json.load(f)
+        return data
+
+    def load(self, resource: str) -> SyncState:
+        """Return the saved state for resource, empty if none has been saved."""
+        state = self._read().get(resource, {})
+        return SyncState(state.get("high_water_mark"), state.get("ids"))
+
+    def _write(self, data: dict[str, Any]) -> None:
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf8") as f:
+            json.dump(data, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def save(self, resource: str, state: SyncState) -> None:
+        """Save the state for resource, replacing the file atomically."""
+        data = self._read()
+        data[resource] = {
+            "high_water_mark": state.high_water_mark,
+            "ids": None if state.ids is None else sorted(state.ids),
+        }
+        self._write(data)
+
+    def clear(self, resource: str) -> None:
+        """Remove the saved state for resource so the next sync is a full one."""
+        data = self._read()
+        if data.pop(resource, None) is not None:
+            self._write(data)
+
+
+class SyncResult:
+    """The changes found by a delta sync.
+
+    Attributes:
+        upserts (list[dict[str, Any]]): Resources created or updated since the
+            previous sync, as plain dicts. Resources updated during the overlap
+            window may also have been returned by the previous sync.
+        deleted_ids (list[int]): The IDs of resources deleted since the previous
+            sync. Always empty if deletions were not checked or no previous sync
+            recorded IDs.
+        high_water_mark (str | None): The high water mark saved for the next sync
+            by commit.
+        ids (set[int] | None): The resource IDs saved for the next sync by commit.
+    """
+
+    def __init__(
+        self,
+        upserts: list[dict[str, Any]],
+        deleted_ids: list[int],
+        high_water_mark: str | None,
+        ids: Iterable[int] | None = None,
+        store: SyncStateStore | None = None,
+        resource: str | None = None,
+    ) -> None:
+        """Create the result of a delta sync.
+
+        Args:
+            upserts (list[dict[str, Any]]): The created or updated resources.
+            deleted_ids (list[int]): The IDs of deleted resources.
+            high_water_mark (str | None): The high water mark for the next sync.
+            ids (Iterable[int] | None, optional): The IDs of every known resource.
+                Defaults to None.
+            store (SyncStateStore | None, optional): The store the state of the
+                sync is saved to by commit. Defaults to None.
+            resource (str | None, optional): The resource type the state is saved
+                under. Defaults to None.
+        """
+        self.upserts = upserts
+        self.deleted_ids = deleted_ids
+        self.high_water_mark = high_water_mark
+        self.ids = None if ids is None else set(ids)
+        self._store = store
+        self._resource = resource
+
+    def commit(self) -> None:
+        """Save the state of the sync so the next sync starts after these changes.
+
+        Call this only once the upserts and deletions have been applied.
+        """
+        if self._store is None or self._resource is None:
+            return
+        self._store.save(self._resource, SyncState(self.high_water_mark, self.ids))
+
+
+def updated_at_min(high_water_mark: str | None, overlap: dt.timedelta) -> str | None:
+    """Return the updated_at_min to request for a sync.
+
+    The high water mark is moved back by overlap so that resources updated while
+    the previous sync was paginating, or saved with a slightly earlier timestamp,
+    are not missed.
+
+    Args:
+        high_water_mark (str | None): The latest updated_at time previously seen.
+        overlap (dt.timedelta): How far to look back before the high water mark.
+
+    Returns:
+        str | None: An ISO 8601 time, or None if no previous sync has run.
+    """
+    if high_water_mark is None:
+        return None
+    return (dt.datetime.fromisoformat(high_water_mark) - overlap).isoformat()
+
+
+def _is_later(timestamp: str | None, than: str | None) -> bool:
+    if timestamp is None:
+        return False
+    if than is None:
+        return True
+    return dt.datetime.fromisoformat(timestamp) > dt.datetime.fromisoformat(than)
+
+
+def _iter_ids(resource_class: type[shopify.ShopifyResource], **query: Any) -> set[int]:
+    items: Iterator[dict[str, Any]] = request.iter_paginated_request(
+        request.RawFinder(resource_class),
+        limit=request.MAX_PAGE_LIMIT,
+        fields=["id"],
+        **query,
+    )  # type: ignore[assignment]
+    return {item["id"] for item in items}
+
+
+def _fetch_changed(
+    resource_class: type[shopify.ShopifyResource],
+    since: str | None,
+    fields: Iterable[str] | None,
+    **query: Any,
+) -> list[dict[str, Any]]:
+    if since is not None:
+        query["updated_at_min"] = since
+    if fields is not None:
+        fields = list(dict.fromkeys(["id", "updated_at", *fields]))
+    items: Iterator[dict[str, Any]] = request.iter_paginated_request(
+        request.RawFinder(resource_class),
+        limit=request.MAX_PAGE_LIMIT,
+        fields=fields,
+        **query,
+    )  # type: ignore[assignment]
+    # A resource updated while pages are fetched can appear on more than one page.
+    return list({item["id"]: item for item in items}.values())
+
+
+def _sync(
+    resource: str,
+    store: SyncStateStore,
+    fetch_changed: Callable[[str | None], list[dict[str, Any]]],
+    fetch_ids: Callable[[], set[int]] | None,
+    overlap: dt.timedelta,
+    get_upserts: Callable[[list[dict[str, Any]]], list[dict[str, Any]]] = list,
+) -> SyncResult:
+    state = store.load(resource)
+    changed = fetch_changed(updated_at_min(state.high_water_mark, overlap))
+    high_water_mark = state.high_water_mark
+    for item in changed:
+        if _is_later(item.get("updated_at"), high_water_mark):
+            high_water_mark = item["updated_at"]
+    upserts = get_upserts(changed)
+    deleted_ids: list[int] = []
+    ids = state.ids
+    if fetch_ids is not None:
+        ids = fetch_ids()
+        if state.ids is not None:
+            deleted_ids = sorted(state.ids - ids)
+    return SyncResult(upserts, deleted_ids, high_water_mark, ids, store, resource)
+
+
+def sync_products(
+    store: SyncStateStore,
+    fields: Iterable[str] | None = None,
+    detect_deletions: bool = False,
+    overlap: dt.timedelta = OVERLAP,
+) -> SyncResult:
+    """Return the products created, updated or deleted since the last sync.
+
+    The first sync for a store returns every product. Later syncs request only
+    products updated after the saved high water mark, less overlap. The high water
+    mark is taken from the updated_at times returned by Shopify rather than the
+    local clock, so clock skew between the two does not cause changes to be
+    missed. Upserts should be applied idempotently as the overlap can return a
+    resource more than once. Call commit on the result once it has been applied.
+
+    Args:
+        store (SyncStateStore): The store holding the state of previous syncs.
+        fields (Iterable[str] | None, optional): The product fields to return. The
+            id and updated_at fields are always included. All fields are returned
+            if None. Defaults to None.
+        detect_deletions (bool, optional): If True the ID of every product is
+            requested and compared with those seen by the previous sync. This
+            pages through every product, so it is off by default. Defaults to
+            False.
+        overlap (dt.timedelta, optional): How far before the high water mark to
+            request changes from. Defaults to OVERLAP.
+    """
+    return _sync(
+        PRODUCTS,
+        store,
+        fetch_changed=lambda since: _fetch_changed(shopify.Product, since, fields),
+        fetch_ids=(lambda: _iter_ids(shopify.Product)) if detect_deletions else None,
+        overlap=overlap,
+    )
+
+
+def sync_variants(
+    store: SyncStateStore,
+    detect_deletions: bool = False,
+    overlap: dt.timedelta = OVERLAP,
+) -> SyncResult:
+    """Return the variants created, updated or deleted since the last sync.
+
+    Variants can not be requested by update time, so the variants of the products
+    updated since the last sync are returned and the high water mark is that of
+    the products. Changes to a variant's inventory levels do not update its
+    product and are not returned.
+
+    Args:
+        store (SyncStateStore): The store holding the state of previous syncs.
+        detect_deletions (bool, optional): If True the ID of every variant is
+            requested and compared with those seen by the previous sync. This
+            pages through every variant, so it is off by default. Defaults to
+            False.
+        overlap (dt.timedelta, optional): How far before the high water mark to
+            request changes from. Defaults to OVERLAP.
+    """
+    return _sync(
+        VARIANTS,
+        store,
+        fetch_changed=lambda since: _fetch_changed(
+            shopify.Product, since, ["variants"]
+        ),
+        fetch_ids=(lambda: _iter_ids(shopify.Variant)) if detect_deletions else None,
+        overlap=overlap,
+        get_upserts=lambda changed: [
+            variant for product in changed for variant in product["variants"]
+        ],
+    )
+
+
+def sync_orders(
+    store: SyncStateStore,
+    fields: Iterable[str] | None = None,
+    detect_deletions: bool = False,
+    overlap: dt.timedelta = OVERLAP,
+) -> SyncResult:
+    """Return the orders created, updated or deleted since the last sync.
+
+    Orders of any status are included. See sync_products for how changes are
+    found.
+
+    Args:
+        store (SyncStateStore): The store holding the state of previous syncs.
+        fields (Iterable[str] | None, optional): The order fields to return. The id
+            and updated_at fields are always included. All fields are returned if
+            None. Defaults to None.
+        detect_deletions (bool, optional): If True the ID of every order is
+            requested and compared with those seen by the previous sync. Orders
+            are rarely deleted so this is off by default. Defaults to False.
+        overlap (dt.timedelta, optional): How far before the high water mark to
+            request changes from. Defaults to OVERLAP.
+    """
+    return _sync(
+        ORDERS,
+        store,
+        fetch_changed=lambda since: _fetch_changed(
+            shopify.Order, since, fields, status="any"
+        ),
+        fetch_ids=(
+            (lambda: _iter_ids(shopify.Order, status="any"))
+            if detect_deletions
+            else None
+        ),
+        overlap=overlap,
+    )
@@ -0,0 +1,221 @@
+"""Pooled keep-alive HTTP transport for the Shopify REST API."""
+
+import http.client
+import threading
+import urllib.error
+import urllib.request
+from email.message import Message
+from typing import Any
+
+from shopify import base
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 30.0
+
+_PoolKey = tuple[str, str]
+
+
+class ConnectionPool:
+    """A thread safe pool of persistent HTTP connections.
+
+    Idle connections are kept open per scheme and host so that successive requests
+    reuse the same TCP and TLS session instead of performing a new handshake.
+    """
+
+    def __init__(
+        self, size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT
+    ) -> None:
+        """Create a thread safe pool of persistent HTTP connections.
+
+        Args:
+            size (int): The maximum number of idle connections kept per host.
+            timeout (float): The socket timeout for connections in seconds.
+        """
+        self.size = size
+        self.timeout = timeout
+        self._idle: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, scheme: str, host: str) -> tuple[http.client.HTTPConnection, bool]:
+        """Return a connection to host and whether it was reused from the pool."""
+        with self._lock:
+            idle = self._idle.get((scheme, host))
+            if idle:
+                return idle.pop(), True
+        return self.new_connection(scheme, host), False
+
+    def new_connection(self, scheme: str, host: str) -> http.client.HTTPConnection:
+        """Return a new, unconnected, connection to host."""
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, timeout=self.timeout)
+        return http.client.HTTPConnection(host, timeout=self.timeout)
+
+    def release(
+        self, scheme: str, host: str, connection: http.client.HTTPConnection
+    ) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._lock:
+            idle = self._idle.setdefault((scheme, host), [])
+            if len(idle) < self.size:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def idle_count(self, scheme: str, host: str) -> int:
+        """Return the number of idle connections held for host."""
+        with self._lock:
+            return len(self._idle.get((scheme, host), []))
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+class PooledResponse:
+    """Adapt a http.client.HTTPResponse to the interface pyactiveresource expects.
+
+    Closing the response releases its connection back to the pool if the server
+    allows it to be kept alive.
+    """
+
+    def __init__(
+        self,
+        response: http.client.HTTPResponse,
+        url: str,
+        release: Any,
+    ) -> None:
+        """Adapt a http.client.HTTPResponse to the interface pyactiveresource expects.
+
+        Args:
+            response (http.client.HTTPResponse): The response to adapt.
+            url (str): The requested URL.
+            release (Callable): Called with reusable=bool when the response is
+                closed.
+        """
+        self._response = response
+        self._release = release
+        self.url = url
+        self.code = response.status
+        self.msg = response.reason
+        self.headers: Message = response.headers
+
+    def read(self) -> bytes:
+        """Return the body of the response."""
+        return self._response.read()
+
+    def close(self) -> None:
+        """Close the response and release its connection."""
+        if self._release is None:
+            return
+        release, self._release = self._release, None
+        self._response.read()
+        release(reusable=not self._response.will_close)
+
+
+class PooledShopifyConnection(base.ShopifyConnection):
+    """A shopify connection that sends requests over pooled keep-alive connections."""
+
+    pool = ConnectionPool()
+
+    STALE_CONNECTION_ERRORS = (
+        http.client.RemoteDisconnected,
+        ConnectionResetError,
+        BrokenPipeError,
+    )
+    IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+    def _urlopen(self, request: urllib.request.Request) -> PooledResponse:
+        """Send request over a pooled connection.
+
+        A connection reused from the pool may have been closed by the server while
+        it was idle, in which case a request with an idempotent method is sent once
+        more over a new connection. Other requests may already have been applied
+        by the server, so the error is raised instead.
+
+        Raises:
+            urllib.error.URLError: If the request could not be sent.
+        """
+        scheme, host = request.type, request.host
+        connection, reused = self.pool.get(scheme, host)
+        try:
+            try:
+                response = self._send(connection, request)
+            except self.STALE_CONNECTION_ERRORS:
+                if not reused or request.get_method() not in self.IDEMPOTENT_METHODS:
+                    raise
+                connection.close()
+                connection = self.pool.new_connection(scheme, host)
+                response = self._send(connection, request)
+        except (OSError, http.client.HTTPException) as error:
+            connection.close()
+            raise urllib.error.URLError(error) from error
+
+        def release(reusable: bool) -> None:
+            if reusable:
+                self.pool.release(scheme, host, connection)
+            else:
+                connection.close()
+
+        return PooledResponse(response, url=request.full_url, release=release)
+
+    def _handle_error(self, err: Any) -> Any:
+        try:
+            return super()._handle_error(err)
+        except Exception:
+            if isinstance(err, PooledResponse):
+                err.close()
+            raise
+
+    @staticmethod
+    def _send(
+        connection: http.client.HTTPConnection, request: urllib.request.Request
+    ) -> http.client.HTTPResponse:
+        headers = dict(request.header_items())
+        connection.request(
+            request.get_method(),
+            request.selector,
+            body=request.data,  # type: ignore[arg-type]
+            headers=headers,
+        )
+        return connection.getresponse()
+
+
+_default_connection_class = base.ShopifyConnection
+_install_count = 0
+_install_lock = threading.Lock()
+
+
+def install(
+    pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT
+) -> None:
+    """Send Shopify API requests over the shared pool of keep-alive connections.
+
+    The pooled connection is used by every thread until uninstall has been called
+    once for each call to install, so nested and concurrent sessions do not turn
+    pooling off for each other.
+
+    Args:
+        pool_size (int): The maximum number of idle connections kept per host.
+        timeout (float): The socket timeout for connections in seconds.
+    """
+    global _install_count
+    with _install_lock:
+        PooledShopifyConnection.pool.size = pool_size
+        PooledShopifyConnection.pool.timeout = timeout
+        _install_count += 1
+        base.ShopifyConnection = PooledShopifyConnection  # type: ignore[misc]
+
+
+def uninstall() -> None:
+    """Restore the default, unpooled, shopify connection once no install remains."""
+    global _install_count
+    with _install_lock:
+        if _install_count == 0:
+            return
+        _install_count -= 1
+        if _install_count == 0:
+            base.ShopifyConnection = _default_connection_class  # type: ignore[misc]
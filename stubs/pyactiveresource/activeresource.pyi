@@ -1 +1,27 @@
-class ActiveResource: ...
+from typing import Any
+
+class Errors:
+    def full_messages(self) -> list[str]: ...
+
+class ActiveResource:
+    id: Any
+    attributes: dict[str, Any]
+    errors: Errors
+    format: Any
+    def to_dict(self) -> dict[str, Any]: ...
+    def destroy(self) -> None: ...
+    @classmethod
+    def _split_options(cls, options: dict[str, Any]) -> list[dict[str, Any]]: ...
+    @classmethod
+    def _element_path(
+        cls,
+        id_: Any,
+        prefix_options: dict[str, Any] | None = ...,
+        query_options: dict[str, Any] | None = ...,
+    ) -> str: ...
+    @classmethod
+    def _collection_path(
+        cls,
+        prefix_options: dict[str, Any] | None = ...,
+        query_options: dict[str, Any] | None = ...,
+    ) -> str: ...
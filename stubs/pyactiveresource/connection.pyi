@@ -1,4 +1,38 @@
-class Error(Exception): ...
-class ConnectionError(Error): ...
+from typing import Any
+
+class Error(Exception):
+    url: str | None
+    code: int | None
+
+class ConnectionError(Error):
+    response: Response
+
 class ClientError(ConnectionError): ...
 class ResourceNotFound(ClientError): ...
+
+class Response:
+    code: int | None
+    msg: str
+    body: bytes
+    headers: dict[str, str]
+    def get(self, key: str, value: str | None = ...) -> str | None: ...
+
+class Connection:
+    site: str
+    timeout: float | None
+    def __init__(
+        self,
+        site: str,
+        user: str | None = ...,
+        password: str | None = ...,
+        timeout: float | None = ...,
+        format: Any = ...,
+    ) -> None: ...
+    def get(self, path: str, headers: dict[str, str] | None = ...) -> Response: ...
+    def post(
+        self,
+        path: str,
+        headers: dict[str, str] | None = ...,
+        data: bytes | None = ...,
+    ) -> Response: ...
+    def _handle_error(self, err: Any) -> Any: ...
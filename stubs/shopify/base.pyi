@@ -4,11 +4,18 @@ from typing import Any
 import shopify.mixins as mixins
 from pyactiveresource.activeresource import ActiveResource
 from pyactiveresource.collection import Collection
+from pyactiveresource.connection import Connection, Response
 from shopify.collection import PaginatedCollection
 
 from .session import Session
 
+class ShopifyConnection(Connection):
+    response: Response | None
+
 class ShopifyResource(ActiveResource, mixins.Countable):
+    site: str | None
+    connection: ShopifyConnection
+    headers: dict[str, str]
     def __init__(
         self, attributes: Any | None = ..., prefix_options: Any | None = ...
     ): ...
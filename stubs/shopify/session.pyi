@@ -6,6 +6,7 @@ class Session:
     port: int | None
 
     url: str | None
+    site: str
     token: str | None
     version: str | None
     def __init__(
@@ -0,0 +1 @@
+"""Tests for the shopify_api_py.aio package."""
@@ -0,0 +1,87 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from shopify_api_py import request
+from shopify_api_py.aio import AsyncShopifyAPISession
+from shopify_api_py.session import ShopifyAPISession
+
+SHOP_URL = "test-shop.myshopify.com"
+API_VERSION = "2023-01"
+API_ROOT = f"https://{SHOP_URL}/admin/api/{API_VERSION}/"
+
+
+class StubShop:
+    """A local stub of the Shopify REST API."""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def add(self, method, path, *responses):
+        self.routes.setdefault((method, path), []).extend(responses)
+
+    def handler(self, request):
+        self.requests.append(request)
+        path = str(request.url).removeprefix(API_ROOT).split("?")[0]
+        responses = self.routes.get((request.method, path))
+        if not responses:
+            return httpx.Response(404, json={"errors": "Not Found"})
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        if isinstance(response, Exception):
+            raise response
+        status, body, headers = response
+        return httpx.Response(status, content=json.dumps(body), headers=headers)
+
+    def requested(self, method, path):
+        return [
+            request
+            for request in self.requests
+            if request.method == method
+            and str(request.url).removeprefix(API_ROOT).split("?")[0] == path
+        ]
+
+
+def page(resource_key, items, next_page_info=None, status=200):
+    headers = {"X-Shopify-Shop-Api-Call-Limit": "1/40"}
+    if next_page_info is not None:
+        headers["Link"] = (
+            f'<{API_ROOT}products.json?page_info={next_page_info}&limit=2>; rel="next"'
+        )
+    return (status, {resource_key: items}, headers)
+
+
+@pytest.fixture
+def stub_shop():
+    return StubShop()
+
+
+@pytest.fixture(autouse=True)
+def credentials():
+    ShopifyAPISession.set_login(
+        shop_url=SHOP_URL, api_version=API_VERSION, api_password="password"
+    )
+    yield
+    ShopifyAPISession.set_login()
+
+
+@pytest.fixture(autouse=True)
+def call_limiter():
+    with patch("shopify_api_py.request.call_limiter", request.CallLimiter()) as limiter:
+        yield limiter
+
+
+@pytest.fixture
+def run(stub_shop):
+    def run(coroutine_function, *args, **kwargs):
+        async def main():
+            transport = httpx.MockTransport(stub_shop.handler)
+            async with AsyncShopifyAPISession(transport=transport):
+                return await coroutine_function(*args, **kwargs)
+
+        return asyncio.run(main())
+
+    return run
@@ -0,0 +1,14 @@
+import json
+
+from shopify_api_py.aio import fulfillment
+
+
+def test_create_fulfill_order(run, stub_shop):
+    stub_shop.add(
+        "POST", "orders/1/fulfillments.json", (201, {"fulfillment": {"id": 3}}, {})
+    )
+    returned_value = fulfillment.create_fulfill_order
+    assert run(returned_value, order_id=1, location_id=2) == {"id": 3}
+    assert json.loads(stub_shop.requests[0].content) == {
+        "fulfillment": {"location_id": "2"}
+    }
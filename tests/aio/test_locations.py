@@ -0,0 +1,8 @@
+from shopify_api_py.aio import locations
+
+from .conftest import page
+
+
+def test_get_inventory_locations(run, stub_shop):
+    stub_shop.add("GET", "locations.json", page("locations", [{"id": 1}]))
+    assert run(locations.get_inventory_locations) == [{"id": 1}]
@@ -0,0 +1,9 @@
+from shopify_api_py.aio import orders
+
+from .conftest import page
+
+
+def test_get_all_orders(run, stub_shop):
+    stub_shop.add("GET", "orders.json", page("orders", [{"id": 1}, {"id": 2}]))
+    assert run(orders.get_all_orders, limit=250) == [{"id": 1}, {"id": 2}]
+    assert stub_shop.requests[0].url.params["limit"] == "250"
@@ -0,0 +1,182 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from shopify_api_py import exceptions
+from shopify_api_py import products as sync_products
+from shopify_api_py.aio import products
+
+from .conftest import page
+
+
+@pytest.fixture
+def product_id():
+    return 68156156486
+
+
+@pytest.fixture
+def collection_id():
+    return 684616516516
+
+
+def test_get_all_products(run, stub_shop):
+    stub_shop.add("GET", "products.json", page("products", [{"id": 1}, {"id": 2}]))
+    assert run(products.get_all_products) == [{"id": 1}, {"id": 2}]
+
+
+def test_iter_all_products(run, stub_shop):
+    stub_shop.add("GET", "products.json", page("products", [{"id": 1}, {"id": 2}]))
+
+    async def collect():
+        return [product async for product in products.iter_all_products()]
+
+    assert run(collect) == [{"id": 1}, {"id": 2}]
+
+
+def test_get_product_by_id(run, stub_shop, product_id):
+    stub_shop.add(
+        "GET", f"products/{product_id}.json", (200, {"product": {"id": product_id}}, {})
+    )
+    assert run(products.get_product_by_id, product_id) == {"id": product_id}
+
+
+def test_get_product_by_id_raises_product_not_found_error(run, product_id):
+    with pytest.raises(exceptions.ProductNotFoundError):
+        run(products.get_product_by_id, product_id)
+
+
+def test_get_variant_by_id_raises_variant_not_found_error(run):
+    with pytest.raises(exceptions.VariantNotFoundError):
+        run(products.get_variant_by_id, 1)
+
+
+def test_set_stock_level(run, stub_shop):
+    stub_shop.add(
+        "POST",
+        "inventory_levels/set.json",
+        (200, {"inventory_level": {"available": 5}}, {}),
+    )
+    returned_value = run(
+        products.set_stock_level,
+        location_id=1,
+        inventory_item_id=2,
+        new_stock_level=5,
+    )
+    assert returned_value == {"available": 5}
+    assert json.loads(stub_shop.requests[0].content) == {
+        "location_id": 1,
+        "inventory_item_id": 2,
+        "available": 5,
+    }
+
+
+def test_set_customs_information_does_not_read_inventory_item(run, stub_shop):
+    stub_shop.add("PUT", "inventory_items/1.json", (200, {"inventory_item": {}}, {}))
+    run(
+        products.set_customs_information,
+        inventory_item_id=1,
+        country_of_origin_code="GB",
+        hs_code="999999",
+    )
+    assert len(stub_shop.requests) == 1
+    assert json.loads(stub_shop.requests[0].content) == {
+        "inventory_item": {
+            "id": 1,
+            "country_code_of_origin": "GB",
+            "harmonized_system_code": "999999",
+        }
+    }
+
+
+def test_create_product_sends_variants_and_options(run, stub_shop):
+    stub_shop.add("POST", "products.json", (201, {"product": {"id": 1}}, {}))
+    options = sync_products.create_options({"Size": ["Small"]})
+    variants = [
+        sync_products.create_variation(
+            sku="SKU_1", option_values=["Small"], barcode="1", grams=5, price=1.5
+        )
+    ]
+    returned_value = run(
+        products.create_product,
+        title="Title",
+        body_html="<p></p>",
+        vendor="Vendor",
+        options=options,
+        variants=variants,
+        tags=["Tag1", "Tag2"],
+    )
+    assert returned_value == {"id": 1}
+    sent = json.loads(stub_shop.requests[0].content)["product"]
+    assert sent["tags"] == "Tag1,Tag2"
+    assert sent["options"] == [{"name": "Size", "values": ["Small"]}]
+    assert sent["variants"][0]["sku"] == "SKU_1"
+
+
+def test_create_product_raises_for_unsuccessful_response(run, stub_shop):
+    stub_shop.add("POST", "products.json", (422, {"errors": {}}, {}))
+    with pytest.raises(exceptions.ResponseError):
+        run(products.create_product, title="Title", body_html="", vendor="Vendor")
+
+
+@patch("shopify_api_py.aio.request.asyncio.sleep")
+def test_create_product_retries_throttled_requests(mock_sleep, run, stub_shop):
+    stub_shop.add(
+        "POST",
+        "products.json",
+        (429, {}, {"Retry-After": "1.0"}),
+        (201, {"product": {"id": 1}}, {}),
+    )
+    returned_value = run(
+        products.create_product, title="Title", body_html="", vendor="Vendor"
+    )
+    assert returned_value == {"id": 1}
+    assert len(stub_shop.requested("POST", "products.json")) == 2
+
+
+def test_create_product_does_not_retry_server_errors(run, stub_shop):
+    stub_shop.add(
+        "POST", "products.json", (503, {}, {}), (201, {"product": {"id": 1}}, {})
+    )
+    with pytest.raises(exceptions.ResponseError):
+        run(products.create_product, title="Title", body_html="", vendor="Vendor")
+    assert len(stub_shop.requested("POST", "products.json")) == 1
+
+
+def test_remove_product_from_collection_deletes_collects(
+    run, stub_shop, product_id, collection_id
+):
+    stub_shop.add("GET", "collects.json", page("collects", [{"id": 1}, {"id": 2}]))
+    stub_shop.add("DELETE", "collects/1.json", (200, {}, {}))
+    stub_shop.add("DELETE", "collects/2.json", (200, {}, {}))
+    run(
+        products.remove_product_from_collection,
+        product_id=product_id,
+        collection_id=collection_id,
+    )
+    assert len(stub_shop.requested("DELETE", "collects/1.json")) == 1
+    assert len(stub_shop.requested("DELETE", "collects/2.json")) == 1
+
+
+def test_remove_product_from_collection_raises_if_no_collects_are_found(
+    run, stub_shop, product_id, collection_id
+):
+    stub_shop.add("GET", "collects.json", page("collects", []))
+    with pytest.raises(exceptions.ResponseError):
+        run(
+            products.remove_product_from_collection,
+            product_id=product_id,
+            collection_id=collection_id,
+        )
+
+
+def test_get_products_in_custom_collection(run, stub_shop, collection_id):
+    stub_shop.add(
+        "GET",
+        "collects.json",
+        page("collects", [{"product_id": 1}, {"product_id": 2}]),
+    )
+    assert run(products.get_products_in_custom_collection, collection_id) == [1, 2]
+    params = stub_shop.requests[0].url.params
+    assert params["collection_id"] == str(collection_id)
+    assert params["fields"] == "product_id"
@@ -0,0 +1,154 @@
+import asyncio
+from unittest.mock import call, patch
+
+import httpx
+import pytest
+
+from shopify_api_py import exceptions
+from shopify_api_py import request as sync_request
+from shopify_api_py.aio import request
+
+from .conftest import API_ROOT, page
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep():
+    with patch("shopify_api_py.aio.request.asyncio.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+def test_make_request_returns_response(run, stub_shop):
+    stub_shop.add("GET", "shop.json", (200, {"shop": {"id": 1}}, {}))
+    response = run(request.make_request, "GET", "shop.json")
+    assert response.json() == {"shop": {"id": 1}}
+
+
+def test_make_request_raises_for_error_status(run, stub_shop):
+    stub_shop.add("GET", "shop.json", (500, {}, {}))
+    with pytest.raises(exceptions.ResponseStatusError) as e:
+        run(request.make_request, "GET", "shop.json")
+    assert e.value.status_code == 500
+
+
+def test_make_request_does_not_retry_without_policy(run, stub_shop):
+    stub_shop.add("POST", "orders.json", (503, {}, {}), (201, {}, {}))
+    with pytest.raises(exceptions.ResponseStatusError):
+        run(request.make_request, "POST", "orders.json")
+    assert len(stub_shop.requests) == 1
+
+
+def test_make_request_retries_with_policy(run, stub_shop, mock_sleep):
+    stub_shop.add(
+        "GET",
+        "shop.json",
+        (429, {}, {"Retry-After": "2.0"}),
+        (200, {"shop": {"id": 1}}, {}),
+    )
+    response = run(
+        request.make_request,
+        "GET",
+        "shop.json",
+        retry_policy=sync_request.RetryPolicy(),
+    )
+    assert response.json() == {"shop": {"id": 1}}
+    assert call(2.0) in mock_sleep.call_args_list
+
+
+def test_make_request_updates_call_limiter(run, stub_shop, call_limiter):
+    stub_shop.add(
+        "GET",
+        "shop.json",
+        (200, {"shop": {}}, {"X-Shopify-Shop-Api-Call-Limit": "30/40"}),
+    )
+    run(request.make_request, "GET", "shop.json")
+    assert call_limiter.level(API_ROOT) == pytest.approx(30, abs=1)
+
+
+def test_make_request_retries_transport_errors(run, stub_shop):
+    stub_shop.add(
+        "GET",
+        "shop.json",
+        httpx.ConnectTimeout("Timeout"),
+        (200, {"shop": {"id": 1}}, {}),
+    )
+    response = run(
+        request.make_request,
+        "GET",
+        "shop.json",
+        retry_policy=sync_request.RetryPolicy(),
+    )
+    assert response.json() == {"shop": {"id": 1}}
+
+
+def test_make_request_does_not_retry_transport_errors_if_policy_forbids(run, stub_shop):
+    stub_shop.add(
+        "POST",
+        "products.json",
+        httpx.ReadTimeout("Timeout"),
+        (201, {"product": {"id": 1}}, {}),
+    )
+    with pytest.raises(httpx.ReadTimeout):
+        run(
+            request.make_request,
+            "POST",
+            "products.json",
+            retry_policy=sync_request.throttle_retry_policy,
+        )
+    assert len(stub_shop.requests) == 1
+
+
+def test_make_paginated_request_follows_next_page_links(run, stub_shop):
+    stub_shop.add(
+        "GET",
+        "products.json",
+        page("products", [{"id": 1}, {"id": 2}], next_page_info="abc"),
+        page("products", [{"id": 3}]),
+    )
+    returned_value = run(
+        request.make_paginated_request, "products.json", "products", limit=2
+    )
+    assert returned_value == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert stub_shop.requests[0].url.params["limit"] == "2"
+    assert stub_shop.requests[1].url.params["page_info"] == "abc"
+
+
+def test_make_paginated_request_sends_fields(run, stub_shop):
+    stub_shop.add("GET", "products.json", page("products", [{"id": 1}]))
+    run(request.make_paginated_request, "products.json", "products", fields=["id"])
+    assert stub_shop.requests[0].url.params["fields"] == "id"
+
+
+def test_make_paginated_request_stops_after_max_pages(run, stub_shop):
+    stub_shop.add(
+        "GET", "products.json", page("products", [{"id": 1}], next_page_info="abc")
+    )
+    with pytest.raises(exceptions.TooManyPageRequestsError):
+        run(request.make_paginated_request, "products.json", "products", max_pages=2)
+
+
+def test_get_resource_returns_none_when_not_found(run, stub_shop):
+    assert run(request.get_resource, "products/1.json", "product") is None
+
+
+def test_get_resource_shares_concurrent_requests(run, stub_shop):
+    stub_shop.add("GET", "products/1.json", (200, {"product": {"id": 1}}, {}))
+
+    async def get_twice():
+        return await asyncio.gather(
+            request.get_resource("products/1.json", "product"),
+            request.get_resource("products/1.json", "product"),
+        )
+
+    assert run(get_twice) == [{"id": 1}, {"id": 1}]
+    assert len(stub_shop.requested("GET", "products/1.json")) == 1
+
+
+def test_get_resource_does_not_share_sequential_requests(run, stub_shop):
+    stub_shop.add("GET", "products/1.json", (200, {"product": {"id": 1}}, {}))
+
+    async def get_twice():
+        await request.get_resource("products/1.json", "product")
+        await request.get_resource("products/1.json", "product")
+
+    run(get_twice)
+    assert len(stub_shop.requested("GET", "products/1.json")) == 2
@@ -0,0 +1,56 @@
+import asyncio
+
+import httpx
+import pytest
+
+from shopify_api_py import exceptions
+from shopify_api_py.aio import session
+
+from .conftest import API_ROOT
+
+
+def test_session_sets_active_client(stub_shop):
+    async def main():
+        transport = httpx.MockTransport(stub_shop.handler)
+        async with session.AsyncShopifyAPISession(transport=transport) as client:
+            assert session.get_client() is client
+            return client
+
+    client = asyncio.run(main())
+    assert client.is_closed
+
+
+def test_session_client_uses_api_root(stub_shop):
+    async def main():
+        transport = httpx.MockTransport(stub_shop.handler)
+        async with session.AsyncShopifyAPISession(transport=transport) as client:
+            return client
+
+    client = asyncio.run(main())
+    assert str(client.base_url) == API_ROOT
+
+
+def test_session_client_sends_access_token(stub_shop):
+    async def main():
+        transport = httpx.MockTransport(stub_shop.handler)
+        async with session.AsyncShopifyAPISession(transport=transport) as client:
+            await client.get("shop.json")
+
+    asyncio.run(main())
+    assert stub_shop.requests[0].headers["X-Shopify-Access-Token"] == "password"
+
+
+def test_get_client_raises_without_session():
+    with pytest.raises(exceptions.SessionNotActiveError):
+        session.get_client()
+
+
+def test_session_raises_without_credentials(stub_shop):
+    session.ShopifyAPISession.set_login()
+
+    async def main():
+        async with session.AsyncShopifyAPISession():
+            pass
+
+    with pytest.raises(exceptions.LoginCredentialsNotSetError):
+        asyncio.run(main())
@@ -0,0 +1,233 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import shopify
+
+from shopify_api_py import bulk, exceptions
+
+RESULT_LINES = [
+    {"id": "gid://shopify/Product/1", "title": "Shirt"},
+    {
+        "id": "gid://shopify/ProductVariant/11",
+        "sku": "SHIRT-S",
+        "inventoryItem": {"id": "gid://shopify/InventoryItem/111"},
+        "__parentId": "gid://shopify/Product/1",
+    },
+    {
+        "id": "gid://shopify/ProductVariant/12",
+        "sku": "SHIRT-M",
+        "inventoryItem": {"id": "gid://shopify/InventoryItem/112"},
+        "__parentId": "gid://shopify/Product/1",
+    },
+    {"id": "gid://shopify/Product/2", "title": "Hat"},
+    {
+        "id": "gid://shopify/ProductVariant/21",
+        "sku": "HAT",
+        "inventoryItem": {"id": "gid://shopify/InventoryItem/211"},
+        "__parentId": "gid://shopify/Product/2",
+    },
+]
+
+
+class FakeShopify:
+    def __init__(self):
+        self.statuses = ["RUNNING", "COMPLETED"]
+        self.user_errors = []
+        self.error_code = None
+        self.result_lines = RESULT_LINES
+        self.queries = []
+        self.url = None
+
+    def graphql(self, body):
+        self.queries.append(body)
+        if "bulkOperationCancel" in body["query"]:
+            self.statuses = ["CANCELING"]
+            return {
+                "data": {
+                    "bulkOperationCancel": {
+                        "bulkOperation": {"id": body["variables"]["id"]},
+                        "userErrors": [],
+                    }
+                }
+            }
+        if "bulkOperationRunQuery" in body["query"]:
+            return {
+                "data": {
+                    "bulkOperationRunQuery": {
+                        "bulkOperation": (
+                            None
+                            if self.user_errors
+                            else {"id": "gid://shopify/BulkOperation/1"}
+                        ),
+                        "userErrors": self.user_errors,
+                    }
+                }
+            }
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        completed = status == "COMPLETED"
+        return {
+            "data": {
+                "node": {
+                    "id": body["variables"]["id"],
+                    "status": status,
+                    "errorCode": self.error_code,
+                    "url": self.url if completed and self.result_lines else None,
+                }
+            }
+        }
+
+
+@pytest.fixture
+def fake_shopify():
+    return FakeShopify()
+
+
+@pytest.fixture
+def server(fake_shopify):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            body = json.loads(self.rfile.read(length))
+            self.respond(json.dumps(fake_shopify.graphql(body)).encode())
+
+        def do_GET(self):
+            lines = (json.dumps(line) for line in fake_shopify.result_lines)
+            self.respond("\n".join(lines).encode() + b"\n")
+
+        def respond(self, body):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    host, port = server.server_address
+    fake_shopify.url = f"http://{host}:{port}/results.jsonl"
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    shopify.ShopifyResource.site = f"http://{host}:{port}/admin/api/2024-01"
+    yield server
+    shopify.ShopifyResource.site = None
+    server.shutdown()
+    server.server_close()
+
+
+def test_iter_bulk_query_yields_products_with_variants(server):
+    products = list(bulk.iter_bulk_query("{ products }", poll_interval=0))
+    assert [product["title"] for product in products] == ["Shirt", "Hat"]
+    assert [variant["sku"] for variant in products[0]["variants"]] == [
+        "SHIRT-S",
+        "SHIRT-M",
+    ]
+    assert products[1]["variants"][0]["inventoryItem"]["id"] == (
+        "gid://shopify/InventoryItem/211"
+    )
+
+
+def test_parent_ids_are_removed_from_children(server):
+    products = list(bulk.iter_bulk_query("{ products }", poll_interval=0))
+    assert "__parentId" not in products[0]["variants"][0]
+
+
+def test_iter_bulk_query_submits_query(server, fake_shopify):
+    list(bulk.iter_bulk_query("{ products }", poll_interval=0))
+    assert fake_shopify.queries[0]["variables"] == {"query": "{ products }"}
+
+
+def test_iter_bulk_query_polls_until_completed(server, fake_shopify):
+    fake_shopify.statuses = ["CREATED", "RUNNING", "RUNNING", "COMPLETED"]
+    list(bulk.iter_bulk_query("{ products }", poll_interval=0))
+    assert len(fake_shopify.queries) == 5
+
+
+def test_iter_bulk_query_yields_nothing_without_results(server, fake_shopify):
+    fake_shopify.result_lines = []
+    assert list(bulk.iter_bulk_query("{ products }", poll_interval=0)) == []
+
+
+def test_failed_operation_raises_bulk_operation_error(server, fake_shopify):
+    fake_shopify.statuses = ["RUNNING", "FAILED"]
+    fake_shopify.error_code = "INTERNAL_SERVER_ERROR"
+    with pytest.raises(exceptions.BulkOperationError) as exc_info:
+        list(bulk.iter_bulk_query("{ products }", poll_interval=0))
+    assert exc_info.value.status == "FAILED"
+    assert exc_info.value.error_code == "INTERNAL_SERVER_ERROR"
+
+
+def test_user_errors_raise_bulk_operation_error(server, fake_shopify):
+    fake_shopify.user_errors = [{"field": None, "message": "Already running"}]
+    with pytest.raises(exceptions.BulkOperationError, match="Already running"):
+        list(bulk.iter_bulk_query("{ products }", poll_interval=0))
+
+
+def test_wait_for_bulk_operation_times_out(server, fake_shopify):
+    fake_shopify.statuses = ["RUNNING"]
+    with pytest.raises(exceptions.BulkOperationError):
+        bulk.wait_for_bulk_operation("gid://shopify/BulkOperation/1", 0, timeout=0)
+
+
+def test_wait_for_bulk_operation_cancels_operation_on_timeout(server, fake_shopify):
+    fake_shopify.statuses = ["RUNNING"]
+    with pytest.raises(exceptions.BulkOperationError):
+        bulk.wait_for_bulk_operation("gid://shopify/BulkOperation/1", 0, timeout=0)
+    assert "bulkOperationCancel" in fake_shopify.queries[-1]["query"]
+    assert fake_shopify.queries[-1]["variables"] == {
+        "id": "gid://shopify/BulkOperation/1"
+    }
+
+
+def test_wait_for_bulk_operation_can_leave_operation_running(server, fake_shopify):
+    fake_shopify.statuses = ["RUNNING"]
+    with pytest.raises(exceptions.BulkOperationError):
+        bulk.wait_for_bulk_operation(
+            "gid://shopify/BulkOperation/1", 0, timeout=0, cancel_on_timeout=False
+        )
+    assert all("bulkOperationCancel" not in q["query"] for q in fake_shopify.queries)
+
+
+def test_iter_bulk_results_passes_timeout():
+    with patch("shopify_api_py.bulk.urllib.request.urlopen") as mock_urlopen:
+        list(bulk.iter_bulk_results("https://example.com/results.jsonl", timeout=5))
+    mock_urlopen.assert_called_once_with("https://example.com/results.jsonl", timeout=5)
+
+
+def test_iter_bulk_records_nests_grandchildren():
+    lines = [
+        json.dumps({"id": "gid://shopify/Product/1"}),
+        json.dumps(
+            {
+                "id": "gid://shopify/ProductVariant/2",
+                "__parentId": "gid://shopify/Product/1",
+            }
+        ),
+        json.dumps(
+            {
+                "id": "gid://shopify/InventoryLevel/3",
+                "__parentId": "gid://shopify/ProductVariant/2",
+            }
+        ),
+    ]
+    (product,) = bulk.iter_bulk_records(lines)
+    assert product["variants"][0]["inventoryLevels"][0]["id"] == (
+        "gid://shopify/InventoryLevel/3"
+    )
+
+
+def test_iter_bulk_records_uses_type_name_for_unknown_children():
+    lines = [
+        json.dumps({"id": "gid://shopify/Order/1"}),
+        json.dumps(
+            {"id": "gid://shopify/Refund/2", "__parentId": "gid://shopify/Order/1"}
+        ),
+    ]
+    (order,) = bulk.iter_bulk_records(lines)
+    assert order["Refund"] == [{"id": "gid://shopify/Refund/2"}]
@@ -0,0 +1,346 @@
+import sqlite3
+from unittest.mock import Mock, patch
+
+import pytest
+from pyactiveresource.connection import ResourceNotFound
+
+from shopify_api_py import cache, products
+
+
+@pytest.fixture
+def product_list():
+    return [
+        {
+            "id": 1,
+            "handle": "first",
+            "variants": [
+                {"id": 11, "sku": "A", "inventory_item_id": 110},
+                {"id": 12, "sku": "B", "inventory_item_id": 120},
+            ],
+        },
+        {
+            "id": 2,
+            "handle": "second",
+            "variants": [{"id": 21, "sku": "A", "inventory_item_id": 210}],
+        },
+    ]
+
+
+@pytest.fixture
+def mock_make_paginated_request(product_list):
+    with patch("shopify_api_py.cache.request.make_paginated_request") as mock:
+        mock.return_value = product_list
+        yield mock
+
+
+@pytest.fixture
+def mock_find():
+    find = Mock()
+    with patch("shopify_api_py.cache.request.RawFinder") as mock_raw_finder:
+        mock_raw_finder.return_value = find
+        yield find
+
+
+@pytest.fixture
+def resource_cache(tmp_path):
+    resource_cache = cache.ResourceCache(tmp_path / "cache.db")
+    yield resource_cache
+    resource_cache.close()
+
+
+def test_database_uses_wal(resource_cache):
+    rows = resource_cache._query("PRAGMA journal_mode", [])
+    assert rows[0][0] == "wal"
+
+
+def test_first_read_fetches_resources(resource_cache, mock_make_paginated_request):
+    assert [product["id"] for product in resource_cache.get_all_products()] == [1, 2]
+    mock_make_paginated_request.assert_called_once()
+
+
+def test_reads_within_ttl_use_cache(resource_cache, mock_make_paginated_request):
+    resource_cache.get_all_products()
+    resource_cache.get_product(1)
+    resource_cache.get_all_products()
+    mock_make_paginated_request.assert_called_once()
+
+
+def test_new_cache_instance_reads_database(tmp_path, mock_make_paginated_request):
+    cache.ResourceCache(tmp_path / "cache.db", register=False).get_all_products()
+    warm = cache.ResourceCache(tmp_path / "cache.db", register=False)
+    assert warm.get_product(2)["handle"] == "second"
+    mock_make_paginated_request.assert_called_once()
+
+
+def test_expired_type_is_fetched_again(tmp_path, mock_make_paginated_request):
+    resource_cache = cache.ResourceCache(
+        tmp_path / "cache.db", ttls={cache.PRODUCTS: 10}, register=False
+    )
+    with patch("shopify_api_py.cache.time.time") as mock_time:
+        mock_time.return_value = 1000
+        resource_cache.get_all_products()
+        mock_time.return_value = 1011
+        resource_cache.get_all_products()
+    assert mock_make_paginated_request.call_count == 2
+
+
+def test_lookups(resource_cache, mock_make_paginated_request):
+    assert resource_cache.get_product(1)["handle"] == "first"
+    assert resource_cache.get_product(3) is None
+    assert resource_cache.get_product_by_handle("second")["id"] == 2
+    assert resource_cache.get_product_by_handle("third") is None
+    assert [variant["id"] for variant in resource_cache.get_variants_by_sku("A")] == [
+        11,
+        21,
+    ]
+    assert resource_cache.get_variants_by_sku("C") == []
+
+
+def test_collections_are_cached_separately(resource_cache, mock_make_paginated_request):
+    mock_make_paginated_request.return_value = [{"id": 5, "handle": "sale"}]
+    assert resource_cache.get_all_custom_collections() == [{"id": 5, "handle": "sale"}]
+    assert resource_cache.get_by_handle(cache.CUSTOM_COLLECTIONS, "sale")["id"] == 5
+    assert resource_cache.get(cache.SMART_COLLECTIONS, 5) == {"id": 5, "handle": "sale"}
+    assert mock_make_paginated_request.call_count == 2
+
+
+def test_invalidated_resource_is_fetched_before_next_read(
+    resource_cache, mock_make_paginated_request, mock_find
+):
+    resource_cache.get_all_products()
+    mock_find.return_value = {"id": 1, "handle": "renamed", "variants": []}
+    cache.invalidate(cache.PRODUCTS, 1)
+    assert resource_cache.get_product_by_handle("renamed")["id"] == 1
+    assert resource_cache.get_variants_by_sku("B") == []
+    mock_find.assert_called_once_with(id_=1)
+    resource_cache.get_product(1)
+    mock_find.assert_called_once()
+    mock_make_paginated_request.assert_called_once()
+
+
+def test_invalidated_deleted_resource_is_removed(
+    resource_cache, mock_make_paginated_request, mock_find
+):
+    resource_cache.get_all_products()
+    mock_find.side_effect = ResourceNotFound()
+    cache.invalidate(cache.PRODUCTS, 2)
+    assert resource_cache.get_product(2) is None
+
+
+def test_invalidating_inventory_item_refreshes_product(
+    resource_cache, mock_make_paginated_request, mock_find
+):
+    resource_cache.get_all_products()
+    mock_find.return_value = {"id": 2, "handle": "second", "variants": []}
+    cache.invalidate(cache.INVENTORY_ITEMS, 210)
+    resource_cache.get_all_products()
+    mock_find.assert_called_once_with(id_=2)
+
+
+def test_invalidating_type_reloads_it(resource_cache, mock_make_paginated_request):
+    resource_cache.get_all_products()
+    cache.invalidate(cache.PRODUCTS)
+    resource_cache.get_all_products()
+    assert mock_make_paginated_request.call_count == 2
+
+
+def test_invalidation_during_load_is_kept(
+    resource_cache, mock_make_paginated_request, mock_find, product_list
+):
+    def make_paginated_request(*args, **kwargs):
+        cache.invalidate(cache.PRODUCTS, 1)
+        return product_list
+
+    mock_make_paginated_request.side_effect = make_paginated_request
+    mock_find.return_value = {"id": 1, "handle": "renamed", "variants": []}
+    resource_cache.get_all_products()
+    assert resource_cache.get_product_by_handle("renamed")["id"] == 1
+    mock_find.assert_called_once_with(id_=1)
+
+
+def test_type_invalidation_during_load_is_kept(
+    resource_cache, mock_make_paginated_request, product_list
+):
+    def make_paginated_request(*args, **kwargs):
+        if mock_make_paginated_request.call_count == 1:
+            cache.invalidate(cache.PRODUCTS)
+        return product_list
+
+    mock_make_paginated_request.side_effect = make_paginated_request
+    resource_cache.get_all_products()
+    resource_cache.get_all_products()
+    resource_cache.get_all_products()
+    assert mock_make_paginated_request.call_count == 2
+
+
+def test_invalidation_during_refresh_is_kept(
+    resource_cache, mock_make_paginated_request, mock_find
+):
+    resource_cache.get_all_products()
+    cache.invalidate(cache.PRODUCTS, 1)
+
+    def find(id_):
+        if mock_find.call_count == 1:
+            cache.invalidate(cache.PRODUCTS, 1)
+        return {"id": 1, "handle": "first", "variants": []}
+
+    mock_find.side_effect = find
+    resource_cache.get_all_products()
+    resource_cache.get_all_products()
+    assert mock_find.call_count == 2
+
+
+def test_database_with_old_layout_is_rebuilt(tmp_path, mock_make_paginated_request):
+    path = tmp_path / "cache.db"
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE stale (type TEXT NOT NULL, id INTEGER NOT NULL, "
+        "PRIMARY KEY (type, id))"
+    )
+    connection.commit()
+    connection.close()
+    resource_cache = cache.ResourceCache(path, register=False)
+    resource_cache.invalidate(cache.PRODUCTS, 1)
+    assert len(resource_cache.get_all_products()) == 2
+
+
+def test_closed_cache_is_not_invalidated(
+    resource_cache, mock_make_paginated_request, mock_find
+):
+    resource_cache.get_all_products()
+    resource_cache.close()
+    cache.invalidate(cache.PRODUCTS, 1)
+    resource_cache.get_all_products()
+    mock_find.assert_not_called()
+
+
+def test_hooks_are_called_with_changes():
+    hook = Mock()
+    cache.register_invalidation_hook(hook)
+    try:
+        cache.invalidate(cache.PRODUCTS, 1)
+    finally:
+        cache.unregister_invalidation_hook(hook)
+    cache.invalidate(cache.PRODUCTS, 2)
+    hook.assert_called_once_with(cache.PRODUCTS, 1)
+
+
+@patch("shopify_api_py.products.cache.invalidate")
+@patch("shopify_api_py.products.shopify.Image")
+def test_add_product_image_invalidates_product(mock_image, mock_invalidate):
+    mock_image.return_value.save.return_value = True
+    products.add_product_image(1, "https://example.com/image.jpg")
+    mock_invalidate.assert_called_once_with(cache.PRODUCTS, 1)
+
+
+@pytest.fixture
+def lookup_cache():
+    lookup_cache = cache.enable_lookup_cache(max_size=2)
+    yield lookup_cache
+    cache.disable_lookup_cache()
+
+
+def test_lookup_without_cache_always_fetches():
+    fetch = Mock(return_value={"id": 1})
+    cache.lookup(cache.PRODUCTS, 1, fetch)
+    cache.lookup(cache.PRODUCTS, 1, fetch)
+    assert fetch.call_count == 2
+
+
+def test_lookup_returns_cached_value(lookup_cache):
+    fetch = Mock(return_value={"id": 1})
+    assert cache.lookup(cache.PRODUCTS, 1, fetch) == {"id": 1}
+    assert cache.lookup(cache.PRODUCTS, 1, fetch) == {"id": 1}
+    fetch.assert_called_once()
+    assert lookup_cache.stats.hits == 1
+    assert lookup_cache.stats.misses == 1
+    assert lookup_cache.stats.hit_ratio == 0.5
+
+
+def test_lookup_returns_copies_of_cached_value(lookup_cache):
+    fetch = Mock(return_value={"id": 1, "variants": [{"id": 11, "sku": "A"}]})
+    fetched = cache.lookup(cache.PRODUCTS, 1, fetch)
+    fetched["variants"][0]["sku"] = "changed"
+    first = cache.lookup(cache.PRODUCTS, 1, fetch)
+    first["title"] = "changed"
+    second = cache.lookup(cache.PRODUCTS, 1, fetch)
+    assert second == {"id": 1, "variants": [{"id": 11, "sku": "A"}]}
+    assert first is not second
+
+
+def test_lookup_options_are_cached_separately(lookup_cache):
+    fetch = Mock(return_value={"id": 1})
+    cache.lookup(cache.PRODUCTS, 1, fetch, fields=["id"])
+    cache.lookup(cache.PRODUCTS, 1, fetch, fields=None)
+    cache.lookup(cache.PRODUCTS, 1, fetch, fields=["id"])
+    assert fetch.call_count == 2
+
+
+def test_lookup_does_not_cache_exceptions(lookup_cache):
+    fetch = Mock(side_effect=[ValueError(), {"id": 1}])
+    with pytest.raises(ValueError):
+        cache.lookup(cache.PRODUCTS, 1, fetch)
+    assert cache.lookup(cache.PRODUCTS, 1, fetch) == {"id": 1}
+
+
+def test_lookup_entries_expire(lookup_cache):
+    fetch = Mock(return_value={"id": 1})
+    with patch("shopify_api_py.cache.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100
+        cache.lookup(cache.PRODUCTS, 1, fetch)
+        mock_monotonic.return_value = 100 + cache.DEFAULT_LOOKUP_TTLS[cache.PRODUCTS]
+        cache.lookup(cache.PRODUCTS, 1, fetch)
+    assert fetch.call_count == 2
+
+
+def test_least_recently_used_entry_is_evicted(lookup_cache):
+    fetch = Mock(side_effect=lambda: {"id": fetch.call_count})
+    cache.lookup(cache.PRODUCTS, 1, fetch)
+    cache.lookup(cache.PRODUCTS, 2, fetch)
+    cache.lookup(cache.PRODUCTS, 1, fetch)
+    cache.lookup(cache.PRODUCTS, 3, fetch)
+    assert len(lookup_cache) == 2
+    assert lookup_cache.stats.evictions == 1
+    cache.lookup(cache.PRODUCTS, 1, fetch)
+    assert fetch.call_count == 3
+
+
+def test_invalidation_removes_entries_including_resource(lookup_cache):
+    product = {"id": 1, "variants": [{"id": 11, "inventory_item_id": 110}]}
+    fetch = Mock(return_value=product)
+    cache.lookup(cache.PRODUCTS, 1, fetch)
+    cache.invalidate(cache.INVENTORY_ITEMS, 110)
+    cache.lookup(cache.PRODUCTS, 1, fetch)
+    assert fetch.call_count == 2
+    assert lookup_cache.stats.invalidations == 1
+
+
+def test_collects_are_invalidated_by_collection_changes(lookup_cache):
+    fetch = Mock(return_value={"id": 5, "collection_id": 9, "product_id": 1})
+    cache.lookup(cache.COLLECTS, 5, fetch)
+    cache.invalidate(cache.CUSTOM_COLLECTIONS, 9)
+    cache.lookup(cache.COLLECTS, 5, fetch)
+    assert fetch.call_count == 2
+
+
+def test_value_fetched_during_invalidation_is_not_cached(lookup_cache):
+    def fetch():
+        cache.invalidate(cache.PRODUCTS, 1)
+        return {"id": 1}
+
+    cache.lookup(cache.PRODUCTS, 1, fetch)
+    assert len(lookup_cache) == 0
+
+
+def test_disabled_lookup_cache_is_not_invalidated(lookup_cache):
+    cache.lookup(cache.PRODUCTS, 1, Mock(return_value={"id": 1}))
+    cache.disable_lookup_cache()
+    cache.invalidate(cache.PRODUCTS, 1)
+    assert len(lookup_cache) == 1
+
+
+@patch("shopify_api_py.products.shopify.Variant.find")
+def test_get_variant_by_id_uses_lookup_cache(mock_find, lookup_cache):
+    products.get_variant_by_id(11)
+    products.get_variant_by_id(11)
+    mock_find.assert_called_once_with(id_=11)
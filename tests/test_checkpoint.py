@@ -0,0 +1,63 @@
+import pytest
+
+from shopify_api_py import checkpoint
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        return checkpoint.FileCheckpointStore(tmp_path / "checkpoints")
+    return checkpoint.SQLiteCheckpointStore(tmp_path / "checkpoints.sqlite")
+
+
+def test_checkpoint_key_includes_resource_and_query():
+    class Order:
+        @classmethod
+        def find(cls):
+            pass
+
+    key = checkpoint.checkpoint_key(Order.find, status="any", limit=250)
+    assert key == "Order.find?limit=250&status=any"
+
+
+def test_open_returns_empty_checkpoint(store):
+    opened = store.open("key")
+    assert opened.next_page_url is None
+    assert opened.pages == 0
+    assert opened.resumable is False
+    assert list(opened.items()) == []
+
+
+def test_saved_pages_are_loaded(store):
+    store.open("key").save_page("page/2", [{"id": 1}, {"id": 2}])
+    store.open("key").save_page("page/3", [{"id": 3}])
+    opened = store.open("key")
+    assert opened.next_page_url == "page/3"
+    assert opened.pages == 2
+    assert opened.resumable is True
+    assert list(opened.items()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_checkpoints_are_separated_by_key(store):
+    store.open("a").save_page("page/2", [{"id": 1}])
+    assert store.open("b").resumable is False
+
+
+def test_clear_removes_checkpoint(store):
+    opened = store.open("key")
+    opened.save_page("page/2", [{"id": 1}])
+    opened.clear()
+    assert opened.resumable is False
+    assert store.open("key").resumable is False
+    assert list(store.iter_items("key")) == []
+
+
+def test_file_store_discards_incomplete_page(tmp_path):
+    store = checkpoint.FileCheckpointStore(tmp_path)
+    store.open("key").save_page("page/2", [{"id": 1}])
+    with open(store.get_path("key"), "a") as f:
+        f.write('{"next_page_url": "page/3", "items": [{"id"')
+    opened = store.open("key")
+    assert opened.next_page_url == "page/2"
+    opened.save_page("page/3", [{"id": 2}])
+    assert list(store.iter_items("key")) == [{"id": 1}, {"id": 2}]
@@ -0,0 +1,56 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from pyactiveresource.connection import Response
+
+from shopify_api_py import exceptions, graphql, request
+
+
+@pytest.fixture
+def mock_shopify():
+    with patch("shopify_api_py.graphql.shopify") as mock:
+        mock.ShopifyResource.site = "https://shop.myshopify.com/admin/api/2024-01"
+        yield mock
+
+
+def respond(mock_shopify, *bodies):
+    mock_shopify.ShopifyResource.connection.post.side_effect = [
+        Response(200, json.dumps(body).encode()) for body in bodies
+    ]
+
+
+def test_execute_posts_query(mock_shopify):
+    respond(mock_shopify, {"data": {"shop": {"name": "Shop"}}})
+    returned_value = graphql.execute("{ shop { name } }", variables={"a": 1})
+    assert returned_value == {"shop": {"name": "Shop"}}
+    path, headers, body = mock_shopify.ShopifyResource.connection.post.call_args.args
+    assert path == "https://shop.myshopify.com/admin/api/2024-01/graphql.json"
+    assert json.loads(body) == {"query": "{ shop { name } }", "variables": {"a": 1}}
+
+
+def test_execute_raises_graphql_error(mock_shopify):
+    respond(mock_shopify, {"errors": [{"message": "Field 'x' doesn't exist"}]})
+    with pytest.raises(exceptions.GraphQLError, match="Field 'x' doesn't exist"):
+        graphql.execute("{ x }")
+
+
+def test_execute_retries_throttled_requests(mock_shopify):
+    throttled = {
+        "errors": [{"message": "Throttled", "extensions": {"code": "THROTTLED"}}]
+    }
+    respond(mock_shopify, throttled, {"data": {"shop": {}}})
+    with patch("shopify_api_py.request.time.sleep"):
+        returned_value = graphql.execute(
+            "{ shop }", retry_policy=request.RetryPolicy(max_retries=1)
+        )
+    assert returned_value == {"shop": {}}
+
+
+def test_execute_does_not_retry_without_policy(mock_shopify):
+    throttled = {
+        "errors": [{"message": "Throttled", "extensions": {"code": "THROTTLED"}}]
+    }
+    respond(mock_shopify, throttled, {"data": {}})
+    with pytest.raises(exceptions.GraphQLThrottledError):
+        graphql.execute("{ shop }")
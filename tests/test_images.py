@@ -20,7 +20,7 @@ def mock_request():
 def test_get_all_orders_calls_make_paginated_request(mock_request, product_id):
     images.get_images_for_product(product_id=product_id)
     mock_request.make_paginated_request.assert_called_once_with(
-        request_method=shopify.Image.find, product_id=product_id
+        request_method=shopify.Image.find, product_id=product_id, limit=None
     )
 
 
@@ -30,3 +30,202 @@ def test_get_all_orders_returns_make_paginated_request_return_value(
     return_value = Mock()
     mock_request.make_paginated_request.return_value = return_value
     assert images.get_images_for_product(product_id=product_id) is return_value
+
+
+def test_iter_images_for_product_calls_iter_paginated_request(mock_request, product_id):
+    images.iter_images_for_product(product_id=product_id)
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=shopify.Image.find, product_id=product_id, limit=None
+    )
+
+
+def test_iter_images_for_product_returns_iter_paginated_request_return_value(
+    mock_request, product_id
+):
+    return_value = Mock()
+    mock_request.iter_paginated_request.return_value = return_value
+    assert images.iter_images_for_product(product_id=product_id) is return_value
+
+
+@pytest.fixture
+def mock_products():
+    with patch("shopify_api_py.images.products") as mock_products:
+        mock_products.get_products_by_ids.return_value = [
+            {"id": 1, "images": [{"src": "https://cdn/existing.jpg"}]},
+            {"id": 2, "images": []},
+        ]
+        yield mock_products
+
+
+@pytest.fixture
+def mock_hash_image():
+    hashes = {
+        "https://cdn/existing.jpg": "a",
+        "https://example.com/same.jpg": "a",
+        "https://example.com/new.jpg": "b",
+        "https://example.com/copy.jpg": "b",
+    }
+
+    def hash_image(source):
+        if source not in hashes:
+            raise OSError("Not found")
+        return hashes[source]
+
+    with patch("shopify_api_py.images.hash_image", side_effect=hash_image) as mock:
+        yield mock
+
+
+def test_hash_image_hashes_local_file(tmp_path):
+    path = tmp_path / "image.jpg"
+    path.write_bytes(b"image data")
+    assert images.hash_image(str(path)) == images.hash_image(str(path))
+    path.write_bytes(b"other data")
+    other = tmp_path / "other.jpg"
+    other.write_bytes(b"image data")
+    assert images.hash_image(str(path)) != images.hash_image(str(other))
+
+
+def test_hash_image_opens_urls():
+    with patch("shopify_api_py.images.urllib.request.urlopen") as mock_urlopen:
+        mock_urlopen.return_value.__enter__.return_value.read.side_effect = [
+            b"image data",
+            b"",
+        ]
+        images.hash_image("https://example.com/image.jpg")
+    mock_urlopen.assert_called_once_with(
+        "https://example.com/image.jpg", timeout=images.DOWNLOAD_TIMEOUT
+    )
+
+
+def test_attach_images_requests_product_images(mock_products, mock_hash_image):
+    images.attach_images([(1, "https://example.com/new.jpg")])
+    mock_products.get_products_by_ids.assert_called_once_with(
+        [1], fields=["images"], raw=True, max_workers=images.request.DEFAULT_WORKERS
+    )
+
+
+def test_attach_images_skips_images_the_product_has(mock_products, mock_hash_image):
+    report = images.attach_images([(1, "https://example.com/same.jpg")])
+    assert report.skipped == [images.ImageUpload(1, "https://example.com/same.jpg")]
+    mock_products.add_product_image.assert_not_called()
+
+
+def test_attach_images_uploads_new_images(mock_products, mock_hash_image):
+    report = images.attach_images(
+        [(1, "https://example.com/new.jpg"), (2, "https://example.com/same.jpg", (3,))]
+    )
+    assert report.ok is True
+    assert len(report.succeeded) == 2
+    mock_products.add_product_image.assert_any_call(
+        1, "https://example.com/new.jpg", variant_ids=None
+    )
+    mock_products.add_product_image.assert_any_call(
+        2, "https://example.com/same.jpg", variant_ids=[3]
+    )
+
+
+def test_attach_images_skips_duplicate_uploads(mock_products, mock_hash_image):
+    report = images.attach_images(
+        [(2, "https://example.com/new.jpg"), (2, "https://example.com/copy.jpg")]
+    )
+    assert report.succeeded == [images.ImageUpload(2, "https://example.com/new.jpg")]
+    assert report.skipped == [images.ImageUpload(2, "https://example.com/copy.jpg")]
+
+
+def test_attach_images_uses_known_hashes(mock_products, mock_hash_image):
+    known_hashes = {"https://cdn/existing.jpg": "b"}
+    report = images.attach_images([(1, "https://example.com/new.jpg")], known_hashes)
+    assert len(report.skipped) == 1
+    hashed = [call.args[0] for call in mock_hash_image.call_args_list]
+    assert "https://cdn/existing.jpg" not in hashed
+
+
+def test_attach_images_records_hashes_of_uploaded_images(
+    mock_products, mock_hash_image
+):
+    mock_products.add_product_image.return_value = Mock(src="https://cdn/new.jpg")
+    known_hashes: dict[str, str] = {}
+    images.attach_images([(1, "https://example.com/new.jpg")], known_hashes)
+    assert known_hashes["https://cdn/new.jpg"] == "b"
+
+
+def test_attach_images_reports_missing_products(mock_products, mock_hash_image):
+    mock_products.get_products_by_ids.side_effect = (
+        images.exceptions.ResourcesNotFoundError(
+            "Product", [3], found=[{"id": 1, "images": []}]
+        )
+    )
+    report = images.attach_images(
+        [(1, "https://example.com/new.jpg"), (3, "https://example.com/new.jpg")]
+    )
+    assert report.succeeded == [images.ImageUpload(1, "https://example.com/new.jpg")]
+    assert report.failed == [
+        (images.ImageUpload(3, "https://example.com/new.jpg"), "Product 3 not found.")
+    ]
+
+
+def test_attach_images_reports_unreadable_images(mock_products, mock_hash_image):
+    report = images.attach_images([(1, "https://example.com/missing.jpg")])
+    assert report.failed == [
+        (
+            images.ImageUpload(1, "https://example.com/missing.jpg"),
+            "Could not read https://example.com/missing.jpg.",
+        )
+    ]
+
+
+def test_attach_images_reports_failed_uploads(mock_products, mock_hash_image):
+    mock_products.add_product_image.side_effect = images.exceptions.ResponseError(
+        "Error adding image."
+    )
+    report = images.attach_images([(1, "https://example.com/new.jpg")])
+    assert report.failed == [
+        (images.ImageUpload(1, "https://example.com/new.jpg"), "Error adding image.")
+    ]
+
+
+def test_attach_images_uploads_local_files_as_attachments(mock_products, tmp_path):
+    path = tmp_path / "image.jpg"
+    path.write_bytes(b"image data")
+    with patch("shopify_api_py.images.shopify.Image") as mock_image, patch(
+        "shopify_api_py.images.cache"
+    ) as mock_cache:
+        report = images.attach_images([(2, str(path))])
+    assert report.ok is True
+    mock_image.return_value.attach_image.assert_called_once_with(
+        b"image data", filename="image.jpg"
+    )
+    mock_cache.invalidate.assert_called_once_with(mock_cache.PRODUCTS, 2)
+
+
+def test_local_file_uploads_are_paced_and_retried_if_throttled(mock_products, tmp_path):
+    path = tmp_path / "image.jpg"
+    path.write_bytes(b"image data")
+    with patch("shopify_api_py.images.shopify.Image") as mock_image, patch(
+        "shopify_api_py.images.request.make_request"
+    ) as mock_make_request, patch("shopify_api_py.images.cache"):
+        images.attach_images([(2, str(path))])
+    mock_make_request.assert_called_once_with(
+        mock_image.return_value.save,
+        retry_policy=images.request.throttle_retry_policy,
+    )
+
+
+@patch("shopify_api_py.products.request.make_request")
+@patch("shopify_api_py.products.shopify.Image")
+def test_add_product_image_is_paced_and_retried_if_throttled(
+    mock_image, mock_make_request
+):
+    images.products.add_product_image(1, "https://example.com/image.jpg")
+    mock_make_request.assert_called_once_with(
+        mock_image.return_value.save,
+        retry_policy=images.request.throttle_retry_policy,
+    )
+
+
+def test_byte_budget_admits_oversized_image_when_empty():
+    budget = images._ByteBudget(10)
+    budget.acquire(20)
+    assert budget.used == 20
+    budget.release(20)
+    assert budget.used == 0
@@ -0,0 +1,222 @@
+from unittest.mock import patch
+
+import pytest
+import shopify
+
+from shopify_api_py import cache, indexes
+
+
+def variant(id, product_id=1, sku=None, barcode=None, updated_at=None):
+    return {
+        "id": id,
+        "product_id": product_id,
+        "inventory_item_id": id * 10,
+        "sku": sku,
+        "barcode": barcode,
+        "updated_at": updated_at,
+    }
+
+
+@pytest.fixture
+def variants():
+    return [
+        variant(1, sku="A", barcode="111", updated_at="2024-01-01T10:00:00-05:00"),
+        variant(2, sku="B", barcode="222", updated_at="2024-01-02T10:00:00-05:00"),
+        variant(3, product_id=2, sku="C", updated_at="2024-01-03T10:00:00-05:00"),
+    ]
+
+
+@pytest.fixture
+def index(variants):
+    return indexes.VariantIndex(
+        indexes.VariantRecord.from_dict(variant) for variant in variants
+    )
+
+
+@pytest.fixture
+def mock_get_all_variants(variants):
+    with patch("shopify_api_py.indexes.products.get_all_variants") as mock:
+        mock.return_value = variants
+        yield mock
+
+
+@pytest.fixture
+def mock_make_paginated_request():
+    with patch("shopify_api_py.indexes.request.make_paginated_request") as mock:
+        yield mock
+
+
+def test_build_requests_variant_fields(mock_get_all_variants):
+    index = indexes.VariantIndex.build()
+    assert len(index) == 3
+    mock_get_all_variants.assert_called_once_with(
+        limit=250, fields=indexes.VariantIndex.FIELDS, raw=True
+    )
+
+
+def test_index_looks_up_variants(index):
+    assert index.get_by_id(1).sku == "A"
+    assert index.get_by_sku("B").id == 2
+    assert index.get_by_barcode("111").id == 1
+    assert index.get_by_inventory_item_id(30).id == 3
+
+
+def test_index_returns_none_for_unknown_variants(index):
+    assert index.get_by_id(9) is None
+    assert index.get_by_sku("Z") is None
+    assert index.get_by_barcode("999") is None
+    assert index.get_by_inventory_item_id(90) is None
+
+
+def test_index_tracks_latest_update(index):
+    assert index.updated_at == "2024-01-03T10:00:00-05:00"
+
+
+def test_shared_sku_returns_lowest_id(index):
+    index.add(indexes.VariantRecord.from_dict(variant(0, sku="A", barcode="111")))
+    assert index.get_by_sku("A").id == 0
+    assert index.get_by_barcode("111").id == 0
+    assert [record.id for record in index.get_all_by_sku("A")] == [0, 1]
+    assert [record.id for record in index.get_all_by_barcode("111")] == [0, 1]
+
+
+def test_remove_keeps_other_variants_with_shared_sku(index):
+    index.add(indexes.VariantRecord.from_dict(variant(4, sku="A", barcode="111")))
+    index.remove(1)
+    assert index.get_by_sku("A").id == 4
+    assert index.get_by_barcode("111").id == 4
+    index.remove(4)
+    assert index.get_by_sku("A") is None
+    assert index.get_all_by_sku("A") == []
+
+
+def test_add_replaces_changed_sku(index):
+    index.add(indexes.VariantRecord.from_dict(variant(1, sku="A2")))
+    assert index.get_by_sku("A") is None
+    assert index.get_by_sku("A2").id == 1
+
+
+def test_remove_variant(index):
+    index.remove(1)
+    assert 1 not in index
+    assert index.get_by_sku("A") is None
+    assert index.get_by_inventory_item_id(10) is None
+
+
+def test_refresh_requests_products_updated_since_last_update(
+    index, mock_make_paginated_request
+):
+    mock_make_paginated_request.return_value = []
+    index.refresh()
+    mock_make_paginated_request.assert_called_once()
+    call = mock_make_paginated_request.call_args
+    assert call.args[0].resource_class is shopify.Product
+    assert call.kwargs["updated_at_min"] == "2024-01-03T10:00:00-05:00"
+    assert call.kwargs["limit"] == 250
+
+
+def test_refresh_replaces_variants_of_changed_products(
+    index, mock_make_paginated_request
+):
+    mock_make_paginated_request.return_value = [
+        {
+            "id": 1,
+            "updated_at": "2024-01-05T10:00:00-05:00",
+            "variants": [variant(1, sku="A"), variant(4, sku="D")],
+        }
+    ]
+    assert index.refresh() == 1
+    assert 2 not in index
+    assert index.get_by_sku("D").id == 4
+    assert index.get_by_sku("C").id == 3
+    assert index.updated_at == "2024-01-05T10:00:00-05:00"
+
+
+def test_save_and_load(index, tmp_path):
+    path = tmp_path / "variants.json"
+    index.save(path)
+    loaded = indexes.VariantIndex.load(path)
+    assert sorted(loaded, key=lambda r: r.id) == sorted(index, key=lambda r: r.id)
+    assert loaded.updated_at == index.updated_at
+    assert loaded.get_by_sku("A").id == 1
+
+
+def test_load_rejects_incompatible_file(tmp_path):
+    path = tmp_path / "variants.json"
+    path.write_text('{"version": 0, "fields": [], "variants": []}')
+    with pytest.raises(ValueError):
+        indexes.VariantIndex.load(path)
+
+
+def test_variant_records_use_slots(index):
+    with pytest.raises(AttributeError):
+        index.get_by_id(1).title = "Title"
+
+
+def collect(id, product_id, collection_id):
+    return {"id": id, "product_id": product_id, "collection_id": collection_id}
+
+
+@pytest.fixture
+def mock_iter_paginated_request():
+    with patch("shopify_api_py.indexes.request.iter_paginated_request") as mock:
+        mock.return_value = iter(
+            [collect(1, 10, 100), collect(2, 11, 100), collect(3, 10, 101)]
+        )
+        yield mock
+
+
+@pytest.fixture
+def membership(mock_iter_paginated_request):
+    return indexes.CollectionMembershipIndex.build()
+
+
+def test_membership_build_requests_collects(membership, mock_iter_paginated_request):
+    mock_iter_paginated_request.assert_called_once()
+    call = mock_iter_paginated_request.call_args
+    assert call.args[0].resource_class is shopify.Collect
+    assert call.kwargs["fields"] == ["id", "product_id", "collection_id"]
+    assert membership.max_collect_id == 3
+    assert len(membership) == 3
+
+
+def test_membership_lookups(membership):
+    assert list(membership.get_collection_ids(10)) == [100, 101]
+    assert list(membership.get_product_ids(100)) == [10, 11]
+    assert list(membership.get_product_ids(999)) == []
+    assert membership.contains(11, 100)
+    assert not membership.contains(11, 101)
+    assert (10, 101) in membership
+
+
+def test_membership_add_and_remove(membership):
+    assert membership.add(11, 101)
+    assert not membership.add(11, 101)
+    assert list(membership.get_product_ids(101)) == [10, 11]
+    assert membership.remove(10, 101)
+    assert not membership.remove(10, 101)
+    assert list(membership.get_collection_ids(10)) == [100]
+    assert list(membership.get_product_ids(101)) == [11]
+
+
+def test_membership_refresh_adds_new_collects(membership, mock_iter_paginated_request):
+    mock_iter_paginated_request.return_value = iter([collect(4, 12, 101)])
+    assert membership.refresh() == 1
+    assert mock_iter_paginated_request.call_args.kwargs["since_id"] == 3
+    assert membership.contains(12, 101)
+    assert membership.max_collect_id == 4
+
+
+@patch("shopify_api_py.indexes.products.get_products_in_custom_collection")
+def test_membership_refresh_reads_changed_collections(
+    mock_get_products_in_custom_collection, membership, mock_iter_paginated_request
+):
+    mock_iter_paginated_request.return_value = iter([])
+    mock_get_products_in_custom_collection.return_value = [11, 12]
+    cache.invalidate(cache.CUSTOM_COLLECTIONS, 100)
+    assert membership.refresh() == 2
+    mock_get_products_in_custom_collection.assert_called_once_with(100)
+    assert list(membership.get_product_ids(100)) == [11, 12]
+    assert list(membership.get_collection_ids(10)) == [101]
+    membership.refresh()
+    mock_get_products_in_custom_collection.assert_called_once()
@@ -0,0 +1,284 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from shopify_api_py import cache, exceptions, inventory, request
+
+
+def success():
+    return {"inventorySetQuantities": {"userErrors": []}}
+
+
+def user_errors(*errors):
+    return {"inventorySetQuantities": {"userErrors": list(errors)}}
+
+
+@pytest.fixture
+def mock_execute():
+    with patch("shopify_api_py.inventory.graphql.execute") as mock:
+        mock.return_value = success()
+        yield mock
+
+
+def test_set_stock_levels_sends_inventory_set_quantities(mock_execute):
+    inventory.set_stock_levels([(1, 10, 5)])
+    input_ = mock_execute.call_args.kwargs["variables"]["input"]
+    assert input_["name"] == "available"
+    assert input_["quantities"] == [
+        {
+            "locationId": "gid://shopify/Location/1",
+            "inventoryItemId": "gid://shopify/InventoryItem/10",
+            "quantity": 5,
+        }
+    ]
+
+
+def test_set_stock_levels_batches_changes(mock_execute):
+    changes = [(1, item_id, 5) for item_id in range(600)]
+    inventory.set_stock_levels(changes)
+    sizes = sorted(
+        len(c.kwargs["variables"]["input"]["quantities"])
+        for c in mock_execute.call_args_list
+    )
+    assert sizes == [100, 250, 250]
+
+
+def test_set_stock_levels_uses_batch_size(mock_execute):
+    inventory.set_stock_levels([(1, item_id, 5) for item_id in range(10)], batch_size=3)
+    assert mock_execute.call_count == 4
+
+
+def test_set_stock_levels_reports_success(mock_execute):
+    report = inventory.set_stock_levels([(1, 10, 5), (1, 11, 6)])
+    assert report.ok is True
+    assert report.succeeded == [
+        inventory.StockChange(1, 10, 5),
+        inventory.StockChange(1, 11, 6),
+    ]
+
+
+def test_set_stock_levels_reports_item_errors(mock_execute):
+    mock_execute.return_value = user_errors(
+        {
+            "field": ["input", "quantities", "1", "inventoryItemId"],
+            "message": "The item is not stocked at the location.",
+        }
+    )
+    report = inventory.set_stock_levels([(1, 10, 5), (1, 11, 6)])
+    assert report.succeeded == []
+    assert report.failed == [
+        (
+            inventory.StockChange(1, 10, 5),
+            "Not applied due to errors for other items in the batch",
+        ),
+        (inventory.StockChange(1, 11, 6), "The item is not stocked at the location."),
+    ]
+
+
+def test_set_stock_levels_reports_failed_requests(mock_execute):
+    mock_execute.side_effect = [exceptions.GraphQLError("Access denied"), success()]
+    report = inventory.set_stock_levels(
+        [(1, 10, 5), (1, 11, 6)], batch_size=1, max_workers=1
+    )
+    assert report.failed == [
+        (inventory.StockChange(1, 10, 5), "GraphQL request failed: Access denied")
+    ]
+    assert report.succeeded == [inventory.StockChange(1, 11, 6)]
+
+
+@patch("shopify_api_py.inventory.cache.invalidate")
+def test_set_stock_levels_invalidates_applied_items(mock_invalidate, mock_execute):
+    mock_execute.side_effect = [
+        success(),
+        user_errors({"field": ["input"], "message": "Invalid"}),
+    ]
+    inventory.set_stock_levels([(1, 10, 5), (1, 11, 6)], batch_size=1, max_workers=1)
+    mock_invalidate.assert_called_once_with(cache.INVENTORY_ITEMS, 10)
+
+
+def test_set_stock_levels_rejects_invalid_batch_size(mock_execute):
+    with pytest.raises(ValueError):
+        inventory.set_stock_levels([(1, 10, 5)], batch_size=251)
+
+
+@pytest.fixture
+def mock_current_levels():
+    with patch("shopify_api_py.inventory.get_location_stock_levels") as mock:
+        mock.return_value = {10: 5, 11: 0, 12: None}
+        yield mock
+
+
+@pytest.fixture
+def mock_skus():
+    with patch("shopify_api_py.inventory.get_inventory_item_ids_by_sku") as mock:
+        mock.return_value = {"A": [10], "B": [11, 12]}
+        yield mock
+
+
+@pytest.fixture
+def mock_set_stock_levels():
+    with patch("shopify_api_py.inventory.set_stock_levels") as mock:
+        mock.side_effect = lambda changes, **kwargs: report_all(changes)
+        yield mock
+
+
+def report_all(changes):
+    report = inventory.request.BatchReport()
+    for change in changes:
+        report.add_success(change)
+    return report
+
+
+def test_sync_stock_levels_sends_only_differences(
+    mock_current_levels, mock_set_stock_levels
+):
+    report = inventory.sync_stock_levels(1, {10: 5, 11: 3, 12: 2})
+    changes = mock_set_stock_levels.call_args.args[0]
+    assert changes == [inventory.StockChange(1, 11, 3), inventory.StockChange(1, 12, 2)]
+    assert report.unchanged == 1
+    assert report.succeeded == changes
+    mock_current_levels.assert_called_once_with(1)
+
+
+def test_sync_stock_levels_by_sku(
+    mock_current_levels, mock_skus, mock_set_stock_levels
+):
+    report = inventory.sync_stock_levels(1, {"A": 5, "B": 4, "C": 1}, by_sku=True)
+    changes = mock_set_stock_levels.call_args.args[0]
+    assert changes == [inventory.StockChange(1, 11, 4), inventory.StockChange(1, 12, 4)]
+    assert report.unknown == ["C"]
+    assert report.unchanged == 1
+
+
+def test_get_stock_changes_includes_items_without_level():
+    changes = inventory.get_stock_changes(1, {10: 0, 13: 0}, {10: 0})
+    assert changes == [inventory.StockChange(1, 13, 0)]
+
+
+@pytest.fixture
+def mock_make_paginated_request():
+    with patch("shopify_api_py.inventory.request.make_paginated_request") as mock:
+        yield mock
+
+
+def test_get_location_stock_levels(mock_make_paginated_request):
+    mock_make_paginated_request.return_value = [
+        {"inventory_item_id": 10, "available": 5, "location_id": 1},
+        {"inventory_item_id": 11, "available": None, "location_id": 1},
+    ]
+    assert inventory.get_location_stock_levels(1) == {10: 5, 11: None}
+    assert mock_make_paginated_request.call_args.kwargs["location_ids"] == "1"
+    assert mock_make_paginated_request.call_args.kwargs["limit"] == 250
+
+
+def test_get_inventory_levels_returns_levels_by_location_and_item(
+    mock_make_paginated_request,
+):
+    mock_make_paginated_request.return_value = [
+        {"inventory_item_id": 10, "available": 5, "location_id": 1},
+        {"inventory_item_id": 10, "available": 2, "location_id": 2},
+    ]
+    levels = inventory.get_inventory_levels(location_ids=[1, 2])
+    assert levels == {(1, 10): 5, (2, 10): 2}
+
+
+def test_get_inventory_levels_chunks_ids(mock_make_paginated_request):
+    mock_make_paginated_request.return_value = []
+    inventory.get_inventory_levels(
+        location_ids=[1, 2], inventory_item_ids=range(120), max_workers=1
+    )
+    queries = [c.kwargs for c in mock_make_paginated_request.call_args_list]
+    assert len(queries) == 3
+    assert all(query["location_ids"] == "1,2" for query in queries)
+    assert [len(query["inventory_item_ids"].split(",")) for query in queries] == [
+        50,
+        50,
+        20,
+    ]
+
+
+def test_get_inventory_levels_chunks_location_and_item_ids(
+    mock_make_paginated_request,
+):
+    mock_make_paginated_request.return_value = []
+    inventory.get_inventory_levels(
+        location_ids=range(60), inventory_item_ids=range(60), max_workers=1
+    )
+    assert mock_make_paginated_request.call_count == 4
+
+
+def test_get_inventory_levels_requires_ids():
+    with pytest.raises(ValueError):
+        inventory.get_inventory_levels()
+
+
+@pytest.fixture
+def inventory_items():
+    return {}
+
+
+@pytest.fixture
+def mock_inventory_item(inventory_items):
+    def inventory_item(attributes):
+        item = Mock(id=attributes["id"])
+        item.errors.full_messages.return_value = []
+        inventory_items[item.id] = item
+        return item
+
+    with patch("shopify_api_py.inventory.shopify.InventoryItem") as mock:
+        mock.side_effect = inventory_item
+        yield mock
+
+
+@pytest.fixture
+def mock_make_request():
+    with patch("shopify_api_py.inventory.request.make_request") as mock:
+        mock.return_value = True
+        yield mock
+
+
+def test_set_customs_information_sends_only_customs_fields(
+    inventory_items, mock_inventory_item, mock_make_request
+):
+    inventory.set_customs_information([(1, "GB", "123456")])
+    mock_inventory_item.assert_called_once_with(
+        {
+            "id": 1,
+            "country_code_of_origin": "GB",
+            "harmonized_system_code": "123456",
+        }
+    )
+    mock_make_request.assert_called_once_with(
+        inventory_items[1].save, retry_policy=request.default_retry_policy
+    )
+
+
+def test_set_customs_information_reports_each_update(
+    inventory_items, mock_inventory_item, mock_make_request
+):
+    def save(save, retry_policy):
+        item_id = next(
+            id_ for id_, item in inventory_items.items() if item.save is save
+        )
+        if item_id == 2:
+            raise exceptions.ResponseError("Error")
+        return item_id != 3
+
+    mock_make_request.side_effect = save
+    report = inventory.set_customs_information(
+        [(1, "GB", "1"), (2, "GB", "2"), (3, "GB", "3")]
+    )
+    assert report.succeeded == [inventory.CustomsUpdate(1, "GB", "1")]
+    assert [(update.inventory_item_id, reason) for update, reason in report.failed] == [
+        (2, "Error"),
+        (3, "Error setting customs information"),
+    ]
+    assert not report.ok
+
+
+@patch("shopify_api_py.inventory.cache.invalidate")
+def test_set_customs_information_invalidates_updated_items(
+    mock_invalidate, mock_inventory_item, mock_make_request
+):
+    inventory.set_customs_information([(1, "GB", "1")])
+    mock_invalidate.assert_called_once_with(cache.INVENTORY_ITEMS, 1)
@@ -15,7 +15,7 @@ def mock_request():
 def test_get_all_products_calls_make_paginated_request(mock_request):
     locations.get_inventory_locations()
     mock_request.make_paginated_request.assert_called_once_with(
-        request_method=shopify.Location.find
+        request_method=shopify.Location.find, limit=None
     )
 
 
@@ -23,3 +23,18 @@ def test_get_all_products_returns_make_paginated_request_return_value(mock_reque
     return_value = Mock()
     mock_request.make_paginated_request.return_value = return_value
     assert locations.get_inventory_locations() is return_value
+
+
+def test_iter_inventory_locations_calls_iter_paginated_request(mock_request):
+    locations.iter_inventory_locations()
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=shopify.Location.find, limit=None
+    )
+
+
+def test_iter_inventory_locations_returns_iter_paginated_request_return_value(
+    mock_request,
+):
+    return_value = Mock()
+    mock_request.iter_paginated_request.return_value = return_value
+    assert locations.iter_inventory_locations() is return_value
@@ -15,7 +15,10 @@ def mock_request():
 def test_get_all_orders_calls_make_paginated_request(mock_request):
     orders.get_all_orders()
     mock_request.make_paginated_request.assert_called_once_with(
-        request_method=shopify.Order.find
+        request_method=shopify.Order.find,
+        limit=None,
+        fields=None,
+        checkpoint_store=None,
     )
 
 
@@ -23,3 +26,78 @@ def test_get_all_orders_returns_make_paginated_request_return_value(mock_request
     return_value = Mock()
     mock_request.make_paginated_request.return_value = return_value
     assert orders.get_all_orders() is return_value
+
+
+def test_iter_all_orders_calls_iter_paginated_request(mock_request):
+    orders.iter_all_orders()
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=shopify.Order.find,
+        limit=None,
+        fields=None,
+        checkpoint_store=None,
+    )
+
+
+def test_iter_all_orders_returns_iter_paginated_request_return_value(mock_request):
+    return_value = Mock()
+    mock_request.iter_paginated_request.return_value = return_value
+    assert orders.iter_all_orders() is return_value
+
+
+def test_get_all_orders_passes_limit(mock_request):
+    orders.get_all_orders(limit=250)
+    mock_request.make_paginated_request.assert_called_once_with(
+        request_method=shopify.Order.find, limit=250, fields=None, checkpoint_store=None
+    )
+
+
+def test_get_all_orders_passes_fields(mock_request):
+    orders.get_all_orders(fields=["id", "line_items"])
+    mock_request.make_paginated_request.assert_called_once_with(
+        request_method=shopify.Order.find,
+        limit=None,
+        fields=["id", "line_items"],
+        checkpoint_store=None,
+    )
+
+
+def test_get_all_orders_with_partitions_calls_make_partitioned_request(
+    mock_request,
+):
+    orders.get_all_orders(partitions=4)
+    mock_request.make_partitioned_request.assert_called_once_with(
+        shopify.Order, partitions=4, limit=None, fields=None, raw=False
+    )
+
+
+def test_iter_all_orders_passes_checkpoint_store(mock_request):
+    checkpoint_store = Mock()
+    orders.iter_all_orders(checkpoint_store=checkpoint_store)
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=shopify.Order.find,
+        limit=None,
+        fields=None,
+        checkpoint_store=checkpoint_store,
+    )
+
+
+def test_get_all_orders_raw_uses_raw_finder(mock_request):
+    orders.get_all_orders(raw=True)
+    mock_request.RawFinder.assert_called_once_with(shopify.Order)
+    mock_request.make_paginated_request.assert_called_once_with(
+        request_method=mock_request.RawFinder.return_value,
+        limit=None,
+        fields=None,
+        checkpoint_store=None,
+    )
+
+
+def test_iter_all_orders_raw_uses_raw_finder(mock_request):
+    orders.iter_all_orders(raw=True)
+    mock_request.RawFinder.assert_called_once_with(shopify.Order)
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=mock_request.RawFinder.return_value,
+        limit=None,
+        fields=None,
+        checkpoint_store=None,
+    )
@@ -0,0 +1,219 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from shopify_api_py import exceptions, product_import
+
+
+def make_spec(key="SUP-1", **kwargs):
+    spec = {
+        "key": key,
+        "title": "Shirt",
+        "options": {"Size": ["S", "M"]},
+        "variants": [
+            {"sku": f"{key}-S", "option_values": ["S"], "price": 9.99},
+            {"sku": f"{key}-M", "option_values": ["M"], "price": 9.99},
+        ],
+    }
+    spec.update(kwargs)
+    return spec
+
+
+@pytest.fixture
+def mock_products():
+    with patch("shopify_api_py.product_import.products") as mock_products:
+        product_ids = iter(range(1, 1000))
+
+        def create_product(title, body_html, vendor, options, variants, tags):
+            product_id = next(product_ids)
+            return Mock(
+                id=product_id,
+                variants=[
+                    Mock(id=product_id * 100 + i) for i in range(len(variants or [1]))
+                ],
+            )
+
+        mock_products.create_product.side_effect = create_product
+        yield mock_products
+
+
+def test_read_product_specs(tmp_path):
+    path = tmp_path / "specs.jsonl"
+    path.write_text(json.dumps(make_spec("A")) + "\n\n" + json.dumps(make_spec("B")))
+    assert [spec["key"] for spec in product_import.read_product_specs(path)] == [
+        "A",
+        "B",
+    ]
+
+
+def test_valid_spec_has_no_errors():
+    assert product_import.validate_product_spec(make_spec()) == []
+
+
+def test_spec_key_defaults_to_title():
+    assert product_import.get_spec_key({"title": "Shirt"}) == "Shirt"
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"title": ""},
+        {"options": {"A": ["1"], "B": ["1"], "C": ["1"], "D": ["1"]}},
+        {"options": {"Size": ["S", "S"]}},
+        {"options": {}},
+        {"variants": [{"option_values": ["L"], "price": 1}]},
+        {"variants": [{"option_values": ["S", "M"], "price": 1}]},
+        {"variants": [{"option_values": ["S"]}]},
+        {
+            "variants": [
+                {"option_values": ["S"], "price": 1},
+                {"option_values": ["S"], "price": 1},
+            ]
+        },
+        {
+            "options": {"Size": [str(i) for i in range(101)]},
+            "variants": [{"option_values": [str(i)], "price": 1} for i in range(101)],
+        },
+    ],
+)
+def test_invalid_specs_have_errors(changes):
+    assert product_import.validate_product_spec(make_spec(**changes)) != []
+
+
+def test_create_product_from_spec(mock_products):
+    created = product_import.create_product_from_spec(make_spec(tags=["new"]))
+    assert created == product_import.CreatedProduct("SUP-1", 1, [100, 101])
+    mock_products.create_options.assert_called_once_with({"Size": ["S", "M"]})
+    assert mock_products.create_variation.call_count == 2
+    mock_products.create_variation.assert_any_call(
+        sku="SUP-1-S",
+        option_values=["S"],
+        barcode=None,
+        grams=None,
+        price=9.99,
+        tracked=True,
+    )
+    call = mock_products.create_product.call_args
+    assert call.kwargs["tags"] == ["new"]
+    assert call.kwargs["options"] is mock_products.create_options.return_value
+
+
+def test_create_product_from_spec_without_variants(mock_products):
+    product_import.create_product_from_spec({"title": "Mug"})
+    call = mock_products.create_product.call_args
+    assert call.kwargs["options"] is None
+    assert call.kwargs["variants"] is None
+
+
+def test_import_products_reports_each_spec(mock_products):
+    specs = [make_spec("A"), make_spec("B", title=""), make_spec("A"), make_spec("C")]
+    report = product_import.import_products(specs)
+    assert sorted(report.succeeded) == ["A", "C"]
+    assert [key for key, _ in report.failed] == ["B", "A"]
+    assert set(report.created) == {"A", "C"}
+    assert mock_products.create_product.call_count == 2
+
+
+def test_import_products_reports_creation_errors(mock_products):
+    mock_products.create_product.side_effect = exceptions.ResponseError(
+        "Error creating product."
+    )
+    report = product_import.import_products([make_spec("A")])
+    assert report.failed == [("A", "Error creating product.")]
+    assert report.created == {}
+
+
+def test_import_products_checkpoints_created_products(mock_products, tmp_path):
+    checkpoint = product_import.ImportCheckpoint(tmp_path / "import.jsonl")
+    product_import.import_products([make_spec("A")], checkpoint=checkpoint)
+    report = product_import.import_products(
+        [make_spec("A"), make_spec("B")], checkpoint=checkpoint
+    )
+    assert report.resumed == ["A"]
+    assert report.succeeded == ["B"]
+    assert report.created["A"] == product_import.CreatedProduct("A", 1, [100, 101])
+    assert mock_products.create_product.call_count == 2
+    assert set(checkpoint.load()) == {"A", "B"}
+
+
+@pytest.fixture
+def mock_make_paginated_request():
+    with patch(
+        "shopify_api_py.product_import.request.make_paginated_request"
+    ) as mock_make_paginated_request:
+        mock_make_paginated_request.return_value = []
+        yield mock_make_paginated_request
+
+
+def test_import_products_records_pending_before_creating(mock_products, tmp_path):
+    checkpoint = product_import.ImportCheckpoint(tmp_path / "import.jsonl")
+
+    def create_product(**kwargs):
+        checkpoint.load()
+        assert checkpoint.pending == {"A"}
+        raise exceptions.ResponseError("Error creating product.")
+
+    mock_products.create_product.side_effect = create_product
+    product_import.import_products([make_spec("A")], checkpoint=checkpoint)
+    assert checkpoint.load() == {}
+    assert checkpoint.pending == {"A"}
+
+
+def test_import_products_recovers_product_created_before_interruption(
+    mock_products, mock_make_paginated_request, tmp_path
+):
+    checkpoint = product_import.ImportCheckpoint(tmp_path / "import.jsonl")
+    checkpoint.record_pending("A")
+    mock_make_paginated_request.return_value = [
+        {"id": 7, "vendor": "", "variants": [{"id": 70, "sku": "A-S"}]},
+        {
+            "id": 8,
+            "vendor": "",
+            "variants": [{"id": 80, "sku": "A-S"}, {"id": 81, "sku": "A-M"}],
+        },
+    ]
+    report = product_import.import_products([make_spec("A")], checkpoint=checkpoint)
+    assert mock_make_paginated_request.call_args.kwargs["title"] == "Shirt"
+    assert report.resumed == ["A"]
+    assert report.created["A"] == product_import.CreatedProduct("A", 8, [80, 81])
+    mock_products.create_product.assert_not_called()
+    assert checkpoint.load() == {"A": report.created["A"]}
+    assert checkpoint.pending == set()
+
+
+def test_import_products_creates_pending_spec_not_found(
+    mock_products, mock_make_paginated_request, tmp_path
+):
+    checkpoint = product_import.ImportCheckpoint(tmp_path / "import.jsonl")
+    checkpoint.record_pending("A")
+    report = product_import.import_products([make_spec("A")], checkpoint=checkpoint)
+    assert report.succeeded == ["A"]
+    mock_products.create_product.assert_called_once()
+
+
+def test_import_products_does_not_create_ambiguous_pending_spec(
+    mock_products, mock_make_paginated_request, tmp_path
+):
+    checkpoint = product_import.ImportCheckpoint(tmp_path / "import.jsonl")
+    checkpoint.record_pending("A")
+    product = {
+        "id": 8,
+        "vendor": "",
+        "variants": [{"id": 80, "sku": "A-S"}, {"id": 81, "sku": "A-M"}],
+    }
+    mock_make_paginated_request.return_value = [product, dict(product, id=9)]
+    report = product_import.import_products([make_spec("A")], checkpoint=checkpoint)
+    assert [key for key, _ in report.failed] == ["A"]
+    mock_products.create_product.assert_not_called()
+
+
+def test_import_checkpoint_ignores_incomplete_line(tmp_path):
+    path = tmp_path / "import.jsonl"
+    path.write_text(
+        '{"key": "A", "product_id": 1, "variant_ids": [2]}\n{"key": "B", "prod'
+    )
+    checkpoint = product_import.ImportCheckpoint(path)
+    assert checkpoint.load() == {"A": product_import.CreatedProduct("A", 1, [2])}
+    checkpoint.record(product_import.CreatedProduct("C", 3, [4]))
+    assert set(checkpoint.load()) == {"A", "C"}
@@ -4,7 +4,7 @@ import pytest
 import shopify
 from pyactiveresource.connection import ResourceNotFound
 
-from shopify_api_py import exceptions, products
+from shopify_api_py import cache, exceptions, products
 
 
 @pytest.fixture
@@ -56,7 +56,10 @@ def image_url():
 def test_get_all_products_calls_make_paginated_request(mock_request):
     products.get_all_products()
     mock_request.make_paginated_request.assert_called_once_with(
-        request_method=shopify.Product.find
+        request_method=shopify.Product.find,
+        limit=None,
+        fields=None,
+        checkpoint_store=None,
     )
 
 
@@ -69,7 +72,7 @@ def test_get_all_products_returns_make_paginated_request_return_value(mock_reque
 def test_get_all_variants_calls_make_paginated_request(mock_request):
     products.get_all_variants()
     mock_request.make_paginated_request.assert_called_once_with(
-        request_method=shopify.Variant.find
+        request_method=shopify.Variant.find, limit=None, fields=None
     )
 
 
@@ -89,6 +92,7 @@ def test_set_stock_level_calls_make_request(
     )
     mock_request.make_request.assert_called_once_with(
         request_method=shopify.InventoryLevel.set,
+        retry_policy=mock_request.default_retry_policy,
         location_id=location_id,
         inventory_item_id=inventory_item_id,
         available=new_stock_level,
@@ -444,6 +448,38 @@ def test_create_product_creates_a_product_object(
     assert returned_value == mock_product
 
 
+@patch("shopify_api_py.request.call_limiter")
+@patch("shopify_api_py.products.shopify.Product")
+def test_create_product_is_paced_by_call_limiter(
+    mock_Product, mock_call_limiter, product_title, product_description, product_vendor
+):
+    shopify.ShopifyResource.site = "https://example.myshopify.com/admin/api/2024-01"
+    try:
+        products.create_product(
+            title=product_title, body_html=product_description, vendor=product_vendor
+        )
+    finally:
+        shopify.ShopifyResource.site = None
+    mock_call_limiter.acquire.assert_called_once_with(
+        "https://example.myshopify.com/admin/api/2024-01"
+    )
+    mock_Product.return_value.save.assert_called_once_with()
+
+
+@patch("shopify_api_py.products.request.make_request")
+@patch("shopify_api_py.products.shopify.Product")
+def test_create_product_retries_only_throttled_requests(
+    mock_Product, mock_make_request, product_title, product_description, product_vendor
+):
+    products.create_product(
+        title=product_title, body_html=product_description, vendor=product_vendor
+    )
+    mock_make_request.assert_called_once_with(
+        mock_Product.return_value.save,
+        retry_policy=products.request.throttle_retry_policy,
+    )
+
+
 @patch("shopify_api_py.products.shopify.Product")
 def test_create_product_creates_sets_title(
     mock_Product,
@@ -665,7 +701,7 @@ def test_get_inventory_item_by_id_raises_product_not_found_error(
 def test_get_all_custom_collections_calls_make_paginated_request(mock_request):
     products.get_all_custom_collections()
     mock_request.make_paginated_request.assert_called_once_with(
-        request_method=shopify.CustomCollection.find
+        request_method=shopify.CustomCollection.find, limit=None
     )
 
 
@@ -707,7 +743,7 @@ def test_get_custom_collection_by_id_raises_custom_collection_not_found_error(
 def test_get_all_smart_collections_calls_make_paginated_request(mock_request):
     products.get_all_smart_collections()
     mock_request.make_paginated_request.assert_called_once_with(
-        request_method=shopify.SmartCollection.find
+        request_method=shopify.SmartCollection.find, limit=None
     )
 
 
@@ -749,7 +785,7 @@ def test_get_smart_collection_by_id_raises_smart_collection_not_found_error(
 def test_get_all_collects_calls_make_paginated_request(mock_request):
     products.get_all_collects()
     mock_request.make_paginated_request.assert_called_once_with(
-        request_method=shopify.Collect.find
+        request_method=shopify.Collect.find, limit=None
     )
 
 
@@ -845,24 +881,43 @@ def test_add_product_to_collection_raises_ResponseError_incase_of_failed_respons
         )
 
 
+@patch("shopify_api_py.products.shopify.Collect")
+def test_add_product_to_collection_is_paced_like_deletes(
+    mock_Collect, mock_request, product_id, collection_id
+):
+    products.add_product_to_collection(
+        product_id=product_id, collection_id=collection_id
+    )
+    mock_request.make_request.assert_called_once_with(
+        mock_Collect.return_value.save,
+        retry_policy=mock_request.throttle_retry_policy,
+    )
+    products._delete_collect(1)
+    assert mock_request.make_request.call_args.args == (
+        mock_Collect.return_value.destroy,
+    )
+
+
 @patch("shopify_api_py.products.shopify.Collect")
 def test_remove_product_from_collection_finds_collects(
-    mock_Collect, product_id, collection_id
+    mock_Collect, mock_request, product_id, collection_id
 ):
-    mock_Collect.find.return_value = [Mock()]
+    mock_request.make_paginated_request.return_value = [Mock()]
     products.remove_product_from_collection(
         product_id=product_id, collection_id=collection_id
     )
-    mock_Collect.find.assert_called_once_with(
-        product_id=product_id, collection_id=collection_id
+    mock_request.make_paginated_request.assert_called_once_with(
+        request_method=mock_Collect.find,
+        product_id=product_id,
+        collection_id=collection_id,
     )
 
 
 @patch("shopify_api_py.products.shopify.Collect")
 def test_remove_product_from_collection_raises_if_no_collects_are_found(
-    mock_Collect, product_id, collection_id
+    mock_Collect, mock_request, product_id, collection_id
 ):
-    mock_Collect.find.return_value = []
+    mock_request.make_paginated_request.return_value = []
     with pytest.raises(exceptions.ResponseError):
         products.remove_product_from_collection(
             product_id=product_id, collection_id=collection_id
@@ -871,22 +926,24 @@ def test_remove_product_from_collection_raises_if_no_collects_are_found(
 
 @patch("shopify_api_py.products.shopify.Collect")
 def test_remove_product_from_collection_calls_destroy_on_collects(
-    mock_Collect, product_id, collection_id
+    mock_Collect, mock_request, product_id, collection_id
 ):
-    mock_Collect.find.return_value = [Mock(), Mock(), Mock()]
+    mock_request.make_paginated_request.return_value = [Mock(), Mock(), Mock()]
     products.remove_product_from_collection(
         product_id=product_id, collection_id=collection_id
     )
-    for value in mock_Collect.find.return_value:
+    for value in mock_request.make_paginated_request.return_value:
         value.destroy.assert_called_once_with()
 
 
 @patch("shopify_api_py.products.shopify.Collect")
 def test_remove_product_from_collection_raises_ResponseError_incase_of_exception_destroying_collect(
-    mock_Collect, product_id, collection_id
+    mock_Collect, mock_request, product_id, collection_id
 ):
-    mock_Collect.find.return_value = [Mock(), Mock(), Mock()]
-    mock_Collect.find.return_value[1].destroy.side_effect = Exception("Test exception")
+    mock_request.make_paginated_request.return_value = [Mock(), Mock(), Mock()]
+    mock_request.make_paginated_request.return_value[1].destroy.side_effect = Exception(
+        "Test exception"
+    )
     with pytest.raises(exceptions.ResponseError):
         products.remove_product_from_collection(
             product_id=product_id, collection_id=collection_id
@@ -896,7 +953,9 @@ def test_remove_product_from_collection_raises_ResponseError_incase_of_exception
 def test_get_products_in_custom_collection_finds_collects(mock_request, collection_id):
     products.get_products_in_custom_collection(collection_id=collection_id)
     mock_request.make_paginated_request.assert_called_once_with(
-        request_method=shopify.Collect.find, kwargs={"collection_id": collection_id}
+        request_method=shopify.Collect.find,
+        fields=["product_id"],
+        collection_id=collection_id,
     )
 
 
@@ -909,3 +968,330 @@ def test_get_products_in_custom_collection_returns_product_ids(
         collection_id=collection_id
     )
     assert returned_value == [mock.product_id for mock in mock_collects]
+
+
+def test_iter_all_products_calls_iter_paginated_request(mock_request):
+    products.iter_all_products()
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=shopify.Product.find,
+        limit=None,
+        fields=None,
+        checkpoint_store=None,
+    )
+
+
+def test_iter_all_products_returns_iter_paginated_request_return_value(mock_request):
+    return_value = Mock()
+    mock_request.iter_paginated_request.return_value = return_value
+    assert products.iter_all_products() is return_value
+
+
+def test_iter_all_variants_calls_iter_paginated_request(mock_request):
+    products.iter_all_variants()
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=shopify.Variant.find, limit=None, fields=None
+    )
+
+
+def test_iter_all_variants_returns_iter_paginated_request_return_value(mock_request):
+    return_value = Mock()
+    mock_request.iter_paginated_request.return_value = return_value
+    assert products.iter_all_variants() is return_value
+
+
+def test_iter_all_custom_collections_calls_iter_paginated_request(mock_request):
+    products.iter_all_custom_collections()
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=shopify.CustomCollection.find, limit=None
+    )
+
+
+def test_iter_all_custom_collections_returns_iter_paginated_request_return_value(
+    mock_request,
+):
+    return_value = Mock()
+    mock_request.iter_paginated_request.return_value = return_value
+    assert products.iter_all_custom_collections() is return_value
+
+
+def test_iter_all_smart_collections_calls_iter_paginated_request(mock_request):
+    products.iter_all_smart_collections()
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=shopify.SmartCollection.find, limit=None
+    )
+
+
+def test_iter_all_smart_collections_returns_iter_paginated_request_return_value(
+    mock_request,
+):
+    return_value = Mock()
+    mock_request.iter_paginated_request.return_value = return_value
+    assert products.iter_all_smart_collections() is return_value
+
+
+def test_iter_all_collects_calls_iter_paginated_request(mock_request):
+    products.iter_all_collects()
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=shopify.Collect.find, limit=None
+    )
+
+
+def test_iter_all_collects_returns_iter_paginated_request_return_value(mock_request):
+    return_value = Mock()
+    mock_request.iter_paginated_request.return_value = return_value
+    assert products.iter_all_collects() is return_value
+
+
+def test_get_all_products_passes_limit(mock_request):
+    products.get_all_products(limit=250)
+    mock_request.make_paginated_request.assert_called_once_with(
+        request_method=shopify.Product.find,
+        limit=250,
+        fields=None,
+        checkpoint_store=None,
+    )
+
+
+def test_get_all_variants_passes_limit(mock_request):
+    products.get_all_variants(limit=250)
+    mock_request.make_paginated_request.assert_called_once_with(
+        request_method=shopify.Variant.find, limit=250, fields=None
+    )
+
+
+def test_get_all_products_passes_fields(mock_request):
+    products.get_all_products(fields=["id", "variants"])
+    mock_request.make_paginated_request.assert_called_once_with(
+        request_method=shopify.Product.find,
+        limit=None,
+        fields=["id", "variants"],
+        checkpoint_store=None,
+    )
+
+
+def test_get_all_variants_passes_fields(mock_request):
+    products.get_all_variants(fields=["id", "sku"])
+    mock_request.make_paginated_request.assert_called_once_with(
+        request_method=shopify.Variant.find, limit=None, fields=["id", "sku"]
+    )
+
+
+@patch("shopify_api_py.products.shopify.Product")
+def test_get_product_by_id_requests_fields(mock_Product, product_id):
+    products.get_product_by_id(product_id, fields=["id", "title"])
+    mock_Product.find.assert_called_once_with(id_=product_id, fields="id,title")
+
+
+def test_get_all_products_with_partitions_calls_make_partitioned_request(
+    mock_request,
+):
+    return_value = Mock()
+    mock_request.make_partitioned_request.return_value = return_value
+    returned_value = products.get_all_products(limit=250, partitions=4)
+    mock_request.make_partitioned_request.assert_called_once_with(
+        shopify.Product, partitions=4, limit=250, fields=None, raw=False
+    )
+    assert returned_value is return_value
+
+
+def test_get_all_products_passes_checkpoint_store(mock_request):
+    checkpoint_store = Mock()
+    products.get_all_products(checkpoint_store=checkpoint_store)
+    mock_request.make_paginated_request.assert_called_once_with(
+        request_method=shopify.Product.find,
+        limit=None,
+        fields=None,
+        checkpoint_store=checkpoint_store,
+    )
+
+
+def test_get_all_products_raw_uses_raw_finder(mock_request):
+    products.get_all_products(raw=True)
+    mock_request.RawFinder.assert_called_once_with(shopify.Product)
+    mock_request.make_paginated_request.assert_called_once_with(
+        request_method=mock_request.RawFinder.return_value,
+        limit=None,
+        fields=None,
+        checkpoint_store=None,
+    )
+
+
+def test_iter_all_products_raw_uses_raw_finder(mock_request):
+    products.iter_all_products(raw=True)
+    mock_request.RawFinder.assert_called_once_with(shopify.Product)
+    mock_request.iter_paginated_request.assert_called_once_with(
+        request_method=mock_request.RawFinder.return_value,
+        limit=None,
+        fields=None,
+        checkpoint_store=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "function,resource_class",
+    [
+        (products.iter_all_variants, shopify.Variant),
+        (products.iter_all_custom_collections, shopify.CustomCollection),
+        (products.iter_all_smart_collections, shopify.SmartCollection),
+        (products.iter_all_collects, shopify.Collect),
+    ],
+)
+def test_iter_functions_raw_use_raw_finder(mock_request, function, resource_class):
+    function(raw=True)
+    mock_request.RawFinder.assert_called_once_with(resource_class)
+    assert (
+        mock_request.iter_paginated_request.call_args.kwargs["request_method"]
+        is mock_request.RawFinder.return_value
+    )
+
+
+def test_get_product_by_id_raw_uses_raw_finder(mock_request):
+    mock_request.fields_query.return_value = {}
+    returned_value = products.get_product_by_id(1, raw=True)
+    mock_request.RawFinder.assert_called_once_with(shopify.Product)
+    mock_request.make_coalesced_request.assert_called_once_with(
+        mock_request.RawFinder.return_value, id_=1
+    )
+    assert returned_value is mock_request.make_coalesced_request.return_value
+
+
+def test_get_variant_by_id_raw_raises_variant_not_found(mock_request):
+    mock_request.make_coalesced_request.side_effect = ResourceNotFound()
+    with pytest.raises(exceptions.VariantNotFoundError):
+        products.get_variant_by_id(1, raw=True)
+
+
+@patch("shopify_api_py.products.set_stock_level")
+def test_update_variant_stock_sets_level_matching_total_quantity(
+    mock_set_stock_level, location_id, inventory_item_id
+):
+    variant = Mock(inventory_item_id=inventory_item_id, inventory_quantity=5)
+    products.update_variant_stock(
+        variant=variant, location_id=location_id, new_stock_level=5
+    )
+    mock_set_stock_level.assert_called_once_with(
+        location_id=location_id, inventory_item_id=inventory_item_id, new_stock_level=5
+    )
+
+
+@pytest.fixture
+def mock_make_paginated_request():
+    with patch(
+        "shopify_api_py.products.request.make_paginated_request"
+    ) as mock_make_paginated_request:
+        mock_make_paginated_request.side_effect = lambda *args, **kwargs: [
+            {"id": int(id_)} for id_ in kwargs["ids"].split(",") if int(id_) < 1000
+        ]
+        yield mock_make_paginated_request
+
+
+def test_get_products_by_ids_requests_ids_in_chunks(mock_make_paginated_request):
+    ids = list(range(1, 301))
+    returned_value = products.get_products_by_ids(ids, raw=True)
+    assert returned_value == [{"id": id_} for id_ in ids]
+    chunks = [
+        call.kwargs["ids"].split(",")
+        for call in mock_make_paginated_request.call_args_list
+    ]
+    assert [len(chunk) for chunk in chunks] == [products.MAX_IDS_PER_REQUEST, 50]
+
+
+def test_get_products_by_ids_always_requests_id_field(mock_make_paginated_request):
+    products.get_products_by_ids([1], fields=["title"], raw=True)
+    call = mock_make_paginated_request.call_args
+    assert call.kwargs["fields"] == ["id", "title"]
+
+
+def test_get_products_by_ids_returns_resources_in_requested_order(
+    mock_make_paginated_request,
+):
+    mock_make_paginated_request.side_effect = None
+    mock_make_paginated_request.return_value = [Mock(id=2), Mock(id=1)]
+    returned_value = products.get_products_by_ids([1, 2])
+    assert [product.id for product in returned_value] == [1, 2]
+    assert mock_make_paginated_request.call_args.args[0] == shopify.Product.find
+
+
+def test_get_variants_by_ids_reports_all_missing_ids(mock_make_paginated_request):
+    with pytest.raises(exceptions.ResourcesNotFoundError) as e:
+        products.get_variants_by_ids([1, 1000, 2, 1001], raw=True)
+    assert e.value.resource_ids == [1000, 1001]
+    assert e.value.found == [{"id": 1}, {"id": 2}]
+    assert isinstance(e.value, exceptions.ResourceNotFoundError)
+
+
+def test_get_inventory_items_by_ids_uses_inventory_item_chunk_size(
+    mock_make_paginated_request,
+):
+    products.get_inventory_items_by_ids(range(1, 151), raw=True)
+    assert mock_make_paginated_request.call_count == 2
+    first_call = mock_make_paginated_request.call_args_list[0]
+    assert first_call.args[0].resource_class is shopify.InventoryItem
+    assert len(first_call.kwargs["ids"].split(",")) == (
+        products.MAX_INVENTORY_ITEM_IDS_PER_REQUEST
+    )
+
+
+@pytest.fixture
+def mock_collection_collects():
+    with patch(
+        "shopify_api_py.products.request.make_paginated_request"
+    ) as mock_make_paginated_request:
+        mock_make_paginated_request.return_value = [
+            {"id": 1, "product_id": 10},
+            {"id": 2, "product_id": 11},
+            {"id": 3, "product_id": 12},
+        ]
+        yield mock_make_paginated_request
+
+
+@patch("shopify_api_py.products._delete_collect")
+@patch("shopify_api_py.products.add_product_to_collection")
+def test_sync_collection_members_applies_differences(
+    mock_add_product_to_collection, mock_delete_collect, mock_collection_collects
+):
+    report = products.sync_collection_members(5, [10, 12, 13, 14])
+    assert mock_collection_collects.call_args.kwargs["collection_id"] == 5
+    assert sorted(
+        call.args for call in mock_add_product_to_collection.call_args_list
+    ) == [
+        (13, 5),
+        (14, 5),
+    ]
+    mock_delete_collect.assert_called_once_with(2)
+    assert report.ok
+    assert report.unchanged == 2
+    assert sorted(report.succeeded) == [
+        products.CollectionChange("add", 13),
+        products.CollectionChange("add", 14),
+        products.CollectionChange("remove", 11),
+    ]
+
+
+@patch("shopify_api_py.products._delete_collect")
+@patch("shopify_api_py.products.add_product_to_collection")
+def test_sync_collection_members_reports_failures(
+    mock_add_product_to_collection, mock_delete_collect, mock_collection_collects
+):
+    mock_add_product_to_collection.side_effect = exceptions.ResponseError("Error")
+    report = products.sync_collection_members(5, [10, 11, 12, 13])
+    assert report.failed == [(products.CollectionChange("add", 13), "Error")]
+    assert not report.ok
+    mock_delete_collect.assert_not_called()
+
+
+@patch("shopify_api_py.products.cache.invalidate")
+@patch("shopify_api_py.products._delete_collect")
+def test_sync_collection_members_invalidates_collection_after_removals(
+    mock_delete_collect, mock_invalidate, mock_collection_collects
+):
+    products.sync_collection_members(5, [10, 11])
+    mock_invalidate.assert_called_once_with(cache.CUSTOM_COLLECTIONS, 5)
+
+
+@patch("shopify_api_py.products.request.make_request")
+@patch("shopify_api_py.products.shopify.Collect")
+def test_delete_collect_ignores_missing_collect(mock_Collect, mock_make_request):
+    mock_make_request.side_effect = ResourceNotFound()
+    products._delete_collect(1)
+    mock_Collect.assert_called_once_with({"id": 1})
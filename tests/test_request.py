@@ -1,8 +1,14 @@
-from unittest.mock import MagicMock, Mock, call
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
+import shopify
+from pyactiveresource.connection import ClientError
 
-from shopify_api_py import exceptions, request
+from shopify_api_py import checkpoint, exceptions, request
 
 
 @pytest.fixture
@@ -146,3 +152,825 @@ def test_get_all_resources_stops_after_max_pages(
     mock_request_method.return_value = mock_multi_page_response_1
     with pytest.raises(exceptions.TooManyPageRequestsError):
         request.make_paginated_request(request_method=mock_request_method)
+
+
+def test_iter_paginated_request_returns_a_generator(mock_request_method):
+    returned_value = request.iter_paginated_request(request_method=mock_request_method)
+    assert isinstance(returned_value, types.GeneratorType)
+    mock_request_method.assert_not_called()
+
+
+def test_iter_paginated_request_yields_resources_multi_page(
+    mock_request_method,
+    mock_multi_page_resources_response,
+    mock_multi_page_response_1_resources,
+    mock_multi_page_response_2_resources,
+    mock_multi_page_response_3_resources,
+):
+    returned_value = list(
+        request.iter_paginated_request(request_method=mock_request_method)
+    )
+    assert (
+        returned_value
+        == mock_multi_page_response_1_resources
+        + mock_multi_page_response_2_resources
+        + mock_multi_page_response_3_resources
+    )
+
+
+def test_iter_paginated_request_fetches_pages_lazily(
+    mock_request_method,
+    mock_multi_page_resources_response,
+    mock_multi_page_response_1_resources,
+):
+    iterator = request.iter_paginated_request(request_method=mock_request_method)
+    for _ in mock_multi_page_response_1_resources:
+        next(iterator)
+    assert mock_request_method.call_count == 1
+    next(iterator)
+    assert mock_request_method.call_count == 2
+
+
+def test_iter_paginated_pages_yields_pages(
+    mock_request_method,
+    mock_multi_page_resources_response,
+    mock_multi_page_response_1,
+    mock_multi_page_response_2,
+    mock_multi_page_response_3,
+):
+    returned_value = list(request.iter_paginated_pages(mock_request_method))
+    assert returned_value == [
+        mock_multi_page_response_1,
+        mock_multi_page_response_2,
+        mock_multi_page_response_3,
+    ]
+
+
+def test_iter_paginated_request_stops_after_max_pages(
+    mock_request_method, mock_multi_page_response_1
+):
+    mock_request_method.return_value = mock_multi_page_response_1
+    with pytest.raises(exceptions.TooManyPageRequestsError):
+        for _ in request.iter_paginated_request(request_method=mock_request_method):
+            pass
+
+
+def test_make_paginated_request_passes_limit_to_first_request(
+    mock_request_method, mock_multi_page_resources_response
+):
+    request.make_paginated_request(request_method=mock_request_method, limit=250)
+    mock_request_method.assert_has_calls(
+        (
+            call(limit=250),
+            call(from_="resources/1"),
+            call(from_="resources/2"),
+        )
+    )
+
+
+def test_make_paginated_request_does_not_repeat_query_with_cursor(
+    mock_request_method, mock_multi_page_resources_response
+):
+    request.make_paginated_request(request_method=mock_request_method, product_id=5)
+    mock_request_method.assert_has_calls(
+        (
+            call(product_id=5),
+            call(from_="resources/1"),
+            call(from_="resources/2"),
+        )
+    )
+
+
+def test_make_paginated_request_stops_after_max_pages_argument(
+    mock_request_method, mock_multi_page_response_1
+):
+    mock_request_method.return_value = mock_multi_page_response_1
+    with pytest.raises(exceptions.TooManyPageRequestsError):
+        request.make_paginated_request(request_method=mock_request_method, max_pages=3)
+    assert mock_request_method.call_count == 4
+
+
+@pytest.mark.parametrize("limit", [0, 251, -1])
+def test_make_paginated_request_raises_for_invalid_limit(mock_request_method, limit):
+    with pytest.raises(exceptions.PageLimitOutOfRangeError):
+        request.make_paginated_request(request_method=mock_request_method, limit=limit)
+    mock_request_method.assert_not_called()
+
+
+@pytest.mark.parametrize("limit", [0, 251, -1])
+def test_make_paginated_request_raises_for_invalid_limit_with_max_pages(
+    mock_request_method, limit
+):
+    with pytest.raises(exceptions.PageLimitOutOfRangeError):
+        request.make_paginated_request(
+            request_method=mock_request_method, limit=limit, max_pages=3
+        )
+    mock_request_method.assert_not_called()
+
+
+def test_page_budget_uses_default_page_limit():
+    assert request.page_budget() == request.MAX_ITEMS / request.DEFAULT_PAGE_LIMIT
+
+
+def test_page_budget_is_sized_from_limit():
+    assert request.page_budget(250) == request.MAX_ITEMS / 250
+
+
+def test_make_paginated_request_passes_fields_to_first_request(
+    mock_request_method, mock_multi_page_resources_response
+):
+    request.make_paginated_request(
+        request_method=mock_request_method, fields=["id", "sku"]
+    )
+    mock_request_method.assert_has_calls(
+        (
+            call(fields="id,sku"),
+            call(from_="resources/1"),
+            call(from_="resources/2"),
+        )
+    )
+
+
+def test_fields_query():
+    assert request.fields_query(["id", "sku", "barcode"]) == {
+        "fields": "id,sku,barcode"
+    }
+
+
+def test_fields_query_without_fields():
+    assert request.fields_query(None) == {}
+
+
+@pytest.fixture
+def shop():
+    return "https://test-shop.myshopify.com/admin/api/2023-01"
+
+
+@pytest.fixture
+def mock_time():
+    with patch("shopify_api_py.request.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        yield mock_time
+
+
+@pytest.fixture
+def mock_shopify_resource(shop):
+    with patch("shopify_api_py.request.shopify.ShopifyResource") as mock_resource:
+        mock_resource.site = shop
+        mock_resource.connection.response.headers = {
+            "X-Shopify-Shop-Api-Call-Limit": "12/40"
+        }
+        yield mock_resource
+
+
+@pytest.fixture
+def mock_call_limiter():
+    with patch("shopify_api_py.request.call_limiter") as mock_call_limiter:
+        yield mock_call_limiter
+
+
+def test_call_limiter_does_not_wait_with_room_in_bucket(mock_time, shop):
+    limiter = request.CallLimiter()
+    for _ in range(30):
+        limiter.acquire(shop)
+    mock_time.sleep.assert_not_called()
+
+
+def test_call_limiter_waits_when_bucket_is_full(mock_time, shop):
+    limiter = request.CallLimiter(headroom=2)
+    limiter.update(shop, "38/40")
+    limiter.acquire(shop)
+    mock_time.sleep.assert_called_once_with(0.5)
+
+
+def test_call_limiter_bucket_leaks_over_time(mock_time, shop):
+    limiter = request.CallLimiter()
+    limiter.update(shop, "40/40")
+    mock_time.monotonic.return_value = 1005.0
+    assert limiter.level(shop) == 30
+
+
+def test_call_limiter_leak_rate_is_sized_from_capacity(mock_time, shop):
+    limiter = request.CallLimiter()
+    limiter.update(shop, "80/80")
+    mock_time.monotonic.return_value = 1005.0
+    assert limiter.level(shop) == 60
+
+
+def test_call_limiter_tracks_shops_separately(mock_time, shop):
+    limiter = request.CallLimiter()
+    limiter.update(shop, "40/40")
+    assert limiter.level("https://other-shop.myshopify.com") == 0
+
+
+def test_call_limiter_ignores_invalid_header(mock_time, shop):
+    limiter = request.CallLimiter()
+    limiter.update(shop, "invalid")
+    assert limiter.level(shop) == 0
+
+
+def test_call_limiter_throttled_fills_bucket(mock_time, shop):
+    limiter = request.CallLimiter()
+    limiter.throttled(shop)
+    assert limiter.level(shop) == request.CallLimiter.DEFAULT_CAPACITY
+
+
+def test_make_request_acquires_call_limiter(
+    mock_shopify_resource, mock_call_limiter, shop
+):
+    request.make_request(request_method=Mock())
+    mock_call_limiter.acquire.assert_called_once_with(shop)
+
+
+def test_make_request_updates_call_limiter_from_response(
+    mock_shopify_resource, mock_call_limiter, shop
+):
+    request.make_request(request_method=Mock())
+    mock_call_limiter.update.assert_called_once_with(shop, "12/40")
+
+
+def test_make_request_marks_call_limiter_throttled_on_429(
+    mock_shopify_resource, mock_call_limiter, shop
+):
+    error = ClientError(message="Too Many Requests")
+    error.code = 429
+    with pytest.raises(ClientError):
+        request.make_request(request_method=Mock(side_effect=error))
+    mock_call_limiter.throttled.assert_called_once_with(shop)
+
+
+def test_make_request_does_not_use_call_limiter_without_session(mock_call_limiter):
+    request.make_request(request_method=Mock())
+    mock_call_limiter.acquire.assert_not_called()
+
+
+def test_make_paginated_request_acquires_call_limiter_for_each_page(
+    mock_shopify_resource,
+    mock_call_limiter,
+    mock_request_method,
+    mock_multi_page_resources_response,
+):
+    request.make_paginated_request(request_method=mock_request_method)
+    assert mock_call_limiter.acquire.call_count == 3
+
+
+def make_error(error_class, code, headers=None):
+    error = error_class(message="Error")
+    error.code = code
+    error.response.headers = headers or {}
+    return error
+
+
+@pytest.fixture
+def mock_sleep():
+    with patch("shopify_api_py.request.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.mark.parametrize("code", [429, 502, 503, 504])
+def test_retry_policy_retries_transient_status_codes(code):
+    error = make_error(ClientError, code)
+    assert request.RetryPolicy().is_retryable(error) is True
+
+
+@pytest.mark.parametrize("code", [400, 404, 422])
+def test_retry_policy_does_not_retry_client_errors(code):
+    error = make_error(ClientError, code)
+    assert request.RetryPolicy().is_retryable(error) is False
+
+
+@pytest.mark.parametrize("error", [TimeoutError(), ConnectionResetError()])
+def test_retry_policy_retries_network_errors(error):
+    assert request.RetryPolicy().is_retryable(error) is True
+
+
+@pytest.mark.parametrize(
+    "error,retryable",
+    [
+        (make_error(ClientError, 429), True),
+        (make_error(ClientError, 503), False),
+        (make_error(ClientError, None), False),
+        (TimeoutError(), False),
+        (ConnectionResetError(), False),
+    ],
+)
+def test_throttle_retry_policy_retries_only_throttled_requests(error, retryable):
+    assert request.throttle_retry_policy.is_retryable(error) is retryable
+
+
+def test_retry_policy_does_not_retry_other_exceptions():
+    assert request.RetryPolicy().is_retryable(ValueError()) is False
+
+
+def test_retry_policy_honours_retry_after():
+    error = make_error(ClientError, 429, {"Retry-After": "2.0"})
+    assert request.RetryPolicy().get_delay(0, error) == 2.0
+
+
+def test_retry_policy_backoff_is_jittered_and_exponential():
+    policy = request.RetryPolicy(backoff_factor=1.0, max_backoff=60.0)
+    error = make_error(ClientError, 503)
+    with patch("shopify_api_py.request.random.uniform") as mock_uniform:
+        policy.get_delay(3, error)
+    mock_uniform.assert_called_once_with(0, 8.0)
+
+
+def test_retry_policy_backoff_is_capped():
+    policy = request.RetryPolicy(backoff_factor=1.0, max_backoff=10.0)
+    error = make_error(ClientError, 503)
+    for _ in range(20):
+        assert policy.get_delay(10, error) <= 10.0
+
+
+def test_make_request_does_not_retry_without_policy(mock_sleep):
+    request_method = Mock(side_effect=make_error(ClientError, 503))
+    with pytest.raises(ClientError):
+        request.make_request(request_method=request_method)
+    assert request_method.call_count == 1
+
+
+def test_make_request_retries_with_policy(mock_sleep):
+    return_value = Mock()
+    request_method = Mock(side_effect=[make_error(ClientError, 503), return_value])
+    returned_value = request.make_request(
+        request_method=request_method, retry_policy=request.RetryPolicy()
+    )
+    assert returned_value is return_value
+    assert request_method.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+def test_make_request_raises_after_max_retries(mock_sleep):
+    request_method = Mock(side_effect=make_error(ClientError, 503))
+    with pytest.raises(ClientError):
+        request.make_request(
+            request_method=request_method,
+            retry_policy=request.RetryPolicy(max_retries=3),
+        )
+    assert request_method.call_count == 4
+
+
+def test_make_request_does_not_retry_non_transient_errors(mock_sleep):
+    request_method = Mock(side_effect=make_error(ClientError, 404))
+    with pytest.raises(ClientError):
+        request.make_request(
+            request_method=request_method, retry_policy=request.RetryPolicy()
+        )
+    assert request_method.call_count == 1
+
+
+def test_make_paginated_request_resumes_from_failed_page(
+    mock_sleep,
+    mock_request_method,
+    mock_multi_page_response_1,
+    mock_multi_page_response_2,
+    mock_multi_page_response_3,
+    mock_multi_page_response_1_resources,
+    mock_multi_page_response_2_resources,
+    mock_multi_page_response_3_resources,
+):
+    mock_request_method.side_effect = [
+        mock_multi_page_response_1,
+        make_error(ClientError, 429, {"Retry-After": "1.0"}),
+        mock_multi_page_response_2,
+        mock_multi_page_response_3,
+    ]
+    returned_value = request.make_paginated_request(request_method=mock_request_method)
+    assert (
+        returned_value
+        == mock_multi_page_response_1_resources
+        + mock_multi_page_response_2_resources
+        + mock_multi_page_response_3_resources
+    )
+    mock_request_method.assert_has_calls(
+        (
+            call(),
+            call(from_="resources/1"),
+            call(from_="resources/1"),
+            call(from_="resources/2"),
+        )
+    )
+    mock_sleep.assert_called_once_with(1.0)
+
+
+def test_map_concurrently_returns_results_in_order():
+    returned_value = list(request.map_concurrently(lambda x: x * 2, range(20)))
+    assert returned_value == [x * 2 for x in range(20)]
+
+
+def test_map_concurrently_copies_session_headers_to_threads():
+    import shopify
+
+    shopify.ShopifyResource.headers["X-Shopify-Access-Token"] = "token"
+    try:
+        returned_value = list(
+            request.map_concurrently(
+                lambda _: shopify.ShopifyResource.headers.get("X-Shopify-Access-Token"),
+                range(4),
+            )
+        )
+    finally:
+        shopify.ShopifyResource.headers.pop("X-Shopify-Access-Token")
+    assert returned_value == ["token"] * 4
+
+
+def make_page(items):
+    page = MagicMock(next_page_url=None)
+    page.has_next_page.return_value = False
+    page.__iter__.return_value = items
+    page.__getitem__.side_effect = items.__getitem__
+    page.__len__.return_value = len(items)
+    page.__bool__.return_value = bool(items)
+    return page
+
+
+@pytest.fixture
+def mock_resource_class():
+    start = "2020-01-01T00:00:00+00:00"
+    resources = {
+        None: [Mock(id=1), Mock(id=2)],
+        "min": [Mock(id=2), Mock(id=3)],
+    }
+
+    def find(**kwargs):
+        if "since_id" in kwargs:
+            return make_page([Mock(created_at=start)])
+        if "created_at_min" in kwargs:
+            return make_page(resources["min"])
+        return make_page(resources[None])
+
+    resource_class = Mock()
+    resource_class.count.return_value = 300
+    resource_class.find.side_effect = find
+    return resource_class
+
+
+def test_make_partitioned_request_merges_windows_without_duplicates(
+    mock_resource_class,
+):
+    returned_value = request.make_partitioned_request(mock_resource_class, partitions=2)
+    assert [item.id for item in returned_value] == [1, 2, 3]
+
+
+def test_make_partitioned_request_requests_created_at_windows(mock_resource_class):
+    request.make_partitioned_request(mock_resource_class, partitions=2, limit=250)
+    window_calls = [
+        c.kwargs
+        for c in mock_resource_class.find.call_args_list
+        if "since_id" not in c.kwargs
+    ]
+    assert len(window_calls) == 2
+    assert "created_at_min" not in window_calls[0]
+    assert window_calls[0]["created_at_max"] == window_calls[1]["created_at_min"]
+    assert "created_at_max" not in window_calls[1]
+
+
+def test_make_partitioned_request_sizes_windows_from_count(mock_resource_class):
+    mock_resource_class.count.return_value = 100
+    request.make_partitioned_request(mock_resource_class, partitions=8, limit=250)
+    window_calls = [
+        c for c in mock_resource_class.find.call_args_list if "since_id" not in c.kwargs
+    ]
+    assert len(window_calls) == 1
+
+
+def test_make_partitioned_request_always_requests_id(mock_resource_class):
+    request.make_partitioned_request(
+        mock_resource_class, partitions=1, fields=["title"]
+    )
+    window_call = mock_resource_class.find.call_args_list[-1]
+    assert window_call.kwargs["fields"] == "id,title"
+
+
+def test_make_partitioned_request_returns_nothing_for_no_resources(
+    mock_resource_class,
+):
+    mock_resource_class.count.return_value = 0
+    assert request.make_partitioned_request(mock_resource_class) == []
+    mock_resource_class.find.assert_not_called()
+
+
+def test_make_partitioned_request_returns_nothing_if_oldest_is_missing(
+    mock_resource_class,
+):
+    mock_resource_class.find.side_effect = lambda **kwargs: make_page([])
+    assert request.make_partitioned_request(mock_resource_class) == []
+    mock_resource_class.find.assert_called_once()
+
+
+def test_make_partitioned_request_splits_caller_created_at_bounds(
+    mock_resource_class,
+):
+    request.make_partitioned_request(
+        mock_resource_class,
+        partitions=2,
+        limit=250,
+        created_at_min="2019-12-01T00:00:00+00:00",
+        created_at_max="2020-01-03T00:00:00+00:00",
+    )
+    mock_resource_class.count.assert_called_once_with(
+        created_at_min="2019-12-01T00:00:00+00:00",
+        created_at_max="2020-01-03T00:00:00+00:00",
+    )
+    window_calls = [
+        c.kwargs
+        for c in mock_resource_class.find.call_args_list
+        if "since_id" not in c.kwargs
+    ]
+    assert window_calls[0]["created_at_min"] == "2019-12-01T00:00:00+00:00"
+    assert window_calls[0]["created_at_max"] == "2020-01-02T00:00:00+00:00"
+    assert window_calls[1]["created_at_min"] == "2020-01-02T00:00:00+00:00"
+    assert window_calls[1]["created_at_max"] == "2020-01-03T00:00:00+00:00"
+
+
+class MockResource:
+    def __init__(self, attributes):
+        self.attributes = attributes
+
+    def to_dict(self):
+        return self.attributes
+
+    def __eq__(self, other):
+        return self.attributes == other.attributes
+
+
+def make_checkpoint_page(ids, next_page_url):
+    page = MagicMock(next_page_url=next_page_url)
+    page.has_next_page.return_value = next_page_url is not None
+    page.__iter__.side_effect = lambda: iter([MockResource({"id": i}) for i in ids])
+    return page
+
+
+@pytest.fixture
+def checkpoint_store(tmp_path):
+    return checkpoint.FileCheckpointStore(tmp_path)
+
+
+@pytest.fixture
+def checkpoint_pages():
+    return {
+        None: make_checkpoint_page([1, 2], "resources/1"),
+        "resources/1": make_checkpoint_page([3, 4], "resources/2"),
+        "resources/2": make_checkpoint_page([5], None),
+    }
+
+
+@pytest.fixture
+def checkpoint_request_method(checkpoint_pages):
+    failures = {"resources/2": ValueError()}
+
+    def find(cls, from_=None, **kwargs):
+        if from_ in failures:
+            raise failures.pop(from_)
+        return checkpoint_pages[from_]
+
+    return types.MethodType(find, MockResource)
+
+
+def test_make_paginated_request_resumes_from_checkpoint(
+    checkpoint_request_method, checkpoint_store
+):
+    with pytest.raises(ValueError):
+        request.make_paginated_request(
+            checkpoint_request_method, checkpoint_store=checkpoint_store, limit=2
+        )
+    returned_value = request.make_paginated_request(
+        checkpoint_request_method, checkpoint_store=checkpoint_store, limit=2
+    )
+    assert [item.attributes["id"] for item in returned_value] == [1, 2, 3, 4, 5]
+
+
+def test_resumed_request_does_not_refetch_saved_pages(
+    checkpoint_request_method, checkpoint_store, checkpoint_pages
+):
+    with pytest.raises(ValueError):
+        request.make_paginated_request(
+            checkpoint_request_method, checkpoint_store=checkpoint_store
+        )
+    checkpoint_pages[None] = checkpoint_pages["resources/1"] = None
+    returned_value = request.make_paginated_request(
+        checkpoint_request_method, checkpoint_store=checkpoint_store
+    )
+    assert len(returned_value) == 5
+
+
+def test_checkpoint_is_cleared_after_completed_request(
+    checkpoint_request_method, checkpoint_store
+):
+    with pytest.raises(ValueError):
+        request.make_paginated_request(
+            checkpoint_request_method, checkpoint_store=checkpoint_store
+        )
+    request.make_paginated_request(
+        checkpoint_request_method, checkpoint_store=checkpoint_store
+    )
+    key = request.checkpoint_key(checkpoint_request_method)
+    assert checkpoint_store.open(key).resumable is False
+    assert list(checkpoint_store.iter_items(key)) == []
+
+
+def test_checkpoint_is_keyed_by_query(checkpoint_request_method, checkpoint_store):
+    with pytest.raises(ValueError):
+        request.make_paginated_request(
+            checkpoint_request_method, checkpoint_store=checkpoint_store, limit=2
+        )
+    assert checkpoint_store.open(
+        request.checkpoint_key(checkpoint_request_method, limit=2)
+    ).resumable
+    assert not checkpoint_store.open(
+        request.checkpoint_key(checkpoint_request_method, limit=3)
+    ).resumable
+
+
+def test_page_is_saved_only_after_it_is_consumed(
+    checkpoint_request_method, checkpoint_store
+):
+    items = request.iter_paginated_request(
+        checkpoint_request_method, checkpoint_store=checkpoint_store
+    )
+    next(items)
+    next(items)
+    key = request.checkpoint_key(checkpoint_request_method)
+    assert checkpoint_store.open(key).pages == 0
+    next(items)
+    assert checkpoint_store.open(key).pages == 1
+
+
+@pytest.fixture
+def mock_raw_resource_class():
+    from pyactiveresource import formats
+    from pyactiveresource.connection import Response
+
+    resource_class = Mock(__name__="Product", format=formats.JSONFormat)
+    resource_class._split_options.side_effect = lambda options: [{}, options]
+    resource_class._collection_path.return_value = "/admin/products.json"
+    resource_class._element_path.return_value = "/admin/products/1.json"
+    resource_class.connection.get.return_value = Response(
+        200,
+        b'{"products": [{"id": 1, "variants": [{"id": 2}]}, {"id": 3}]}',
+        {"link": '<https://shop/products.json?page_info=b>; rel="next"'},
+    )
+    return resource_class
+
+
+def test_raw_finder_returns_decoded_json(mock_raw_resource_class):
+    page = request.RawFinder(mock_raw_resource_class)(limit=2)
+    assert page == [{"id": 1, "variants": [{"id": 2}]}, {"id": 3}]
+    mock_raw_resource_class._collection_path.assert_called_once_with({}, {"limit": 2})
+
+
+def test_raw_finder_parses_next_page_url(mock_raw_resource_class):
+    page = request.RawFinder(mock_raw_resource_class)()
+    assert page.has_next_page() is True
+    assert page.next_page_url == "https://shop/products.json?page_info=b"
+
+
+def test_raw_finder_requests_from_cursor_url(mock_raw_resource_class):
+    request.RawFinder(mock_raw_resource_class)(from_="https://shop/next")
+    mock_raw_resource_class.connection.get.assert_called_once_with(
+        "https://shop/next", mock_raw_resource_class.headers
+    )
+
+
+def test_raw_finder_returns_single_resource(mock_raw_resource_class):
+    from pyactiveresource.connection import Response
+
+    mock_raw_resource_class.connection.get.return_value = Response(
+        200, b'{"product": {"id": 1}}', {}
+    )
+    returned_value = request.RawFinder(mock_raw_resource_class)(id_=1)
+    assert returned_value == {"id": 1}
+    mock_raw_resource_class._element_path.assert_called_once_with(1, {}, {})
+
+
+def test_get_next_page_url_returns_none_without_next_link():
+    headers = {"Link": '<https://shop/products.json?page_info=a>; rel="previous"'}
+    assert request.get_next_page_url(headers) is None
+
+
+def test_get_next_page_url_with_previous_and_next_links():
+    headers = {
+        "Link": '<https://shop/p?page_info=a>; rel="previous", '
+        '<https://shop/p?page_info=b>; rel="next"'
+    }
+    assert request.get_next_page_url(headers) == "https://shop/p?page_info=b"
+
+
+def test_raw_paginated_request_checkpoints_and_replays_dicts(tmp_path):
+    pages = [
+        request.RawPage([{"id": 1}], next_page_url="page/2"),
+        ValueError(),
+        request.RawPage([{"id": 2}]),
+    ]
+    finder = Mock(spec=request.RawFinder, side_effect=pages)
+    finder.__name__ = "Product.find_raw"
+    store = checkpoint.FileCheckpointStore(tmp_path)
+    with pytest.raises(ValueError):
+        request.make_paginated_request(finder, checkpoint_store=store)
+    returned_value = request.make_paginated_request(finder, checkpoint_store=store)
+    assert returned_value == [{"id": 1}, {"id": 2}]
+
+
+def test_chunked_yields_lists_of_size():
+    assert list(request.chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_batch_report_records_outcomes():
+    report = request.BatchReport()
+    report.add_success("a")
+    other = request.BatchReport()
+    other.add_failure("b", "reason")
+    report.update(other)
+    assert report.succeeded == ["a"]
+    assert report.failed == [("b", "reason")]
+    assert report.ok is False
+
+
+def test_single_flight_shares_concurrent_calls():
+    single_flight = request.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        leader = executor.submit(single_flight.do, "key", func)
+        started.wait(5)
+        followers = [executor.submit(single_flight.do, "key", func) for _ in range(2)]
+        while single_flight.shared < 2:
+            time.sleep(0.001)
+        release.set()
+        results = [leader.result()] + [follower.result() for follower in followers]
+    assert results == ["result"] * 3
+    assert len(calls) == 1
+
+
+def test_single_flight_gives_each_caller_its_own_result():
+    single_flight = request.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def func():
+        started.set()
+        release.wait(5)
+        return {"id": 1}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, "key", func)
+        started.wait(5)
+        follower = executor.submit(single_flight.do, "key", func)
+        while single_flight.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        leader_result, follower_result = leader.result(), follower.result()
+    assert leader_result == follower_result
+    assert leader_result is not follower_result
+
+
+def test_single_flight_shares_exceptions():
+    single_flight = request.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def func():
+        started.set()
+        release.wait(5)
+        raise ValueError()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, "key", func)
+        started.wait(5)
+        follower = executor.submit(single_flight.do, "key", func)
+        while single_flight.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_single_flight_runs_later_calls_again():
+    single_flight = request.SingleFlight()
+    func = Mock(return_value=1)
+    single_flight.do("key", func)
+    single_flight.do("key", func)
+    assert func.call_count == 2
+
+
+def test_make_coalesced_request_makes_request():
+    request_method = Mock(return_value="response")
+    assert request.make_coalesced_request(request_method, id_=1) == "response"
+    request_method.assert_called_once_with(id_=1)
+
+
+def test_raw_finders_for_same_resource_are_equal():
+    assert request.RawFinder(shopify.Product) == request.RawFinder(shopify.Product)
+    assert hash(request.RawFinder(shopify.Product)) == hash(
+        request.RawFinder(shopify.Product)
+    )
+    assert request.RawFinder(shopify.Product) != request.RawFinder(shopify.Variant)
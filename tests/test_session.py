@@ -120,6 +120,21 @@ def test_shopify_session_context_manager_creates_session(
     )
 
 
+def test_create_session_returns_session(
+    mock_shopify, mock_shopify_session, set_shopify_session_config
+):
+    returned_value = session.ShopifyAPISession.create_session()
+    assert returned_value is mock_shopify_session
+    mock_shopify.ShopifyResource.activate_session.assert_not_called()
+
+
+def test_create_session_loads_credentials_from_file(
+    mock_shopify, mock_shopify_session, config_file, shop_url
+):
+    session.ShopifyAPISession.create_session()
+    assert session.ShopifyAPISession.SHOP_URL == shop_url
+
+
 def test_shopify_session_context_manager_activates_session(
     mock_shopify, mock_shopify_session, set_shopify_session_config
 ):
@@ -219,3 +234,29 @@ def test_shopify_api_session_decorator(
         token=api_password,
     )
     mock_shopify.ShopifyResource.clear_session.assert_called_once_with()
+
+
+@pytest.fixture
+def mock_transport():
+    with patch("shopify_api_py.session.transport") as mock:
+        yield mock
+
+
+def test_shopify_session_context_manager_installs_pooled_transport(
+    mock_shopify, mock_shopify_session, mock_transport, set_shopify_session_config
+):
+    with session.ShopifyAPISession(pool_size=4, timeout=5.0):
+        mock_transport.install.assert_called_once_with(pool_size=4, timeout=5.0)
+        mock_transport.uninstall.assert_not_called()
+    mock_transport.uninstall.assert_called_once_with()
+
+
+def test_shopify_session_uses_default_pool_settings(
+    mock_shopify, mock_shopify_session, mock_transport, set_shopify_session_config
+):
+    with session.ShopifyAPISession():
+        pass
+    mock_transport.install.assert_called_once_with(
+        pool_size=session.ShopifyAPISession.POOL_SIZE,
+        timeout=session.ShopifyAPISession.TIMEOUT,
+    )
@@ -0,0 +1,171 @@
+import datetime as dt
+from unittest.mock import patch
+
+import pytest
+import shopify
+
+from shopify_api_py import sync
+
+
+@pytest.fixture
+def store(tmp_path):
+    return sync.SyncStateStore(tmp_path / "sync.json")
+
+
+@pytest.fixture
+def responses():
+    return {"changed": [], "ids": []}
+
+
+@pytest.fixture
+def mock_iter_paginated_request(responses):
+    def iter_paginated_request(request_method, limit=None, fields=None, **kwargs):
+        if fields == ["id"]:
+            return iter([{"id": id_} for id_ in responses["ids"]])
+        return iter(responses["changed"])
+
+    with patch(
+        "shopify_api_py.sync.request.iter_paginated_request"
+    ) as mock_iter_paginated_request:
+        mock_iter_paginated_request.side_effect = iter_paginated_request
+        yield mock_iter_paginated_request
+
+
+def changed_call(mock):
+    return next(
+        call for call in mock.call_args_list if call.kwargs.get("fields") != ["id"]
+    )
+
+
+def test_updated_at_min_subtracts_overlap():
+    assert (
+        sync.updated_at_min("2024-01-01T10:05:00-05:00", dt.timedelta(minutes=5))
+        == "2024-01-01T10:00:00-05:00"
+    )
+
+
+def test_updated_at_min_is_none_without_high_water_mark():
+    assert sync.updated_at_min(None, sync.OVERLAP) is None
+
+
+def test_first_sync_requests_all_products(
+    store, responses, mock_iter_paginated_request
+):
+    responses["changed"] = [
+        {"id": 1, "updated_at": "2024-01-01T10:00:00-05:00"},
+        {"id": 2, "updated_at": "2024-01-02T10:00:00-05:00"},
+    ]
+    responses["ids"] = [1, 2]
+    result = sync.sync_products(store, detect_deletions=True)
+    call = changed_call(mock_iter_paginated_request)
+    assert call.args[0].resource_class is shopify.Product
+    assert "updated_at_min" not in call.kwargs
+    assert [product["id"] for product in result.upserts] == [1, 2]
+    assert result.deleted_ids == []
+    assert result.high_water_mark == "2024-01-02T10:00:00-05:00"
+
+
+def test_sync_requests_changes_since_high_water_mark_less_overlap(
+    store, mock_iter_paginated_request
+):
+    store.save(sync.PRODUCTS, sync.SyncState("2024-01-02T10:00:00-05:00"))
+    sync.sync_products(store, overlap=dt.timedelta(minutes=10))
+    call = changed_call(mock_iter_paginated_request)
+    assert call.kwargs["updated_at_min"] == "2024-01-02T09:50:00-05:00"
+
+
+def test_sync_keeps_high_water_mark_when_nothing_changed(
+    store, mock_iter_paginated_request
+):
+    store.save(sync.PRODUCTS, sync.SyncState("2024-01-02T10:00:00-05:00"))
+    result = sync.sync_products(store)
+    result.commit()
+    assert result.high_water_mark == "2024-01-02T10:00:00-05:00"
+    assert store.load(sync.PRODUCTS).high_water_mark == result.high_water_mark
+
+
+def test_sync_state_is_saved_only_on_commit(
+    store, responses, mock_iter_paginated_request
+):
+    store.save(sync.PRODUCTS, sync.SyncState("2024-01-02T10:00:00-05:00"))
+    responses["changed"] = [{"id": 1, "updated_at": "2024-01-03T10:00:00-05:00"}]
+    result = sync.sync_products(store)
+    assert store.load(sync.PRODUCTS).high_water_mark == "2024-01-02T10:00:00-05:00"
+    result.commit()
+    assert store.load(sync.PRODUCTS).high_water_mark == "2024-01-03T10:00:00-05:00"
+
+
+def test_sync_does_not_move_high_water_mark_back(
+    store, responses, mock_iter_paginated_request
+):
+    store.save(sync.PRODUCTS, sync.SyncState("2024-01-02T10:00:00-05:00"))
+    responses["changed"] = [{"id": 1, "updated_at": "2024-01-02T09:58:00-05:00"}]
+    assert sync.sync_products(store).high_water_mark == "2024-01-02T10:00:00-05:00"
+
+
+def test_sync_removes_duplicate_upserts(store, responses, mock_iter_paginated_request):
+    responses["changed"] = [
+        {"id": 1, "updated_at": "2024-01-01T10:00:00-05:00"},
+        {"id": 1, "updated_at": "2024-01-01T10:01:00-05:00"},
+    ]
+    result = sync.sync_products(store)
+    assert result.upserts == [{"id": 1, "updated_at": "2024-01-01T10:01:00-05:00"}]
+
+
+def test_sync_requests_id_and_updated_at_fields(store, mock_iter_paginated_request):
+    sync.sync_products(store, fields=["title"])
+    call = changed_call(mock_iter_paginated_request)
+    assert call.kwargs["fields"] == ["id", "updated_at", "title"]
+
+
+def test_sync_detects_deletions(store, responses, mock_iter_paginated_request):
+    store.save(sync.PRODUCTS, sync.SyncState("2024-01-02T10:00:00-05:00", [1, 2, 3]))
+    responses["ids"] = [1, 3, 4]
+    result = sync.sync_products(store, detect_deletions=True)
+    result.commit()
+    assert result.deleted_ids == [2]
+    assert store.load(sync.PRODUCTS).ids == {1, 3, 4}
+
+
+def test_sync_without_deletion_detection(store, mock_iter_paginated_request):
+    store.save(sync.PRODUCTS, sync.SyncState(None, [1, 2]))
+    result = sync.sync_products(store)
+    result.commit()
+    assert result.deleted_ids == []
+    assert mock_iter_paginated_request.call_count == 1
+    assert store.load(sync.PRODUCTS).ids == {1, 2}
+
+
+def test_sync_variants_returns_variants_of_changed_products(
+    store, responses, mock_iter_paginated_request
+):
+    responses["changed"] = [
+        {
+            "id": 1,
+            "updated_at": "2024-01-03T10:00:00-05:00",
+            "variants": [{"id": 11, "updated_at": "2024-01-01T10:00:00-05:00"}],
+        }
+    ]
+    result = sync.sync_variants(store, detect_deletions=True)
+    assert result.upserts == [{"id": 11, "updated_at": "2024-01-01T10:00:00-05:00"}]
+    assert result.high_water_mark == "2024-01-03T10:00:00-05:00"
+    id_call = mock_iter_paginated_request.call_args_list[-1]
+    assert id_call.args[0].resource_class is shopify.Variant
+
+
+def test_sync_orders_requests_any_status(store, mock_iter_paginated_request):
+    sync.sync_orders(store)
+    call = changed_call(mock_iter_paginated_request)
+    assert call.args[0].resource_class is shopify.Order
+    assert call.kwargs["status"] == "any"
+    assert mock_iter_paginated_request.call_count == 1
+
+
+def test_state_store_keeps_resources_separate(store):
+    store.save(sync.PRODUCTS, sync.SyncState("2024-01-01T10:00:00-05:00", [1]))
+    store.save(sync.ORDERS, sync.SyncState("2024-01-02T10:00:00-05:00"))
+    assert store.load(sync.PRODUCTS).ids == {1}
+    assert store.load(sync.ORDERS).ids is None
+    store.clear(sync.PRODUCTS)
+    assert store.load(sync.PRODUCTS).high_water_mark is None
+    assert store.load(sync.ORDERS).high_water_mark == "2024-01-02T10:00:00-05:00"
@@ -0,0 +1,169 @@
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from pyactiveresource import connection
+from shopify import base
+
+from shopify_api_py import transport
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        status = 404 if self.path.endswith("missing.json") else 200
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.server.posts += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.connections = set()
+    server.posts = 0
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def site(server):
+    host, port = server.server_address
+    return f"http://{host}:{port}/admin"
+
+
+@pytest.fixture
+def pool():
+    pool = transport.ConnectionPool(size=2, timeout=5)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(transport.PooledShopifyConnection, "pool", pool)
+        yield pool
+    pool.clear()
+
+
+@pytest.fixture
+def pooled_connection(site, pool):
+    return transport.PooledShopifyConnection(site)
+
+
+def test_requests_reuse_a_keep_alive_connection(server, pooled_connection):
+    for _ in range(3):
+        pooled_connection.get("/admin/products.json")
+    assert len(server.connections) == 1
+
+
+def test_response_is_returned(pooled_connection):
+    response = pooled_connection.get("/admin/products.json")
+    assert json.loads(response.body) == {"path": "/admin/products.json"}
+    assert pooled_connection.response.code == 200
+
+
+def test_connection_is_released_after_error_response(
+    server, site, pool, pooled_connection
+):
+    host = site.split("//")[1].split("/")[0]
+    with pytest.raises(connection.ResourceNotFound):
+        pooled_connection.get("/admin/missing.json")
+    assert pool.idle_count("http", host) == 1
+    pooled_connection.get("/admin/products.json")
+    assert len(server.connections) == 1
+
+
+def test_connections_are_shared_across_threads(server, site, pool):
+    def make_requests():
+        pooled_connection = transport.PooledShopifyConnection(site)
+        for _ in range(5):
+            pooled_connection.get("/admin/products.json")
+
+    threads = [threading.Thread(target=make_requests) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(server.connections) <= 2
+
+
+def test_stale_connection_is_replaced(server, site, pool, pooled_connection):
+    host = site.split("//")[1].split("/")[0]
+    pooled_connection.get("/admin/products.json")
+    stale, _ = pool.get("http", host)
+    stale.sock.shutdown(socket.SHUT_RDWR)
+    pool.release("http", host, stale)
+    assert pooled_connection.get("/admin/products.json")
+    assert len(server.connections) == 2
+
+
+def test_stale_connection_is_not_resent_for_post(server, site, pool, pooled_connection):
+    host = site.split("//")[1].split("/")[0]
+    pooled_connection.get("/admin/products.json")
+    stale, _ = pool.get("http", host)
+    stale.sock.shutdown(socket.SHUT_RDWR)
+    pool.release("http", host, stale)
+    with pytest.raises(connection.Error):
+        pooled_connection.post("/admin/products.json", data=b"{}")
+    assert server.posts == 0
+    assert len(server.connections) == 1
+
+
+def test_unreachable_host_raises_connection_error(pool):
+    pooled_connection = transport.PooledShopifyConnection("http://127.0.0.1:9/admin")
+    with pytest.raises(connection.Error) as exc_info:
+        pooled_connection.get("/admin/products.json")
+    assert exc_info.value.code is None
+
+
+def test_pool_closes_connections_beyond_size():
+    pool = transport.ConnectionPool(size=1)
+    first = pool.new_connection("https", "example.com")
+    second = pool.new_connection("https", "example.com")
+    pool.release("https", "example.com", first)
+    pool.release("https", "example.com", second)
+    assert pool.idle_count("https", "example.com") == 1
+    assert pool.get("https", "example.com") == (first, True)
+
+
+def test_install_replaces_shopify_connection_class(pool):
+    try:
+        transport.install(pool_size=3, timeout=7.0)
+        assert base.ShopifyConnection is transport.PooledShopifyConnection
+        assert pool.size == 3
+        assert pool.timeout == 7.0
+    finally:
+        transport.uninstall()
+    assert base.ShopifyConnection is not transport.PooledShopifyConnection
+
+
+def test_nested_install_is_kept_until_last_uninstall(pool):
+    try:
+        transport.install()
+        transport.install()
+        transport.uninstall()
+        assert base.ShopifyConnection is transport.PooledShopifyConnection
+    finally:
+        transport.uninstall()
+    assert base.ShopifyConnection is not transport.PooledShopifyConnection
+
+
+def test_uninstall_without_install_does_nothing():
+    transport.uninstall()
+    assert base.ShopifyConnection is not transport.PooledShopifyConnection